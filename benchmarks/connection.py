@@ -0,0 +1,54 @@
+"""
+Protocol handling without network: a capture (or generated MID 61 frames) is
+replayed through OpenProtocolConnection in socket-sized chunks.
+
+Run from the repository root:
+    python -m benchmarks.connection --frames 100000
+    python -m benchmarks.connection --capture controller.bin
+    python -m benchmarks.connection --spindle 3  # header filter drops all
+"""
+
+import argparse
+import time
+
+from openprotocol.application.connection import EventReceived, OpenProtocolConnection
+from openprotocol.application.tightening import LastTighteningResultData
+from tests.application.test_tightening import RAW_REV5
+
+
+def main(capture: str | None, frames: int, chunk: int, spindle: int | None):
+    if capture:
+        with open(capture, "rb") as f:
+            data = f.read()
+    else:
+        data = RAW_REV5 * frames
+
+    conn = OpenProtocolConnection()
+    conn.subscribed_mids.add(LastTighteningResultData.MID)
+    if spindle is not None:
+        conn.header_filters[LastTighteningResultData.MID] = lambda h: (
+            h.spindle_id == spindle
+        )
+
+    events = 0
+    start = time.perf_counter()
+    for pos in range(0, len(data), chunk):
+        for event in conn.receive_data(data[pos : pos + chunk]):
+            events += isinstance(event, EventReceived)
+        conn.data_to_send()
+    elapsed = time.perf_counter() - start
+
+    print(f"{len(data)} bytes, {events} events in {elapsed:.3f} s")
+    print(f"{events / elapsed:10.0f} events/s {len(data) / elapsed / 1e6:8.1f} MB/s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Sans-IO connection benchmark")
+    parser.add_argument("--capture", type=str, default=None, help="Raw capture file")
+    parser.add_argument("--frames", type=int, default=100000, help="Generated frames")
+    parser.add_argument("--chunk", type=int, default=65536, help="Bytes per read")
+    parser.add_argument("--spindle", type=int, default=None, help="Header filter")
+
+    args = parser.parse_args()
+
+    main(args.capture, args.frames, args.chunk, args.spindle)
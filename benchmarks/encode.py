@@ -0,0 +1,81 @@
+"""
+Encoding of outgoing frames: building each frame from a raw message against
+the MidCodec encode cache, for a constant MID and a parameterized one, and
+building frames as bytes against encoding them into a reused buffer.
+
+Run from the repository root:
+    python -m benchmarks.encode --frames 200000
+"""
+
+import argparse
+import time
+
+from openprotocol.application.communication import CommunicationStartMessage
+from openprotocol.application.parameter_set import SelectParameterSet
+from openprotocol.core.framing import FrameWriter
+from openprotocol.core.message import OpenProtocolRawMessage
+from openprotocol.core.mid_base import MidCodec
+
+
+def measure(name: str, calls: int, encode, frames_per_call: int = 1) -> None:
+    start = time.perf_counter()
+    for i in range(calls):
+        encode(i)
+    elapsed = time.perf_counter() - start
+    print(f"{name:32} {calls * frames_per_call / elapsed:12.0f} frames/s")
+
+
+def main(frames: int, psets: int):
+    measure(
+        "MID 1 uncached",
+        frames,
+        lambda i: CommunicationStartMessage().encode().encode(),
+    )
+    measure(
+        "MID 1 MidCodec.encode",
+        frames,
+        lambda i: MidCodec.encode(CommunicationStartMessage()),
+    )
+    measure(
+        "MID 18 uncached",
+        frames,
+        lambda i: SelectParameterSet(i % psets).encode().encode(),
+    )
+    measure(
+        "MID 18 MidCodec.encode",
+        frames,
+        lambda i: MidCodec.encode(SelectParameterSet(i % psets)),
+    )
+
+    # A flush of 10 result frames: frames joined against one reused buffer
+    payload = "0" * 400
+
+    def join(i: int) -> bytes:
+        return b"".join(
+            OpenProtocolRawMessage(61, 2, payload, spindle_id=3).encode()
+            for _ in range(10)
+        )
+
+    writer = FrameWriter()
+
+    def write_into(i: int) -> None:
+        buf = writer.take()
+        end = len(buf)
+        for _ in range(10):
+            end = OpenProtocolRawMessage(61, 2, payload, spindle_id=3).encode_into(
+                buf, end
+            )
+        writer.recycle(buf)
+
+    measure("10 x MID 61 joined", frames // 10, join, 10)
+    measure("10 x MID 61 FrameWriter buffer", frames // 10, write_into, 10)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Outgoing frame encoding benchmark")
+    parser.add_argument("--frames", type=int, default=200000, help="Frames per case")
+    parser.add_argument("--psets", type=int, default=16, help="Distinct psets used")
+
+    args = parser.parse_args()
+
+    main(args.frames, args.psets)
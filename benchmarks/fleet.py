@@ -0,0 +1,102 @@
+"""
+Event throughput and CPU of a ControllerFleet on one event loop for a growing
+number of simulated controllers. All controllers are connections to one
+simulated controller server in the same process, which pushes every event
+to all of them; CPU time therefore includes the server side.
+
+Run from the repository root:
+    python -m benchmarks.fleet --controllers 100 500 1000 --rounds 20
+"""
+
+import argparse
+import asyncio
+import resource
+import time
+
+from openprotocol.application.fleet import ControllerFleet, Endpoint
+from openprotocol.application.tightening import LastTighteningResultDataSubscribe
+from openprotocol.core.mid_base import register_messages
+from tests.application.test_tightening import TighteningDevice
+from tests.integration.controller import (
+    CommunicationPositiveAckController,
+    SimulatedController,
+)
+
+register_messages(LastTighteningResultDataSubscribe)
+
+
+async def run(port: int, controllers: int, rounds: int, max_parallel: int) -> None:
+    server = SimulatedController(port=port, verbose=False)
+    server.expect(
+        LastTighteningResultDataSubscribe.MID,
+        LastTighteningResultDataSubscribe.REVISION,
+        CommunicationPositiveAckController(
+            1, LastTighteningResultDataSubscribe.MID
+        ).encode(),
+    )
+    await server.start()
+
+    fleet = ControllerFleet(
+        [Endpoint("127.0.0.1", port, f"tool-{i}") for i in range(controllers)],
+        max_parallel=max_parallel,
+        stagger=0.0,
+        keepalive_resolution=0.5,
+    )
+    start = time.perf_counter()
+    connected = await fleet.start()
+    await fleet.subscribe(LastTighteningResultDataSubscribe)
+    startup = time.perf_counter() - start
+
+    expected = connected * rounds
+    received = 0
+
+    async def consume():
+        nonlocal received
+        while received < expected:
+            received += len(await fleet.get_many(10000, 0.05))
+
+    consumer = asyncio.create_task(consume())
+    event = TighteningDevice()
+    wall = time.perf_counter()
+    cpu = time.process_time()
+    for _ in range(rounds):
+        await server.push_event(event)
+    await asyncio.wait_for(consumer, timeout=60.0)
+    wall = time.perf_counter() - wall
+    cpu = time.process_time() - cpu
+
+    print(
+        f"controllers={connected:5} startup {startup:6.2f} s "
+        f"{received / wall:10.0f} events/s "
+        f"cpu {cpu / wall * 100:5.1f} % {cpu / received * 1e6:7.1f} us/event"
+    )
+
+    await fleet.stop()
+    await server.stop()
+
+
+async def main(port: int, controllers: list[int], rounds: int, max_parallel: int):
+    for count in controllers:
+        await run(port, count, rounds, max_parallel)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Controller fleet benchmark")
+    parser.add_argument("--port", type=int, default=9200, help="Controller TCP port")
+    parser.add_argument(
+        "--controllers", type=int, nargs="+", default=[100, 500, 1000], help="Sizes"
+    )
+    parser.add_argument("--rounds", type=int, default=20, help="Events per controller")
+    parser.add_argument(
+        "--parallel", type=int, default=64, help="Connections started at once"
+    )
+
+    args = parser.parse_args()
+
+    # Two sockets per controller, both ends live in this process
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    wanted = 2 * max(args.controllers) + 100
+    if soft < wanted:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (min(wanted, hard), hard))
+
+    asyncio.run(main(args.port, args.controllers, args.rounds, args.parallel))
@@ -0,0 +1,67 @@
+"""
+Memory per buffered MID 61 result, slotted layouts against the same values
+kept in a per-instance __dict__ (the layout used before slots).
+
+Run from the repository root:
+    python -m benchmarks.memory --count 100000
+"""
+
+import argparse
+import gc
+import tracemalloc
+from types import SimpleNamespace
+from typing import Callable
+
+from openprotocol.application.tightening import (
+    LastTighteningResultData,
+    LazyLastTighteningResultData,
+)
+from openprotocol.core.message import OpenProtocolRawMessage
+from tests.application.test_tightening import RAW_REV5
+
+
+def as_dict_layout(result: LastTighteningResultData) -> SimpleNamespace:
+    values = {
+        name: getattr(result, name) for name in LastTighteningResultData.__slots__
+    }
+    return SimpleNamespace(REVISION=result.REVISION, **values)
+
+
+def measure(count: int, build: Callable[[bytes], object]) -> float:
+    gc.collect()
+    tracemalloc.start()
+    # Frames are received while tracing, layouts keeping the frame pay for it
+    buffered = [
+        build(RAW_REV5[:-7] + str(i).zfill(6).encode() + b"\x00") for i in range(count)
+    ]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del buffered
+    return size / count
+
+
+def main(count: int):
+    def decode(frame: bytes) -> LastTighteningResultData:
+        return LastTighteningResultData.from_message(
+            OpenProtocolRawMessage.decode(frame)
+        )
+
+    cases = {
+        "result, __dict__ layout": lambda f: as_dict_layout(decode(f)),
+        "result, __slots__": decode,
+        "lazy result, untouched": lambda f: LazyLastTighteningResultData.from_message(
+            OpenProtocolRawMessage.decode(f)
+        ),
+        "raw message": OpenProtocolRawMessage.decode,
+    }
+    for name, build in cases.items():
+        print(f"{name:24} {measure(count, build):8.0f} bytes/result")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Buffered result memory benchmark")
+    parser.add_argument("--count", type=int, default=100000, help="Buffered results")
+
+    args = parser.parse_args()
+
+    main(args.count)
@@ -0,0 +1,42 @@
+"""
+Per-frame parse cost of MID 61 revision 2+ frames: parse_message with a
+FieldSpec list against the compiled ParsePlan, with raw slicing as a floor.
+
+Run from the repository root:
+    python -m benchmarks.parse_plan --number 20000
+"""
+
+import argparse
+import timeit
+
+from openprotocol.application.parser import parse_message
+from openprotocol.application.tightening import LastTighteningResultData
+from openprotocol.core.message import OpenProtocolRawMessage
+from tests.application.test_tightening import RAW_REV5
+
+
+def main(number: int):
+    msg = OpenProtocolRawMessage.decode(RAW_REV5)
+    plan = LastTighteningResultData.plan(msg.revision)
+    fields = list(plan.fields)
+    obj = LastTighteningResultData(msg.revision)
+    raw = msg.raw_str
+    slices = [slice(f.start, f.end) for f in fields]
+
+    cases = {
+        "parse_message": lambda: parse_message(msg, obj, list(fields)),
+        "ParsePlan.apply": lambda: plan.apply(msg, obj),
+        "raw slicing": lambda: [raw[s] for s in slices],
+    }
+    for name, case in cases.items():
+        elapsed = min(timeit.repeat(case, number=number, repeat=5))
+        print(f"{name:16} {elapsed / number * 1e6:8.2f} us/frame")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Parse plan benchmark")
+    parser.add_argument("--number", type=int, default=20000, help="Frames per run")
+
+    args = parser.parse_args()
+
+    main(args.number)
@@ -0,0 +1,77 @@
+"""
+Request/reply throughput against the simulated controller for different
+in-flight windows of OpenProtocolClient.
+
+Run from the repository root:
+    python -m benchmarks.pipelining --requests 2000 --delay 0.002
+"""
+
+import argparse
+import asyncio
+import time
+
+from openprotocol.application.client import OpenProtocolClient
+from openprotocol.application.parameter_set import SelectParameterSet
+from openprotocol.core.message import OpenProtocolRawMessage
+from openprotocol.core.mid_base import OpenProtocolMessage, register_messages
+from tests.integration.controller import (
+    SimulatedController,
+    CommunicationPositiveAckController,
+)
+
+
+class SelectParameterSetController(SelectParameterSet):
+    @classmethod
+    def from_message(cls, msg: OpenProtocolRawMessage) -> "OpenProtocolMessage":
+        return cls(int(msg[20:23]))
+
+
+register_messages(SelectParameterSetController)
+
+
+async def run(port: int, requests: int, window: int, delay: float) -> float:
+    controller = SimulatedController(port=port, response_delay=delay, verbose=False)
+    controller.expect(
+        SelectParameterSet.MID,
+        SelectParameterSet.REVISION,
+        CommunicationPositiveAckController(1, SelectParameterSet.MID).encode(),
+    )
+    await controller.start()
+
+    client = OpenProtocolClient.create("127.0.0.1", port, max_in_flight=window)
+    await client.connect()
+
+    async def worker(count: int):
+        for i in range(count):
+            response = await client.send_receive(SelectParameterSet(i % 1000))
+            assert response is not None
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker(requests // window) for _ in range(window)))
+    elapsed = time.perf_counter() - start
+
+    await client.disconnect()
+    await controller.stop()
+    return (requests // window) * window / elapsed
+
+
+async def main(port: int, requests: int, windows: list[int], delay: float):
+    for window in windows:
+        rate = await run(port, requests, window, delay)
+        print(f"window={window:3} {rate:10.0f} req/s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Pipelining benchmark")
+    parser.add_argument("--port", type=int, default=9100, help="Controller TCP port")
+    parser.add_argument("--requests", type=int, default=2000, help="Requests per run")
+    parser.add_argument(
+        "--windows", type=int, nargs="+", default=[1, 2, 4, 8, 16], help="Windows"
+    )
+    parser.add_argument(
+        "--delay", type=float, default=0.002, help="Controller reply delay [s]"
+    )
+
+    args = parser.parse_args()
+
+    asyncio.run(main(args.port, args.requests, args.windows, args.delay))
@@ -4,13 +4,35 @@ from openprotocol.application.base_messages import (
 )
 from openprotocol.application.communication import (
     CommunicationStartAcknowledge,
+    KeepAliveMessage,
+)
+from openprotocol.application.multi_spindle import (
+    MultiSpindleResult,
+    MultiSpindleResultACK,
+)
+from openprotocol.application.tightening import (
+    LastTighteningResultData,
+    LastTighteningResultDataACK,
+)
+from openprotocol.application.trace import (
+    TraceCurveData,
+    TraceCurveDataACK,
+    TracePlotParameters,
+    TracePlotParametersACK,
 )
-from openprotocol.application.tightening import LastTighteningResultData
 from openprotocol.core.mid_base import register_messages
 
 register_messages(
     CommunicationStartAcknowledge,
     CommunicationNegativeAck,
     CommunicationPositiveAck,
+    KeepAliveMessage,
     LastTighteningResultData,
+    LastTighteningResultDataACK,
+    MultiSpindleResult,
+    MultiSpindleResultACK,
+    TraceCurveData,
+    TraceCurveDataACK,
+    TracePlotParameters,
+    TracePlotParametersACK,
 )
@@ -1,10 +1,13 @@
 from abc import ABC
+from typing import Collection
 
 from openprotocol.core.message import OpenProtocolRawMessage
 from openprotocol.core.mid_base import OpenProtocolMessage, MessageType
 
 
 class OpenProtocolReqReplyMsg(OpenProtocolMessage, ABC):
+    __slots__ = ()
+
     MESSAGE_TYPE = MessageType.REQ_REPLY_MESSAGE
     # no answer
 
@@ -13,6 +16,8 @@ class OpenProtocolReqReplyMsg(OpenProtocolMessage, ABC):
 
 
 class CommunicationNegativeAck(OpenProtocolReqReplyMsg):
+    __slots__ = ("_mid", "_err_code")
+
     MID = 4
 
     def __init__(self, revision, mid, err_code):
@@ -29,8 +34,18 @@ class CommunicationNegativeAck(OpenProtocolReqReplyMsg):
             err_code = int(msg[24:27])
         return cls(msg.revision, mid, err_code)
 
+    @property
+    def acknowledged_mid(self) -> int:
+        return self._mid
+
+    @property
+    def error_code(self) -> int:
+        return self._err_code
+
 
 class CommunicationPositiveAck(OpenProtocolReqReplyMsg):
+    __slots__ = ("_mid",)
+
     MID = 5
 
     def __init__(self, revision, mid):
@@ -42,8 +57,14 @@ class CommunicationPositiveAck(OpenProtocolReqReplyMsg):
         mid = int(msg[20:24])
         return cls(msg.revision, mid)
 
+    @property
+    def acknowledged_mid(self) -> int:
+        return self._mid
+
 
 class OpenProtocolReqMsg(OpenProtocolMessage, ABC):
+    __slots__ = ()
+
     MESSAGE_TYPE = MessageType.REQ_MESSAGE
     # NACK or some data
     expected_response_mids = {
@@ -56,6 +77,8 @@ class OpenProtocolReqMsg(OpenProtocolMessage, ABC):
 
 
 class OpenProtocolEventSubscribe(OpenProtocolMessage, ABC):
+    __slots__ = ()
+
     MESSAGE_TYPE = MessageType.EVENT_SUBSCRIBE
     expected_response_mids = {
         CommunicationNegativeAck.MID,
@@ -77,6 +100,8 @@ class OpenProtocolEventSubscribe(OpenProtocolMessage, ABC):
 
 
 class OpenProtocolEventUnsubscribe(OpenProtocolMessage, ABC):
+    __slots__ = ()
+
     MESSAGE_TYPE = MessageType.EVENT_UNSUBSCRIBE
     expected_response_mids = {
         CommunicationNegativeAck.MID,
@@ -95,7 +120,15 @@ class OpenProtocolEventUnsubscribe(OpenProtocolMessage, ABC):
 
 
 class OpenProtocolEventACK(OpenProtocolMessage, ABC):
+    __slots__ = ()
+
     MESSAGE_TYPE = MessageType.EVENT_ACK
+    # Mid of event acknowledged, registering the class maps the event to it
+    MID_EVENT: int | None = None
+    REVISION = 1
+
+    def __init__(self, revision: int | None = None):
+        super().__init__(revision or self.REVISION)
 
     @classmethod
     def from_message(cls, msg: OpenProtocolRawMessage) -> "OpenProtocolMessage":
@@ -103,11 +136,22 @@ class OpenProtocolEventACK(OpenProtocolMessage, ABC):
 
 
 class OpenProtocolEvent(OpenProtocolMessage, ABC):
+    __slots__ = ()
+
     MESSAGE_TYPE = MessageType.EVENT
     # ack message or nothing depends on the ack flag
 
+    def spindle_ids(self) -> Collection[int] | None:
+        """
+        Spindles of an event reporting on several of them in one frame, None
+        if the spindle of the header applies.
+        """
+        return None
+
 
 class OpenProtocolCommandMsg(OpenProtocolMessage, ABC):
+    __slots__ = ()
+
     MESSAGE_TYPE = MessageType.OP_COMMAND
     # Response only ACK or NACK
     expected_response_mids = {
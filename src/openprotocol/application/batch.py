@@ -0,0 +1,150 @@
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable, Mapping
+
+from openprotocol.application.parser import (
+    FieldSpec,
+    GroupTable,
+    ParsePlan,
+    RepeatedGroup,
+    parse_field,
+)
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None  # type: ignore[assignment]
+
+
+def require_numpy() -> Any:
+    if np is None:
+        raise ImportError(
+            "numpy is required for batch decoding, "
+            "install openprotocol-atlascopco[numpy]"
+        )
+    return np
+
+
+@dataclass(frozen=True)
+class ColumnBatch:
+    """
+    Columnar view of many frames of one MID and revision.
+
+    Numeric fields are NumPy arrays. Other named fields are dictionary-encoded:
+    `columns[name]` holds codes into `categories[name]`, which contains the
+    values as the per-message parser would return them.
+    """
+
+    mid: int
+    revision: int
+    columns: dict[str, Any] = field(default_factory=dict)
+    categories: dict[str, list[Any]] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return len(next(iter(self.columns.values()), ()))
+
+    def __getitem__(self, name: str) -> Any:
+        return self.columns[name]
+
+    def values(self, name: str) -> Any:
+        """Column with categorical codes replaced by their values."""
+        if name not in self.categories:
+            return self.columns[name]
+        lookup = np.empty(len(self.categories[name]), dtype=object)
+        lookup[:] = self.categories[name]
+        return lookup[self.columns[name]]
+
+
+def _text_column(rows: Any, spec: FieldSpec) -> Any:
+    width = spec.end - spec.start
+    return np.ascontiguousarray(rows[:, spec.start : spec.end]).view(f"S{width}")[:, 0]
+
+
+def _numeric_column(rows: Any, spec: FieldSpec, scale: float) -> Any:
+    digits = rows[:, spec.start : spec.end].astype(np.int64) - ord("0")
+    weights = 10 ** np.arange(spec.end - spec.start - 1, -1, -1, dtype=np.int64)
+    values = digits @ weights
+
+    # Rows which are not plain digits (blanks, signs, ...) go through the
+    # field parser, once per distinct value
+    irregular = ((digits < 0) | (digits > 9)).any(axis=1)
+    if irregular.any():
+        text = _text_column(rows[irregular], spec)
+        uniq, codes = np.unique(text, return_inverse=True)
+        parsed = np.array([parse_field(spec, u.decode("ascii").strip()) for u in uniq])
+        values = values / scale if scale != 1 else values
+        values = values.astype(parsed.dtype, copy=False)
+        values[irregular] = parsed[codes]
+        return values
+    return values / scale if scale != 1 else values
+
+
+def decode_batch(
+    frames: Iterable[bytes | bytearray | memoryview],
+    mid: int,
+    plan_for: Callable[[int], ParsePlan],
+    numeric: Mapping[str, float],
+) -> ColumnBatch:
+    """
+    Decode many equally long frames of one MID and revision in one pass.
+
+    :param plan_for: returns the parse plan for a revision
+    :param numeric: names of digit-only fields converted in vectorized form,
+            mapped to the divisor applied to the integer value (1 keeps ints)
+    """
+    require_numpy()
+
+    frames = [bytes(f) for f in frames]
+    if not frames:
+        raise ValueError("No frames to decode")
+    length = len(frames[0])
+    if any(len(f) != length for f in frames):
+        raise ValueError("All frames of a batch must have the same length")
+
+    rows = np.frombuffer(b"".join(frames), dtype=np.uint8).reshape(len(frames), length)
+    # MID and revision digits must be the same for all frames
+    if not (rows[:, 4:11] == rows[0, 4:11]).all():
+        raise ValueError("All frames of a batch must have the same MID and revision")
+    if int(frames[0][4:8]) != mid:
+        raise ValueError(f"Frames are not MID {mid}: {int(frames[0][4:8])}")
+    revision = int(frames[0][8:11])
+
+    plan = plan_for(revision)
+    batch = ColumnBatch(mid, revision)
+    for spec in plan.fields[: plan.usable_fields(length)]:
+        if spec.name in numeric:
+            batch.columns[spec.name] = _numeric_column(rows, spec, numeric[spec.name])
+            continue
+
+        uniq, codes = np.unique(_text_column(rows, spec), return_inverse=True)
+        values = [parse_field(spec, u.decode("ascii").strip()) for u in uniq]
+        if spec.name:
+            batch.columns[spec.name] = codes.astype(np.int32)
+            batch.categories[spec.name] = values
+    return batch
+
+
+def decode_group(
+    frame: bytes | bytearray | memoryview, group: RepeatedGroup, count: int
+) -> GroupTable:
+    """
+    Decode `count` entries of a repeated group in one pass: the block is
+    viewed as a (count, width) byte matrix, numeric fields become NumPy
+    arrays, others tuples of parsed values.
+    """
+    require_numpy()
+    group.check(len(frame), count)
+    rows = np.frombuffer(
+        frame, dtype=np.uint8, count=count * group.width, offset=group.start
+    ).reshape(count, group.width)
+
+    columns: dict[str, Any] = {}
+    for spec in group.fields:
+        if not spec.name:
+            continue
+        if spec.name in group.numeric:
+            columns[spec.name] = _numeric_column(rows, spec, group.numeric[spec.name])
+            continue
+        uniq, codes = np.unique(_text_column(rows, spec), return_inverse=True)
+        values = [parse_field(spec, u.decode("ascii").strip()) for u in uniq]
+        columns[spec.name] = tuple(values[code] for code in codes)
+    return GroupTable(columns, count)
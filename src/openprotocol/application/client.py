@@ -1,9 +1,10 @@
 import asyncio
 import logging
-from typing import Optional, Type, Set
+from typing import Callable, Optional, Type, Set
 
 from openprotocol.application.base_messages import (
     CommunicationPositiveAck,
+    OpenProtocolEvent,
     OpenProtocolEventSubscribe,
     OpenProtocolEventUnsubscribe,
 )
@@ -11,60 +12,239 @@ from openprotocol.application.communication import (
     CommunicationStartMessage,
     CommunicationStopMessage,
     CommunicationStartAcknowledge,
+    KeepAliveMessage,
 )
-from openprotocol.transport import AsyncTcpClient
-from openprotocol.core.mid_base import MidCodec, MessageType, OpenProtocolMessage
+from openprotocol.application.event_queue import EventQueue, EventStream
+from openprotocol.application.keepalive import KeepaliveScheduler
+from openprotocol.application.link import LinkLayer
+from openprotocol.application.reconnect import ReconnectPolicy
+from openprotocol.application.connection import (
+    AckMode,
+    ConnectionEvent,
+    EventReceived,
+    InvalidFrame,
+    OpenProtocolConnection,
+    ReplyReceived,
+    UnexpectedMessage,
+)
+from openprotocol.transport import AsyncTcpClient, BaseTransport, BufferedTcpClient
+from openprotocol.core.message import FrameHeader
+from openprotocol.core.mid_base import MessageType, OpenProtocolMessage
 
 logger = logging.getLogger(__name__)
 
 
 class OpenProtocolClient:
-    def __init__(self, transport: AsyncTcpClient, keepalive_interval: float = 15.0):
-        self._transport: AsyncTcpClient = transport
+    """
+    Asyncio driver of OpenProtocolConnection: moves bytes between the transport
+    and the sans-IO connection and turns its events into futures and queues.
+
+    Frames are not written where they are produced. Requests, ACKs and other
+    frames queued during one loop iteration are encoded into one buffer and
+    written together by a single flush task.
+
+    With a reconnect policy a lost connection is re-established in the
+    background: the startup sequence is rerun, subscriptions are replayed and
+    the subscription queue stays open. Requests fail while it is down.
+
+    Events go to the subscription queue unless an event stream (see events())
+    takes them, so each consumer waits only for its own MID, station and
+    spindle. With AckMode.DEFERRED events are ACKed only once confirm() is
+    called for them, e.g. after they are stored.
+
+    Keepalives (MID 9999) of all clients of an event loop are timed by one
+    shared KeepaliveScheduler. A keepalive is only sent after the link was
+    idle in either direction for `keepalive_interval`, by default well ahead
+    of the 15 s after which the controller drops an idle link. Keepalives due
+    within the scheduler's resolution go out early, in the same wakeup. Like
+    other requests they wait for a free slot of `max_in_flight`; one left
+    unanswered for `keepalive_timeout` marks the link dead and the connection
+    is dropped.
+
+    With `link_window` all frames are link level acknowledged (MID 9997/9998)
+    and retransmitted on loss, see LinkLayer.
+    """
+
+    def __init__(
+        self,
+        transport: BaseTransport,
+        keepalive_interval: float = 10.0,
+        max_in_flight: int = 1,
+        reconnect: ReconnectPolicy | None = None,
+        event_queue: EventQueue | None = None,
+        ack_mode: AckMode = AckMode.COALESCED,
+        link_window: int = 0,
+        keepalive_timeout: float | None = None,
+        keepalive_scheduler: KeepaliveScheduler | None = None,
+    ):
+        """
+        :param keepalive_interval: idle time in seconds before a keepalive is
+                sent, 0 disables keepalives and with them the only deadline
+                check of the link: a peer which stops, even within a frame,
+                is then noticed only once TCP reports the connection lost
+        :param keepalive_timeout: seconds a keepalive may wait for its answer
+                before the link counts as dead, `keepalive_interval` by default
+        :param keepalive_scheduler: scheduler of the keepalives and link
+                polls, the one shared by the running event loop by default
+        :param max_in_flight: number of requests which can wait for a reply at
+                the same time, 1 keeps the strict request/reply order of the spec
+        :param reconnect: backoff of automatic reconnects, None disables them
+        :param event_queue: queue of subscribed events with its bound and
+                overflow policy, unbounded by default
+        :param ack_mode: when events are ACKed, IMMEDIATE waits for the ACK to
+                be written before the next frame is read
+        :param link_window: frames which may wait for their link level ACK at
+                the same time, 1 is the stop-and-wait of the spec and 0
+                disables link level acknowledgement
+        """
+        if max_in_flight < 1:
+            raise ValueError(f"max_in_flight must be at least 1: {max_in_flight}")
+        self._transport: BaseTransport = transport
         self._keepalive_interval: float = keepalive_interval
+        self._keepalive_timeout: float = (
+            keepalive_timeout if keepalive_timeout is not None else keepalive_interval
+        )
         self._startup_done: bool = False
         self._running: bool = False
         self._lock: asyncio.Lock = asyncio.Lock()
 
         # Background tasks
-        self._keepalive_task: Optional[asyncio.Task] = None
         self._listener_task: Optional[asyncio.Task] = None
+        self._flush_task: Optional[asyncio.Task] = None
+        self._reconnect_task: Optional[asyncio.Task] = None
+        self._keepalive_task: Optional[asyncio.Task] = None
 
-        # Subscriptions
-        self._subscribed_mids: Set[int] = set()
-        self._subscription_queue: asyncio.Queue[OpenProtocolMessage | None] = (
-            asyncio.Queue()
-        )
+        # Protocol state (handshake, reply matching, subscriptions)
+        self._ack_mode: AckMode = ack_mode
+        self._link_window: int = link_window
+        self._connection: OpenProtocolConnection = self._new_connection()
+
+        # Subscriptions, kept with their header filter to replay them
+        self._subscriptions: dict[
+            int,
+            tuple[
+                Type[OpenProtocolEventSubscribe],
+                Callable[[FrameHeader], bool] | None,
+            ],
+        ] = {}
+        self._subscription_queue: EventQueue = event_queue or EventQueue()
+        # Event streams by event MID
+        self._streams: dict[int, list[EventStream]] = {}
 
         # Pending request-response
-        self._pending_future: Optional[asyncio.Future] = None
-        self._pending_expected: Set[int] = set()
+        self._in_flight: asyncio.Semaphore = asyncio.Semaphore(max_in_flight)
+
+        # Keepalive, times are loop times
+        self._keepalive_scheduler = keepalive_scheduler
+        self._keepalive: KeepaliveScheduler | None = None
+        self._keepalive_sent: float | None = None
+        self._last_sent: float = 0.0
+        self._last_received: float = 0.0
+        self._link_dead: bool = False
+        self.keepalive_rtt: float | None = None
+        self.dead_links: int = 0
+
+        # Reconnect
+        self._reconnect_policy: ReconnectPolicy | None = reconnect
+        self._closing: bool = False
+        self._queues_closed: bool = False
+        self.reconnects: int = 0
+        self.last_reconnect_latency: float | None = None
 
     @classmethod
     def create(
-        cls, host: str, port: int, keepalive_interval: float = 15.0
+        cls,
+        host: str,
+        port: int,
+        keepalive_interval: float = 10.0,
+        max_in_flight: int = 1,
+        transport_cls: Type[AsyncTcpClient | BufferedTcpClient] = AsyncTcpClient,
+        reconnect: ReconnectPolicy | None = None,
+        event_queue: EventQueue | None = None,
+        ack_mode: AckMode = AckMode.COALESCED,
+        link_window: int = 0,
+        keepalive_timeout: float | None = None,
+        keepalive_scheduler: KeepaliveScheduler | None = None,
     ) -> "OpenProtocolClient":
-        transport = AsyncTcpClient(host, port)
-        return cls(transport, keepalive_interval)
+        """
+        :param transport_cls: AsyncTcpClient (asyncio streams) or BufferedTcpClient
+                (asyncio.BufferedProtocol, less overhead per frame)
+        """
+        transport = transport_cls(host, port)
+        return cls(
+            transport,
+            keepalive_interval,
+            max_in_flight,
+            reconnect,
+            event_queue,
+            ack_mode,
+            link_window,
+            keepalive_timeout,
+            keepalive_scheduler,
+        )
+
+    @property
+    def dropped_events(self) -> int:
+        """Events dropped by the overflow policy of the event queue."""
+        return self._subscription_queue.dropped
+
+    @property
+    def spilled_events(self) -> int:
+        """Events written to disk by the overflow policy of the event queue."""
+        return self._subscription_queue.spilled
+
+    @property
+    def connected(self) -> bool:
+        """Connection up and its startup sequence done."""
+        return self._running and self._startup_done
+
+    @property
+    def _subscribed_mids(self) -> Set[int]:
+        return self._connection.subscribed_mids
 
     async def connect(self) -> None:
         """Connect to server, run startup sequence, and start background loops."""
+        self._closing = False
+        self._queues_closed = False
+        try:
+            await self._start()
+        except (ConnectionError, OSError):
+            # Nothing is left running or open after a failed connect
+            await self._stop_tasks()
+            await self._close_transport()
+            raise
+
+    async def _start(self) -> None:
+        """Connect the transport and run the startup on a fresh connection."""
+        self._connection = self._new_connection()
         await self._transport.connect()
         self._running = True
-        comm_start_mid = CommunicationStartMessage()
         self._listener_task = asyncio.create_task(self._listener_loop())
-        comm = await self.send_receive(comm_start_mid)
+        self._start_link_polls()
+        comm = await self._request(
+            self._connection.start, CommunicationStartMessage.MID, timeout=5.0
+        )
         if not isinstance(comm, CommunicationStartAcknowledge):
             self._listener_task.cancel()
             raise ConnectionError("Communication not acknowledged")
         self._startup_done = True
+        self._start_keepalive()
 
     async def _close(self) -> None:
         """Stop background tasks and close transport."""
+        await self._stop_tasks(self._reconnect_task)
+        await self._transport.close()
+
+    async def _stop_tasks(self, *extra: Optional[asyncio.Task]) -> None:
         self._running = False
         self._startup_done = False
 
-        for task in (self._listener_task, self._keepalive_task):
+        for task in (
+            self._listener_task,
+            self._flush_task,
+            self._keepalive_task,
+            *extra,
+        ):
             if task:
                 task.cancel()
                 try:
@@ -72,19 +252,34 @@ class OpenProtocolClient:
                 except asyncio.CancelledError:
                     pass
 
-        await self._transport.close()
-
     async def disconnect(self) -> bool:
         """Disconnect from server."""
+        self._closing = True
         if not self._running or not self._startup_done:
+            if self._reconnect_task is not None and not self._reconnect_task.done():
+                # Between attempts no listener is left to end the queues
+                await self._close()
+                self._close_queues()
             return True
 
-        comm = await self.send_receive(CommunicationStopMessage())
+        comm = await self._request(
+            self._connection.stop, CommunicationStopMessage.MID, timeout=5.0
+        )
         await self._close()
         return isinstance(comm, CommunicationPositiveAck)
 
-    async def subscribe(self, mid_cls: Type[OpenProtocolEventSubscribe]) -> None:
-        """Register subscription MID (controller will push events)."""
+    async def subscribe(
+        self,
+        mid_cls: Type[OpenProtocolEventSubscribe],
+        header_filter: Callable[[FrameHeader], bool] | None = None,
+    ) -> None:
+        """
+        Register subscription MID (controller will push events).
+
+        :param header_filter: predicate on the frame header, e.g.
+                `lambda h: h.spindle_id == 3`; rejected events are ACKed and
+                dropped before their payload is decoded
+        """
         if mid_cls.MESSAGE_TYPE != MessageType.EVENT_SUBSCRIBE:
             raise RuntimeError(
                 f"Message type is not for event subscribe: {mid_cls.MESSAGE_TYPE}"
@@ -96,7 +291,10 @@ class OpenProtocolClient:
         response = await self.send_receive(mid_obj)
 
         if response and response.MID == CommunicationPositiveAck.MID:
+            self._subscriptions[mid_obj.MID_EVENT] = (mid_cls, header_filter)
             self._subscribed_mids.add(mid_obj.MID_EVENT)
+            if header_filter is not None:
+                self._connection.header_filters[mid_obj.MID_EVENT] = header_filter
         else:
             raise RuntimeError(
                 f"Subscription for MID {mid_cls.MID} was rejected or failed"
@@ -125,7 +323,9 @@ class OpenProtocolClient:
                     f"Unsubscription for MID {mid_cls.MID} was rejected - forced"
                 )
 
+        self._subscriptions.pop(mid_cls.MID_EVENT, None)
         self._subscribed_mids.discard(mid_cls.MID_EVENT)
+        self._connection.header_filters.pop(mid_cls.MID_EVENT, None)
 
     async def get_subscription(self) -> OpenProtocolMessage:
         """Wait for the next async event MID from a subscription."""
@@ -134,6 +334,62 @@ class OpenProtocolClient:
             raise ConnectionError(f"Connection closed")
         return res
 
+    async def get_many(
+        self, max_items: int = 100, max_wait: float = 0.1
+    ) -> list[OpenProtocolMessage]:
+        """
+        Batch of up to `max_items` events from the subscription queue, waiting
+        at most `max_wait` seconds. May be empty.
+        """
+        res = await self._subscription_queue.get_many(max_items, max_wait)
+        if not res and self._subscription_queue.closed:
+            raise ConnectionError("Connection closed")
+        return res
+
+    def confirm(self, *events: OpenProtocolMessage) -> int:
+        """
+        ACK events received with AckMode.DEFERRED, the ACKs of one call are
+        written together. Returns the number of ACKs queued: events of a
+        connection lost in the meantime are not ACKed, the controller sends
+        them again.
+        """
+        confirmed = sum(self._connection.confirm_event(event) for event in events)
+        self._schedule_flush()
+        return confirmed
+
+    def events(
+        self,
+        event_cls: Type[OpenProtocolMessage],
+        station_id: int | None = None,
+        spindle_id: int | None = None,
+        queue: EventQueue | None = None,
+    ) -> EventStream:
+        """
+        Stream of the events of `event_cls`, optionally of one station and/or
+        spindle only, e.g. `async for ev in client.events(LastTighteningResultData)`.
+        The MID must be subscribed separately. Events are taken by every
+        matching stream, the others go to the subscription queue.
+
+        :param queue: queue of the stream with its bound and overflow policy,
+                unbounded by default
+        """
+        stream = EventStream(
+            event_cls.MID,
+            station_id,
+            spindle_id,
+            queue or EventQueue(),
+            self._remove_stream,
+        )
+        self._streams.setdefault(event_cls.MID, []).append(stream)
+        return stream
+
+    def _remove_stream(self, stream: EventStream) -> None:
+        streams = self._streams.get(stream.mid, [])
+        if stream in streams:
+            streams.remove(stream)
+        if not streams:
+            self._streams.pop(stream.mid, None)
+
     async def send_receive(
         self, mid_obj: OpenProtocolMessage, timeout: float = 5.0
     ) -> OpenProtocolMessage | None:
@@ -141,59 +397,244 @@ class OpenProtocolClient:
         if not self._startup_done and not self._running:
             raise RuntimeError("Startup sequence not completed")
 
-        raw_frame = MidCodec.encode(mid_obj)
+        if len(mid_obj.expected_response_mids) == 0:
+            raise ValueError(
+                f"The message doesn't have expected response: {mid_obj.MID}"
+            )
 
-        async with self._lock:
-            if len(mid_obj.expected_response_mids) == 0:
-                raise ValueError(
-                    f"The message doesn't have expected response: {mid_obj.MID}"
-                )
+        def queue(fut: asyncio.Future) -> None:
+            self._connection.send_request(mid_obj, fut)
+
+        return await self._request(queue, mid_obj.MID, timeout)
+
+    async def _request(
+        self,
+        queue: Callable[[asyncio.Future], None],
+        mid: int | None,
+        timeout: float,
+    ) -> OpenProtocolMessage | None:
+        """Queue a request on the connection with a new future and wait for it."""
+        async with self._in_flight:
             fut = asyncio.get_running_loop().create_future()
-            self._pending_future = fut
-            self._pending_expected = mid_obj.expected_response_mids
-            await self._transport.send(raw_frame)
-        res: OpenProtocolMessage | None = None
+            queue(fut)
+            self._schedule_flush()
+            try:
+                return await asyncio.wait_for(fut, timeout=timeout)
+            except (asyncio.TimeoutError, ConnectionError, ValueError) as e:
+                logger.warning(f"No reply for MID {mid}: {e!r}")
+                return None
+            finally:
+                self._connection.cancel_request(fut)
+
+    def _schedule_flush(self) -> None:
+        """Make sure a flush task will write what the connection has queued."""
+        if not self._connection.has_data_to_send:
+            return
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush())
+
+    async def _flush(self) -> None:
+        """
+        Write everything the connection has queued. The task runs in the next
+        loop iteration, so all frames queued until then go in one write;
+        frames queued while a write waits for the drain go in the next one.
+        """
         try:
-            if len(self._pending_expected) >= 1:
-                res = await asyncio.wait_for(fut, timeout=timeout)
-        finally:
-            self._pending_future.done()
-            self._pending_future = None
-            self._pending_expected = set()
-            return res
+            async with self._lock:
+                while self._connection.has_data_to_send:
+                    data = self._connection.take_data()
+                    await self._transport.send(data)
+                    self._last_sent = asyncio.get_running_loop().time()
+                    self._connection.recycle_data(data)
+        except (ConnectionError, OSError) as e:
+            logger.warning(f"Send failed: {e}")
+            self._connection_lost()
 
-    async def _listener_loop(self) -> None:
-        """Single receive loop: dispatch replies and events."""
-        while self._running:
+    def _connection_lost(self) -> None:
+        """Fail requests in flight, the connection can't deliver their replies."""
+        self._stop_keepalive()
+        for fut in self._connection.connection_lost():
+            if not fut.done():
+                fut.set_exception(
+                    ConnectionError("Connection closed while waiting for response")
+                )
+
+    async def _process(self, events: list[ConnectionEvent]) -> None:
+        """Apply connection events to futures and the subscription queue."""
+        for event in events:
+            if isinstance(event, ReplyReceived):
+                if not event.handle.done():
+                    event.handle.set_result(event.message)
+            elif isinstance(event, EventReceived):
+                await self._dispatch_event(event)
+            elif isinstance(event, UnexpectedMessage):
+                logger.warning(f"Not expected message: {event.message.MID}")
+                fut = event.handle
+                if fut and not fut.done():
+                    fut.set_exception(
+                        ValueError(f"Not expected response message {event.message.MID}")
+                    )
+            elif isinstance(event, InvalidFrame):
+                logger.warning(f"Invalid message: {event.error}")
+
+    async def _dispatch_event(self, event: EventReceived) -> None:
+        streams = self._streams.get(event.message.MID, ())
+        if not streams:
+            await self._subscription_queue.put(event.message)
+            return
+        message = event.message
+        spindles = (
+            message.spindle_ids() if isinstance(message, OpenProtocolEvent) else None
+        )
+        delivered = False
+        for stream in streams:
+            if stream.accepts(event.header, spindles):
+                await stream.queue.put(event.message)
+                delivered = True
+        if not delivered:
+            await self._subscription_queue.put(event.message)
+
+    def _close_queues(self) -> None:
+        """Queue the end marker for the subscription queue and all streams."""
+        if self._queues_closed:
+            return
+        self._queues_closed = True
+        self._subscription_queue.close()
+        for streams in self._streams.values():
+            for stream in streams:
+                stream.queue.close()
+
+    def _new_connection(self) -> OpenProtocolConnection:
+        link = LinkLayer(self._link_window) if self._link_window else None
+        return OpenProtocolConnection(self._ack_mode, link)
+
+    def _scheduler(self) -> KeepaliveScheduler:
+        if self._keepalive_scheduler is not None:
+            return self._keepalive_scheduler
+        return KeepaliveScheduler.get()
+
+    def _start_link_polls(self) -> None:
+        link = self._connection.link
+        if link is None:
+            return
+        self._keepalive = self._scheduler()
+        now = asyncio.get_running_loop().time()
+        self._keepalive.add(self._link_tick, now + link.poll_interval)
+
+    def _start_keepalive(self) -> None:
+        if self._keepalive_interval <= 0:
+            return
+        self._keepalive = self._scheduler()
+        now = asyncio.get_running_loop().time()
+        self._last_sent = self._last_received = now
+        self._keepalive_sent = None
+        self._keepalive_task = None
+        self._keepalive.add(self._keepalive_tick, now + self._keepalive_interval)
+
+    def _stop_keepalive(self) -> None:
+        if self._keepalive_task is not None:
+            self._keepalive_task.cancel()
+        if self._keepalive is not None:
+            self._keepalive.discard(self._keepalive_tick)
+            self._keepalive.discard(self._link_tick)
+            self._keepalive = None
+
+    def _keepalive_tick(self, now: float) -> float | None:
+        """
+        Called by the keepalive scheduler, the only deadline check of the
+        link: reads themselves have no timeout. Returns when it is due next.
+        """
+        if not self._running:
+            return None
+        self._connection.expire_parts()
+        interval = self._keepalive_interval
+        timeout = self._keepalive_timeout
+        waiting = self._keepalive_task is not None and not self._keepalive_task.done()
+        # None while the keepalive waits for a request slot: slow requests
+        # hold it up, not the link
+        sent = self._keepalive_sent
+        if waiting and sent is not None and now - sent >= timeout:
+            return self._dead_link(f"Keepalive unanswered for {now - sent:.1f} s")
+        partial_since = self._transport.partial_frame_since
+        if partial_since is not None and now - partial_since >= interval:
+            return self._dead_link(f"Frame incomplete for {now - partial_since:.1f} s")
+
+        if waiting:
+            # Nothing to send until the keepalive is answered
+            due = (sent if sent is not None else now) + timeout
+        else:
+            # Traffic both ways since the last check makes a keepalive redundant
+            due = min(self._last_sent, self._last_received) + interval
+        if partial_since is not None:
+            due = min(due, partial_since + interval)
+        keepalive = self._keepalive
+        resolution = keepalive.resolution if keepalive is not None else 0.0
+        if waiting or due > now + resolution:
+            return due
+
+        self._keepalive_sent = None
+        self._keepalive_task = asyncio.create_task(self._send_keepalive())
+        return now + min(interval, timeout)
+
+    async def _send_keepalive(self) -> None:
+        """
+        Keepalive request, it waits for a request slot like any other. Its
+        timeout starts once it is queued.
+        """
+        loop = asyncio.get_running_loop()
+        async with self._in_flight:
+            if not self._running:
+                return
+            fut = loop.create_future()
+            self._keepalive_sent = sent = loop.time()
+            self._connection.send_request(KeepAliveMessage(), fut)
+            self._schedule_flush()
             try:
-                raw = await self._transport.receive()
-                mid_obj = MidCodec.decode(raw)
-
-                if (
-                    self._pending_future
-                    and not self._pending_future.done()
-                    and (mid_obj.MID in self._pending_expected)
-                ):
-                    self._pending_future.set_result(mid_obj)
-                    continue
+                await fut
+            except (ConnectionError, ValueError) as e:
+                # Lost with the connection or failed by an unexpected message
+                logger.debug(f"Keepalive failed: {e!r}")
+                return
+            finally:
+                self._connection.cancel_request(fut)
+        self.keepalive_rtt = loop.time() - sent
 
-                if mid_obj.MESSAGE_TYPE == MessageType.EVENT:
-                    if mid_obj.MID in self._subscribed_mids:
-                        await self._subscription_queue.put(mid_obj)
+    def _link_tick(self, now: float) -> float | None:
+        """Called by the keepalive scheduler for the link layer retransmissions."""
+        link = self._connection.link
+        if not self._running or link is None:
+            return None
+        try:
+            self._connection.poll_link()
+        except ConnectionError as e:
+            return self._dead_link(str(e))
+        self._schedule_flush()
+        return now + link.poll_interval
 
-                        # Auto ACK if available
-                        ack_cls = MidCodec.get_ack(mid_obj)
-                        if ack_cls:
-                            async with self._lock:
-                                await self._transport.send(MidCodec.encode(ack_cls))
-                    continue
+    def _dead_link(self, reason: str) -> None:
+        """
+        Close a dead link: the listener ends as for a closed connection, which
+        starts a reconnect if enabled.
+        """
+        logger.warning(f"{reason}, dropping the connection")
+        self.dead_links += 1
+        self._stop_keepalive()
+        self._link_dead = True
+        if self._listener_task is not None:
+            self._listener_task.cancel()
 
-                logger.warning(f"Not expected message: {mid_obj.MID}")
-                if self._pending_future:
-                    self._pending_future.set_exception(
-                        ValueError(f"Not expected response message {mid_obj.MID}")
-                    )
-                    self._pending_future.set_result(None)
+    async def _listener_loop(self) -> None:
+        """Single receive loop: dispatch replies and events."""
+        loop = asyncio.get_running_loop()
+        while self._running:
+            try:
+                raw = await self._transport.receive(None)
+                self._last_received = loop.time()
+                await self._process(self._connection.receive_frame(raw))
+                # ACKs queued by the connection, written after the burst
+                self._schedule_flush()
+                if self._ack_mode == AckMode.IMMEDIATE and self._flush_task:
+                    await self._flush_task
             except asyncio.CancelledError:
                 logger.info("Cancelled loop")
                 break
@@ -215,9 +656,70 @@ class OpenProtocolClient:
                 await asyncio.sleep(1)
 
         self._running = False
-        if self._pending_future and not self._pending_future.done():
-            self._pending_future.set_exception(
-                ConnectionError("Connection closed while waiting for response")
-            )
-            self._pending_future.set_result(None)
-        self._subscription_queue.put_nowait(None)
+        self._connection_lost()
+        if self._link_dead:
+            self._link_dead = False
+            await self._close_transport()
+
+        if self._reconnect_task is not None and not self._reconnect_task.done():
+            # Failed attempt of the supervisor, which retries
+            return
+        if (
+            self._reconnect_policy is not None
+            and self._startup_done
+            and not self._closing
+        ):
+            self._startup_done = False
+            self._reconnect_task = asyncio.create_task(self._reconnect())
+            return
+        self._close_queues()
+
+    async def _reconnect(self) -> None:
+        """Reconnect with backoff, rerun the startup and replay subscriptions."""
+        assert self._reconnect_policy is not None
+        loop = asyncio.get_running_loop()
+        lost_at = loop.time()
+        try:
+            await self._close_transport()
+
+            for attempt, delay in enumerate(self._reconnect_policy.delays(), 1):
+                await asyncio.sleep(delay)
+                try:
+                    await self._start()
+                    await self._replay_subscriptions()
+                except (ConnectionError, OSError) as e:
+                    logger.warning(f"Reconnect attempt {attempt} failed: {e}")
+                    await self._stop_tasks()
+                    await self._close_transport()
+                    continue
+
+                self.reconnects += 1
+                self.last_reconnect_latency = loop.time() - lost_at
+                logger.info(
+                    f"Reconnected after {attempt} attempt(s) "
+                    f"in {self.last_reconnect_latency:.3f} s"
+                )
+                return
+        except asyncio.CancelledError:
+            # Consumers of the queues must not wait for a connection never made
+            self._close_queues()
+            raise
+
+        logger.error("Reconnect attempts exhausted")
+        self._close_queues()
+
+    async def _replay_subscriptions(self) -> None:
+        for mid_cls, header_filter in list(self._subscriptions.values()):
+            try:
+                await self.subscribe(mid_cls, header_filter)
+            except RuntimeError as e:
+                if not self._running:
+                    raise ConnectionError(f"Connection lost during replay: {e}")
+                # Rejected, retried after the next reconnect
+                logger.warning(f"Subscription replay failed: {e}")
+
+    async def _close_transport(self) -> None:
+        try:
+            await self._transport.close()
+        except (ConnectionError, OSError) as e:
+            logger.debug(f"Transport close failed: {e}")
@@ -5,13 +5,20 @@ from openprotocol.application.base_messages import (
     CommunicationNegativeAck,
 )
 from openprotocol.core.message import OpenProtocolRawMessage
-from openprotocol.core.mid_base import OpenProtocolMessage
+from openprotocol.core.mid_base import MessageType, OpenProtocolMessage
 import logging
 
 logger = logging.getLogger(__name__)
 
 
 class CommunicationStartAcknowledge(OpenProtocolReqReplyMsg):
+    __slots__ = (
+        "_cell_id",
+        "_channel_id",
+        "_controller_name",
+        "_supplier_code",
+    )
+
     MID = 2
 
     def __init__(
@@ -53,8 +60,11 @@ class CommunicationStartAcknowledge(OpenProtocolReqReplyMsg):
 
 
 class CommunicationStopMessage(OpenProtocolReqMsg):
+    __slots__ = ()
+
     MID = 3
     REVISION = 1
+    CONSTANT_FRAME = True
 
     expected_response_mids = {CommunicationPositiveAck.MID}
 
@@ -70,8 +80,11 @@ class CommunicationStopMessage(OpenProtocolReqMsg):
 
 
 class CommunicationStartMessage(OpenProtocolReqMsg):
+    __slots__ = ()
+
     MID = 1
     REVISION = 3
+    CONSTANT_FRAME = True
 
     expected_response_mids = {
         CommunicationStartAcknowledge.MID,
@@ -87,3 +100,29 @@ class CommunicationStartMessage(OpenProtocolReqMsg):
     @classmethod
     def from_message(cls, msg: OpenProtocolRawMessage) -> "OpenProtocolMessage":
         return cls()
+
+
+class KeepAliveMessage(OpenProtocolMessage):
+    """
+    Keep alive (MID 9999), the controller mirrors it back unchanged. It never
+    NACKs one, so unlike OpenProtocolReqMsg only the echo answers it.
+    """
+
+    __slots__ = ()
+
+    MESSAGE_TYPE = MessageType.REQ_MESSAGE
+    MID = 9999
+    REVISION = 1
+    CONSTANT_FRAME = True
+
+    expected_response_mids = {9999}
+
+    def __init__(self):
+        super().__init__(KeepAliveMessage.REVISION)
+
+    def encode(self) -> OpenProtocolRawMessage:
+        return self.create_message(self.REVISION)
+
+    @classmethod
+    def from_message(cls, msg: OpenProtocolRawMessage) -> "OpenProtocolMessage":
+        return cls()
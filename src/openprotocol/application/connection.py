@@ -0,0 +1,320 @@
+from dataclasses import dataclass
+from enum import Enum, verify, UNIQUE, auto
+from typing import Any, Callable
+
+from openprotocol.application.base_messages import CommunicationNegativeAck
+from openprotocol.application.communication import (
+    CommunicationStartAcknowledge,
+    CommunicationStartMessage,
+    CommunicationStopMessage,
+)
+from openprotocol.application.correlation import PendingRequests
+from openprotocol.application.link import LinkLayer
+from openprotocol.core.framing import (
+    FrameSplitter,
+    FrameWriter,
+    PartReassembler,
+    encode_parts,
+)
+from openprotocol.core.message import FrameHeader
+from openprotocol.core.mid_base import MidCodec, MessageType, OpenProtocolMessage
+
+
+@verify(UNIQUE)
+class ConnectionState(Enum):
+    IDLE = auto()
+    STARTING = auto()
+    ESTABLISHED = auto()
+    STOPPING = auto()
+    CLOSED = auto()
+
+
+@verify(UNIQUE)
+class AckMode(Enum):
+    # ACK of an event written as soon as the event is processed
+    IMMEDIATE = auto()
+    # ACKs of a burst of events written together with the next write
+    COALESCED = auto()
+    # ACK queued only once the application confirms the event, e.g. stored
+    DEFERRED = auto()
+
+
+@dataclass(frozen=True)
+class ReplyReceived:
+    """Reply matched to the request registered with `handle`."""
+
+    message: OpenProtocolMessage
+    handle: Any
+
+
+@dataclass(frozen=True)
+class EventReceived:
+    """
+    Event of a subscribed MID, its ACK (if any) is already queued unless ACKs
+    are deferred. `header` is the frame header, None for messages passed to
+    receive_message() alone.
+    """
+
+    message: OpenProtocolMessage
+    header: FrameHeader | None = None
+
+
+@dataclass(frozen=True)
+class UnexpectedMessage:
+    """
+    Message which is neither a reply nor a subscribed event. `handle` is the
+    request in flight the message names, e.g. by a NACK, and which is failed
+    by it, otherwise None.
+    """
+
+    message: OpenProtocolMessage
+    handle: Any
+
+
+@dataclass(frozen=True)
+class InvalidFrame:
+    """Frame which could not be decoded."""
+
+    data: bytes
+    error: Exception
+
+
+ConnectionEvent = ReplyReceived | EventReceived | UnexpectedMessage | InvalidFrame
+
+
+class OpenProtocolConnection:
+    """
+    Sans-IO Open Protocol session: bytes in, events and bytes out.
+
+    Handles framing, the MID 1/2 startup handshake, matching of replies to
+    requests, routing of subscribed events and their ACKs. It never does any
+    I/O: received data is passed to receive_data() (or receive_frame() for
+    already framed data) which returns events, and frames to be written are
+    encoded into one buffer until data_to_send() (or take_data()) is called.
+    Requests carry an opaque handle, e.g. a future of the driver, returned
+    back with their reply.
+
+    Frames are routed on their header first: events which are not subscribed
+    or rejected by the header filter of their MID (e.g. another spindle) are
+    dropped, and ACKed if subscribed, without decoding the payload.
+
+    Events are ACKed on receipt, or with AckMode.DEFERRED once confirm_event()
+    is called for them. The ACK MID of an event comes from the MidCodec.
+
+    Multi-part messages are reassembled before they are routed and decoded,
+    outgoing messages too long for one frame are split.
+
+    With a LinkLayer all frames are sequenced and link level acknowledged
+    (MID 9997/9998), the driver calls poll_link() periodically for
+    retransmissions.
+    """
+
+    def __init__(
+        self, ack_mode: AckMode = AckMode.COALESCED, link: LinkLayer | None = None
+    ) -> None:
+        self.state = ConnectionState.IDLE
+        self.ack_mode = ack_mode
+        self.link = link
+        self.subscribed_mids: set[int] = set()
+        self.header_filters: dict[int, Callable[[FrameHeader], bool]] = {}
+        self._pending = PendingRequests()
+        self._splitter = FrameSplitter()
+        self._reassembler = PartReassembler()
+        self._writer = FrameWriter()
+        self._start_handle: Any = None
+        # Events waiting for their deferred ACK by id(), the message is kept so
+        # its id is not reused before it is confirmed
+        self._unconfirmed: dict[int, OpenProtocolMessage] = {}
+        self._stop_handle: Any = None
+
+    @property
+    def pending_requests(self) -> int:
+        return len(self._pending)
+
+    # Outgoing
+
+    def send(self, mid_obj: OpenProtocolMessage) -> None:
+        """Queue a MID which does not wait for any reply."""
+        self._add(mid_obj)
+
+    def send_request(self, mid_obj: OpenProtocolMessage, handle: Any) -> None:
+        """Queue a MID and wait for its reply under `handle`."""
+        if len(mid_obj.expected_response_mids) == 0:
+            raise ValueError(
+                f"The message doesn't have expected response: {mid_obj.MID}"
+            )
+        self._add(mid_obj)
+        self._pending.add(mid_obj, handle)
+
+    def start(self, handle: Any) -> None:
+        """Queue the communication start (MID 1)."""
+        self.send_request(CommunicationStartMessage(), handle)
+        self._start_handle = handle
+        self.state = ConnectionState.STARTING
+
+    def stop(self, handle: Any) -> None:
+        """Queue the communication stop (MID 3)."""
+        self.send_request(CommunicationStopMessage(), handle)
+        self._stop_handle = handle
+        self.state = ConnectionState.STOPPING
+
+    def confirm_event(self, event: OpenProtocolMessage) -> bool:
+        """
+        Queue the deferred ACK of a received `event`. Returns False if it does
+        not wait for its ACK on this connection, e.g. it was received on an
+        earlier one or is already confirmed.
+        """
+        if self._unconfirmed.get(id(event)) is not event:
+            return False
+        del self._unconfirmed[id(event)]
+        self._ack_event(event.MID)
+        return True
+
+    def expire_parts(self) -> int:
+        """
+        Drop multi-part messages not completed in time, for links which
+        receive no frame that would check them. Returns how many.
+        """
+        return self._reassembler.expire()
+
+    def cancel_request(self, handle: Any) -> None:
+        """Forget a request, e.g. after its timeout expired."""
+        self._pending.discard(handle)
+
+    def poll_link(self) -> None:
+        """
+        Queue the retransmissions of the link layer. Raises ConnectionError
+        once a frame is given up.
+        """
+        if self.link is not None:
+            self._add_frames(self.link.poll())
+
+    def _add(self, mid_obj: OpenProtocolMessage) -> None:
+        if self.link is None:
+            self._writer.add(mid_obj)
+        else:
+            for part in encode_parts(mid_obj):
+                self._add_frames(self.link.send(part))
+
+    def _add_frames(self, frames: list[bytes]) -> None:
+        for frame in frames:
+            self._writer.add_frame(frame)
+
+    @property
+    def has_data_to_send(self) -> bool:
+        return len(self._writer) > 0
+
+    def data_to_send(self) -> bytes:
+        """Return and clear all queued outgoing bytes."""
+        data = self._writer.take()
+        return bytes(data)
+
+    def take_data(self) -> bytearray:
+        """
+        Return the buffer with all queued outgoing bytes, for writing it
+        without a copy. Hand it back with recycle_data() once written.
+        """
+        return self._writer.take()
+
+    def recycle_data(self, data: bytearray) -> None:
+        self._writer.recycle(data)
+
+    # Incoming
+
+    def receive_data(
+        self, data: bytes | bytearray | memoryview
+    ) -> list[ConnectionEvent]:
+        """Process received bytes, frames may be split at any position."""
+        events: list[ConnectionEvent] = []
+        for frame in self._splitter.feed(data):
+            events += self.receive_frame(frame)
+        return events
+
+    def receive_frame(self, frame: bytes) -> list[ConnectionEvent]:
+        """
+        Process one complete frame. Raises ConnectionError if the link layer
+        gave up a frame.
+        """
+        try:
+            header = MidCodec.peek(frame)
+            if self.link is not None:
+                deliver, frames = self.link.receive(frame)
+                self._add_frames(frames)
+                if not deliver:
+                    return []
+            message = self._reassembler.feed(frame)
+            if message is None:
+                return []
+            frame = message
+            if not self._accepts(header):
+                return []
+            mid_obj = MidCodec.decode(frame)
+        except ValueError as e:
+            return [InvalidFrame(frame, e)]
+        return self.receive_message(mid_obj, header)
+
+    def receive_message(
+        self, mid_obj: OpenProtocolMessage, header: FrameHeader | None = None
+    ) -> list[ConnectionEvent]:
+        """Process one decoded message."""
+        handle = self._pending.match(mid_obj)
+        if handle is not None:
+            self._update_state(mid_obj, handle)
+            return [ReplyReceived(mid_obj, handle)]
+
+        if mid_obj.MESSAGE_TYPE == MessageType.EVENT:
+            if mid_obj.MID not in self.subscribed_mids:
+                return []
+            if self.ack_mode != AckMode.DEFERRED:
+                self._ack_event(mid_obj.MID)
+            elif MidCodec.get_ack(mid_obj.MID) is not None:
+                self._unconfirmed[id(mid_obj)] = mid_obj
+            return [EventReceived(mid_obj, header)]
+
+        return [UnexpectedMessage(mid_obj, self._pending.pop_named(mid_obj))]
+
+    def connection_lost(self) -> list[Any]:
+        """Mark the connection closed, returns handles of requests in flight."""
+        self.state = ConnectionState.CLOSED
+        self._splitter.clear()
+        self._reassembler.clear()
+        self._writer.clear()
+        # Unconfirmed events are sent again by the controller
+        self._unconfirmed.clear()
+        if self.link is not None:
+            self.link.clear()
+        return self._pending.drain()
+
+    def _accepts(self, header: FrameHeader) -> bool:
+        """Decide from the header alone whether a frame is worth decoding."""
+        if self._pending.expects(header.mid):
+            return True
+        msg_cls = MidCodec.message_class(header.mid)
+        if msg_cls is None or msg_cls.MESSAGE_TYPE != MessageType.EVENT:
+            return True
+        if header.mid not in self.subscribed_mids:
+            return False
+        header_filter = self.header_filters.get(header.mid)
+        if header_filter is None or header_filter(header):
+            return True
+        self._ack_event(header.mid)
+        return False
+
+    def _ack_event(self, mid: int) -> None:
+        ack = MidCodec.get_ack(mid)
+        if ack:
+            self.send(ack)
+
+    def _update_state(self, reply: OpenProtocolMessage, handle: Any) -> None:
+        if handle is self._start_handle:
+            self._start_handle = None
+            if isinstance(reply, CommunicationStartAcknowledge):
+                self.state = ConnectionState.ESTABLISHED
+            else:
+                self.state = ConnectionState.IDLE
+        elif handle is self._stop_handle:
+            self._stop_handle = None
+            if isinstance(reply, CommunicationNegativeAck):
+                self.state = ConnectionState.ESTABLISHED
+            else:
+                self.state = ConnectionState.CLOSED
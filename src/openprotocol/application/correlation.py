@@ -0,0 +1,85 @@
+from typing import Any, NamedTuple
+
+from openprotocol.application.base_messages import (
+    CommunicationNegativeAck,
+    CommunicationPositiveAck,
+)
+from openprotocol.core.mid_base import OpenProtocolMessage
+
+
+class PendingRequest(NamedTuple):
+    mid: int | None
+    expected: frozenset[int]
+    handle: Any
+
+
+class PendingRequests:
+    """
+    Correlates replies with requests that are still in flight.
+
+    Replies are matched in FIFO order per reply MID. MID 4/5 (NACK/ACK) carry
+    the MID of the request they answer and are matched on it only: a late
+    ACK of a request given up answers no other request.
+    The handle is opaque for this class, the client stores its future there.
+    """
+
+    def __init__(self) -> None:
+        self._pending: list[PendingRequest] = []
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def add(self, mid_obj: OpenProtocolMessage, handle: Any) -> None:
+        self._pending.append(
+            PendingRequest(
+                mid_obj.MID, frozenset(mid_obj.expected_response_mids), handle
+            )
+        )
+
+    def expects(self, mid: int) -> bool:
+        """True if any request in flight waits for a reply `mid`."""
+        return any(mid in p.expected for p in self._pending)
+
+    def match(self, reply: OpenProtocolMessage) -> Any | None:
+        """
+        Remove and return the handle of the request answered by `reply`, None
+        if it answers no request in flight.
+        """
+        candidates = [p for p in self._pending if reply.MID in p.expected]
+        if isinstance(reply, (CommunicationPositiveAck, CommunicationNegativeAck)):
+            candidates = [p for p in candidates if p.mid == reply.acknowledged_mid]
+        if not candidates:
+            return None
+
+        selected = candidates[0]
+        self._pending.remove(selected)
+        return selected.handle
+
+    def pop_named(self, message: OpenProtocolMessage) -> Any | None:
+        """
+        Remove and return the handle of the oldest request an unexpected ACK
+        or NACK names, e.g. a NACK of a request which expects data only. None
+        for other messages, they belong to no request.
+        """
+        if not isinstance(
+            message, (CommunicationPositiveAck, CommunicationNegativeAck)
+        ):
+            return None
+        for pending in self._pending:
+            if pending.mid == message.acknowledged_mid:
+                self._pending.remove(pending)
+                return pending.handle
+        return None
+
+    def pop_oldest(self) -> Any | None:
+        if not self._pending:
+            return None
+        return self._pending.pop(0).handle
+
+    def discard(self, handle: Any) -> None:
+        self._pending = [p for p in self._pending if p.handle is not handle]
+
+    def drain(self) -> list[Any]:
+        handles = [p.handle for p in self._pending]
+        self._pending.clear()
+        return handles
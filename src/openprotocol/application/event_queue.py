@@ -0,0 +1,284 @@
+import asyncio
+import pickle
+import struct
+import tempfile
+from collections import deque
+from enum import Enum, verify, UNIQUE, auto
+from typing import Any, BinaryIO, Callable, Collection
+
+from openprotocol.core.message import FrameHeader
+
+
+@verify(UNIQUE)
+class OverflowPolicy(Enum):
+    # put() waits for space: the listener stops reading and ACKing events
+    BLOCK = auto()
+    # The oldest queued event is dropped for the new one
+    DROP_OLDEST = auto()
+    # The new event is dropped
+    DROP_NEWEST = auto()
+    # Events beyond the bound go to a temporary file and are read back in order
+    SPILL = auto()
+
+
+class _SpillFile:
+    """Temporary file of length-prefixed pickled events, read back in FIFO order."""
+
+    _LENGTH = struct.Struct("<I")
+
+    def __init__(self, directory: str | None) -> None:
+        self._file: BinaryIO = tempfile.TemporaryFile(dir=directory)
+        self._read_pos = 0
+        self.count = 0
+
+    def write(self, item: Any) -> None:
+        data = pickle.dumps(item, protocol=pickle.HIGHEST_PROTOCOL)
+        self._file.seek(0, 2)
+        self._file.write(self._LENGTH.pack(len(data)))
+        self._file.write(data)
+        self.count += 1
+
+    def read(self) -> Any:
+        self._file.seek(self._read_pos)
+        (length,) = self._LENGTH.unpack(self._file.read(self._LENGTH.size))
+        item = pickle.loads(self._file.read(length))
+        self._read_pos += self._LENGTH.size + length
+        self.count -= 1
+        if self.count == 0:
+            # Backlog drained, start over to keep the file small
+            self._file.seek(0)
+            self._file.truncate()
+            self._read_pos = 0
+        return item
+
+
+class EventQueue:
+    """
+    FIFO queue of subscribed events between the listener and the application.
+
+    At most `maxsize` events are kept in memory (0 is unbounded), `overflow`
+    decides what happens to events beyond it. The number of dropped and
+    spilled events is counted. close() queues the end marker None regardless
+    of the bound.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 0,
+        overflow: OverflowPolicy = OverflowPolicy.BLOCK,
+        spill_dir: str | None = None,
+    ):
+        """
+        :param spill_dir: directory of the spill file (OverflowPolicy.SPILL),
+                None for the default temporary directory
+        """
+        if maxsize < 0:
+            raise ValueError(f"maxsize must not be negative: {maxsize}")
+        if overflow == OverflowPolicy.SPILL and maxsize == 0:
+            raise ValueError("Spilling requires a bounded queue")
+        self.maxsize = maxsize
+        self.overflow = overflow
+        self.dropped = 0
+        self.spilled = 0
+        self._items: deque[Any] = deque()
+        self._getters: deque[asyncio.Future] = deque()
+        self._putters: deque[asyncio.Future] = deque()
+        self._spill_dir = spill_dir
+        self._spill: _SpillFile | None = None
+
+    def qsize(self) -> int:
+        return len(self._items) + self._spilled_backlog()
+
+    def empty(self) -> bool:
+        return self.qsize() == 0
+
+    def full(self) -> bool:
+        return 0 < self.maxsize <= len(self._items)
+
+    @property
+    def closed(self) -> bool:
+        """The next item is the end marker."""
+        return bool(self._items) and self._items[0] is None
+
+    def _spilled_backlog(self) -> int:
+        return self._spill.count if self._spill is not None else 0
+
+    async def put(self, item: Any) -> None:
+        """Queue an event, waits for space with OverflowPolicy.BLOCK."""
+        while self.overflow == OverflowPolicy.BLOCK and self.full():
+            putter = asyncio.get_running_loop().create_future()
+            self._putters.append(putter)
+            try:
+                await putter
+            except BaseException:
+                putter.cancel()
+                if putter in self._putters:
+                    self._putters.remove(putter)
+                # Pass a wakeup this putter got on to the next one
+                if not self.full() and not putter.cancelled():
+                    self._wakeup_next(self._putters)
+                raise
+        self.put_nowait(item)
+
+    def put_nowait(self, item: Any) -> bool:
+        """
+        Queue an event without waiting, returns False if it was dropped.
+        Raises asyncio.QueueFull with OverflowPolicy.BLOCK.
+        """
+        if self._spilled_backlog():
+            # Keep the order behind events which are already on disk
+            self._spill_item(item)
+        elif not self.full():
+            self._items.append(item)
+        elif self.overflow == OverflowPolicy.DROP_NEWEST:
+            self.dropped += 1
+            return False
+        elif self.overflow == OverflowPolicy.DROP_OLDEST:
+            self._items.popleft()
+            self._items.append(item)
+            self.dropped += 1
+        elif self.overflow == OverflowPolicy.SPILL:
+            self._spill_item(item)
+        else:
+            raise asyncio.QueueFull()
+        self._wakeup_next(self._getters)
+        return True
+
+    def _spill_item(self, item: Any) -> None:
+        if self._spill is None:
+            self._spill = _SpillFile(self._spill_dir)
+        self._spill.write(item)
+        self.spilled += 1
+
+    def close(self) -> None:
+        """Queue the end marker None behind all queued events."""
+        if self._spilled_backlog():
+            assert self._spill is not None
+            self._spill.write(None)
+        else:
+            self._items.append(None)
+        self._wakeup_next(self._getters)
+
+    async def get(self) -> Any:
+        """Wait for the next event."""
+        while self.empty():
+            getter = asyncio.get_running_loop().create_future()
+            self._getters.append(getter)
+            try:
+                await getter
+            except BaseException:
+                getter.cancel()
+                if getter in self._getters:
+                    self._getters.remove(getter)
+                # Pass a wakeup this getter got on to the next one
+                if not self.empty() and not getter.cancelled():
+                    self._wakeup_next(self._getters)
+                raise
+        return self.get_nowait()
+
+    async def get_many(self, max_items: int, max_wait: float) -> list[Any]:
+        """
+        Up to `max_items` events, waiting at most `max_wait` seconds for them.
+        Stops in front of the end marker, which is left in the queue.
+        """
+        items: list[Any] = []
+        deadline = asyncio.get_running_loop().time() + max_wait
+        try:
+            async with asyncio.timeout_at(deadline):
+                while len(items) < max_items:
+                    item = self.get_nowait() if not self.empty() else await self.get()
+                    if item is None:
+                        self._items.appendleft(None)
+                        break
+                    items.append(item)
+        except TimeoutError:
+            pass
+        return items
+
+    def get_nowait(self) -> Any:
+        if self._items:
+            item = self._items.popleft()
+        elif self._spilled_backlog():
+            assert self._spill is not None
+            item = self._spill.read()
+        else:
+            raise asyncio.QueueEmpty()
+        self._wakeup_next(self._putters)
+        return item
+
+    @staticmethod
+    def _wakeup_next(waiters: deque[asyncio.Future]) -> None:
+        while waiters:
+            waiter = waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                break
+
+
+class EventStream:
+    """
+    Channel of the events of one MID, optionally of one station and/or
+    spindle, iterated with `async for`. Iteration ends when the connection is
+    closed for good; close() detaches the channel from the client.
+    """
+
+    def __init__(
+        self,
+        mid: int,
+        station_id: int | None,
+        spindle_id: int | None,
+        queue: EventQueue,
+        on_close: Callable[["EventStream"], None],
+    ):
+        self.mid = mid
+        self.station_id = station_id
+        self.spindle_id = spindle_id
+        self.queue = queue
+        self._on_close = on_close
+
+    def accepts(
+        self, header: FrameHeader | None, spindles: Collection[int] | None = None
+    ) -> bool:
+        """
+        :param spindles: spindles of an event covering several of them, which
+                replace the spindle of the header
+        """
+        if self.station_id is None and self.spindle_id is None:
+            return True
+        if self.spindle_id is not None and spindles is not None:
+            if self.spindle_id not in spindles:
+                return False
+            return self.station_id is None or (
+                header is not None and header.station_id == self.station_id
+            )
+        if header is None:
+            return False
+        return (self.station_id is None or header.station_id == self.station_id) and (
+            self.spindle_id is None or header.spindle_id == self.spindle_id
+        )
+
+    def __aiter__(self) -> "EventStream":
+        return self
+
+    async def __anext__(self) -> Any:
+        item = await self.queue.get()
+        if item is None:
+            self.queue.close()
+            raise StopAsyncIteration
+        return item
+
+    async def get_many(self, max_items: int, max_wait: float) -> list[Any]:
+        """Batch of events, see EventQueue.get_many(). Raises ConnectionError at the end."""
+        items = await self.queue.get_many(max_items, max_wait)
+        if not items and self.queue.closed:
+            raise ConnectionError("Connection closed")
+        return items
+
+    def close(self) -> None:
+        self._on_close(self)
+
+    async def __aenter__(self) -> "EventStream":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        self.close()
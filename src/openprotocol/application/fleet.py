@@ -0,0 +1,380 @@
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, NamedTuple, Type
+
+from openprotocol.application.base_messages import OpenProtocolEventSubscribe
+from openprotocol.application.client import OpenProtocolClient
+from openprotocol.application.connection import AckMode
+from openprotocol.application.event_queue import EventQueue, OverflowPolicy
+from openprotocol.application.keepalive import KeepaliveScheduler
+from openprotocol.application.reconnect import ReconnectPolicy
+from openprotocol.core.message import FrameHeader
+from openprotocol.core.mid_base import OpenProtocolMessage
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class Endpoint:
+    host: str
+    port: int
+    # Tag of the controller's events, "host:port" by default
+    name: str | None = None
+
+    @property
+    def tag(self) -> str:
+        return self.name or f"{self.host}:{self.port}"
+
+
+class TaggedEvent(NamedTuple):
+    """Event of the merged fleet stream with the tag of its controller."""
+
+    controller: str
+    message: OpenProtocolMessage
+
+
+@dataclass(frozen=True)
+class ControllerHealth:
+    connected: bool
+    events: int
+    # Loop time of the last event, None before the first one
+    last_event: float | None
+    dropped_events: int
+    reconnects: int
+    dead_links: int
+    keepalive_rtt: float | None
+    # Reason of the last failed connect, None once connected
+    error: str | None
+
+
+class _ControllerQueue(EventQueue):
+    """
+    Subscription queue of one controller of a fleet: its events are tagged
+    and passed to the merged queue, nothing is kept here.
+    """
+
+    def __init__(self, fleet: "ControllerFleet", tag: str):
+        super().__init__()
+        self.tag = tag
+        self.events = 0
+        self.last_event: float | None = None
+        self._fleet = fleet
+
+    async def put(self, item: Any) -> None:
+        merged = self._fleet._queue
+        if merged.overflow != OverflowPolicy.BLOCK:
+            self.put_nowait(item)
+            return
+        self._count()
+        await merged.put(TaggedEvent(self.tag, item))
+
+    def put_nowait(self, item: Any) -> bool:
+        self._count()
+        if not self._fleet._queue.put_nowait(TaggedEvent(self.tag, item)):
+            self.dropped += 1
+            return False
+        return True
+
+    def _count(self) -> None:
+        self.events += 1
+        self.last_event = asyncio.get_running_loop().time()
+
+    def close(self) -> None:
+        # The client is gone for good, the merged queue ends with the last one
+        self._fleet._controller_closed(self.tag)
+
+
+ClientFactory = Callable[[Endpoint, EventQueue], OpenProtocolClient]
+
+
+class ControllerFleet:
+    """
+    Many controllers on one event loop with one merged, tagged event stream.
+
+    Connections are brought up at most `max_parallel` at a time and started
+    `stagger` seconds apart, so startup handshakes and the keepalives which
+    follow them do not all fall on the same loop iteration. Controllers which
+    can't be reached at startup are retried in the background with the
+    `reconnect` policy, which also reconnects lost connections.
+
+    All clients share one KeepaliveScheduler, the loop's or with
+    `keepalive_resolution` one of the fleet's own, so keepalives due close
+    together are sent by one timer wakeup. They also share the MidCodec
+    dispatch table and encode caches, so each additional controller costs its
+    listener task and protocol state only.
+    """
+
+    def __init__(
+        self,
+        endpoints: Iterable[Endpoint | tuple[str, int]],
+        max_parallel: int = 32,
+        stagger: float = 0.005,
+        reconnect: ReconnectPolicy | None = None,
+        event_queue: EventQueue | None = None,
+        client_factory: ClientFactory | None = None,
+        keepalive_interval: float = 10.0,
+        keepalive_resolution: float | None = None,
+        ack_mode: AckMode = AckMode.COALESCED,
+    ):
+        """
+        :param max_parallel: connections in their startup at the same time
+        :param stagger: seconds between the starts of two connections
+        :param event_queue: merged queue with its bound and overflow policy,
+                unbounded by default
+        :param client_factory: creates the client of an endpoint around its
+                subscription queue, OpenProtocolClient.create() by default
+        :param keepalive_resolution: resolution of a KeepaliveScheduler of
+                the fleet's own: keepalives due within this many seconds are
+                sent early, by one wakeup. None uses the loop's scheduler and
+                leaves its resolution as it is
+        :param ack_mode: ACK mode of the clients, with AckMode.DEFERRED events
+                are ACKed by confirm()
+        """
+        if max_parallel < 1:
+            raise ValueError(f"max_parallel must be at least 1: {max_parallel}")
+        self.endpoints: dict[str, Endpoint] = {}
+        for endpoint in endpoints:
+            if not isinstance(endpoint, Endpoint):
+                endpoint = Endpoint(*endpoint)
+            if endpoint.tag in self.endpoints:
+                raise ValueError(f"Duplicate controller {endpoint.tag}")
+            self.endpoints[endpoint.tag] = endpoint
+        self.max_parallel = max_parallel
+        self.stagger = stagger
+        self.keepalive_resolution = keepalive_resolution
+        self._reconnect = reconnect
+        self._keepalive_interval = keepalive_interval
+        self._ack_mode = ack_mode
+        self._client_factory = client_factory or self._create_client
+        self._queue: EventQueue = event_queue or EventQueue()
+
+        self.clients: dict[str, OpenProtocolClient] = {}
+        self._queues: dict[str, _ControllerQueue] = {}
+        self._errors: dict[str, str] = {}
+        self._retry_tasks: dict[str, asyncio.Task] = {}
+        self._closed: set[str] = set()
+        self._starting: set[str] = set()
+        self._subscriptions: list[
+            tuple[
+                Type[OpenProtocolEventSubscribe],
+                Callable[[FrameHeader], bool] | None,
+            ]
+        ] = []
+        self._slots: asyncio.Semaphore | None = None
+        self._stopping = False
+        self.keepalive_scheduler: KeepaliveScheduler | None = None
+
+    def __len__(self) -> int:
+        return len(self.endpoints)
+
+    def _create_client(
+        self, endpoint: Endpoint, queue: EventQueue
+    ) -> OpenProtocolClient:
+        return OpenProtocolClient.create(
+            endpoint.host,
+            endpoint.port,
+            keepalive_interval=self._keepalive_interval,
+            reconnect=self._reconnect,
+            event_queue=queue,
+            ack_mode=self._ack_mode,
+            keepalive_scheduler=self.keepalive_scheduler,
+        )
+
+    async def start(self) -> int:
+        """
+        Connect all controllers, returns the number connected. Failed ones are
+        reported by health() and retried if a reconnect policy is set.
+        """
+        self._stopping = False
+        if self.keepalive_resolution is not None:
+            self.keepalive_scheduler = KeepaliveScheduler(
+                asyncio.get_running_loop(), self.keepalive_resolution
+            )
+        self._slots = asyncio.Semaphore(self.max_parallel)
+        for tag, endpoint in self.endpoints.items():
+            queue = self._queues[tag] = _ControllerQueue(self, tag)
+            self.clients[tag] = self._client_factory(endpoint, queue)
+
+        loop = asyncio.get_running_loop()
+        begin = loop.time()
+        results = await asyncio.gather(
+            *(
+                self._start_client(tag, begin + index * self.stagger)
+                for index, tag in enumerate(self.endpoints)
+            )
+        )
+        return sum(results)
+
+    async def _start_client(self, tag: str, not_before: float) -> bool:
+        assert self._slots is not None
+        delay = not_before - asyncio.get_running_loop().time()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        async with self._slots:
+            if await self._connect(tag):
+                return True
+        if self._reconnect is not None and not self._stopping:
+            self._retry_tasks[tag] = asyncio.create_task(self._retry(tag))
+        else:
+            self._controller_closed(tag)
+        return False
+
+    async def _connect(self, tag: str) -> bool:
+        # A failed attempt closes the client's queue, which does not count yet
+        self._starting.add(tag)
+        try:
+            return await self._connect_client(tag, self.clients[tag])
+        finally:
+            self._starting.discard(tag)
+
+    async def _connect_client(self, tag: str, client: OpenProtocolClient) -> bool:
+        try:
+            await client.connect()
+        except (ConnectionError, OSError) as e:
+            logger.warning(f"Controller {tag} not connected: {e!r}")
+            self._errors[tag] = repr(e)
+            return False
+        try:
+            for mid_cls, header_filter in self._subscriptions:
+                await client.subscribe(mid_cls, header_filter)
+        except RuntimeError as e:
+            logger.warning(f"Controller {tag} not subscribed: {e}")
+            self._errors[tag] = str(e)
+            await client.disconnect()
+            return False
+        self._errors.pop(tag, None)
+        return True
+
+    async def _retry(self, tag: str) -> None:
+        assert self._reconnect is not None and self._slots is not None
+        for delay in self._reconnect.delays():
+            await asyncio.sleep(delay)
+            async with self._slots:
+                if await self._connect(tag):
+                    self._retry_tasks.pop(tag, None)
+                    return
+        self._retry_tasks.pop(tag, None)
+        self._controller_closed(tag)
+
+    async def subscribe(
+        self,
+        mid_cls: Type[OpenProtocolEventSubscribe],
+        header_filter: Callable[[FrameHeader], bool] | None = None,
+    ) -> int:
+        """
+        Subscribe all connected controllers, returns the number subscribed.
+        Controllers connected later are subscribed when they come up.
+        """
+        assert self._slots is not None, "Fleet not started"
+        self._subscriptions.append((mid_cls, header_filter))
+
+        async def subscribe_one(tag: str, client: OpenProtocolClient) -> bool:
+            async with self._slots:
+                try:
+                    await client.subscribe(mid_cls, header_filter)
+                except RuntimeError as e:
+                    logger.warning(f"Controller {tag} not subscribed: {e}")
+                    return False
+            return True
+
+        results = await asyncio.gather(
+            *(
+                subscribe_one(tag, client)
+                for tag, client in self.clients.items()
+                if client.connected
+            )
+        )
+        return sum(results)
+
+    async def stop(self) -> None:
+        """Disconnect all controllers, the merged stream ends afterwards."""
+        self._stopping = True
+        for task in list(self._retry_tasks.values()):
+            task.cancel()
+        await asyncio.gather(*self._retry_tasks.values(), return_exceptions=True)
+        self._retry_tasks.clear()
+
+        slots = self._slots or asyncio.Semaphore(self.max_parallel)
+
+        async def stop_one(client: OpenProtocolClient) -> None:
+            async with slots:
+                await client.disconnect()
+
+        await asyncio.gather(*(stop_one(c) for c in self.clients.values()))
+        for tag in self.endpoints:
+            self._controller_closed(tag)
+
+    def _controller_closed(self, tag: str) -> None:
+        if tag in self._closed or tag in self._starting or tag in self._retry_tasks:
+            return
+        self._closed.add(tag)
+        if len(self._closed) == len(self.endpoints):
+            self._queue.close()
+
+    async def get(self) -> TaggedEvent:
+        """Next event of any controller."""
+        item = await self._queue.get()
+        if item is None:
+            self._queue.close()
+            raise ConnectionError("All controllers closed")
+        return item
+
+    async def get_many(
+        self, max_items: int = 1000, max_wait: float = 0.1
+    ) -> list[TaggedEvent]:
+        """Batch of events of all controllers, see EventQueue.get_many()."""
+        items = await self._queue.get_many(max_items, max_wait)
+        if not items and self._queue.closed:
+            raise ConnectionError("All controllers closed")
+        return items
+
+    def __aiter__(self) -> "ControllerFleet":
+        return self
+
+    async def __anext__(self) -> TaggedEvent:
+        try:
+            return await self.get()
+        except ConnectionError:
+            raise StopAsyncIteration
+
+    def confirm(self, *events: TaggedEvent) -> int:
+        """
+        ACK events received with AckMode.DEFERRED through the client of their
+        controller, see OpenProtocolClient.confirm().
+        """
+        by_controller: dict[str, list[OpenProtocolMessage]] = {}
+        for event in events:
+            by_controller.setdefault(event.controller, []).append(event.message)
+        return sum(
+            self.clients[tag].confirm(*messages)
+            for tag, messages in by_controller.items()
+        )
+
+    def health(self) -> dict[str, ControllerHealth]:
+        """State and counters of every controller by tag."""
+        health = {}
+        for tag, client in self.clients.items():
+            queue = self._queues[tag]
+            health[tag] = ControllerHealth(
+                connected=client.connected,
+                events=queue.events,
+                last_event=queue.last_event,
+                dropped_events=queue.dropped,
+                reconnects=client.reconnects,
+                dead_links=client.dead_links,
+                keepalive_rtt=client.keepalive_rtt,
+                error=self._errors.get(tag),
+            )
+        return health
+
+    @property
+    def connected(self) -> int:
+        return sum(client.connected for client in self.clients.values())
+
+    async def __aenter__(self) -> "ControllerFleet":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.stop()
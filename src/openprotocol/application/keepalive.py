@@ -0,0 +1,92 @@
+import asyncio
+import heapq
+import itertools
+import logging
+from typing import Callable
+from weakref import WeakKeyDictionary
+
+logger = logging.getLogger(__name__)
+
+# Called with the loop time when a link is due, returns when it is due next
+# or None to leave the scheduler
+KeepaliveTick = Callable[[float], float | None]
+
+
+class KeepaliveScheduler:
+    """
+    Single timer of an event loop for the keepalives of all its clients.
+
+    Links are kept in a heap by due time and only the earliest one arms the
+    loop timer, so idle links cost no task and no wakeup of their own. Links
+    due within `resolution` of each other are served by the same wakeup.
+    """
+
+    _schedulers: WeakKeyDictionary[asyncio.AbstractEventLoop, "KeepaliveScheduler"] = (
+        WeakKeyDictionary()
+    )
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, resolution: float = 0.1):
+        self.resolution = resolution
+        self.wakeups = 0
+        self._loop = loop
+        self._heap: list[tuple[float, int, KeepaliveTick]] = []
+        self._due: dict[KeepaliveTick, float] = {}
+        self._order = itertools.count()
+        self._timer: asyncio.TimerHandle | None = None
+
+    @classmethod
+    def get(cls) -> "KeepaliveScheduler":
+        """Scheduler of the running event loop."""
+        loop = asyncio.get_running_loop()
+        scheduler = cls._schedulers.get(loop)
+        if scheduler is None:
+            scheduler = cls._schedulers[loop] = cls(loop)
+        return scheduler
+
+    def __len__(self) -> int:
+        return len(self._due)
+
+    def add(self, tick: KeepaliveTick, due: float) -> None:
+        """Call `tick` at loop time `due`, replaces an earlier entry of it."""
+        self._due[tick] = due
+        heapq.heappush(self._heap, (due, next(self._order), tick))
+        if self._timer is None or due < self._timer.when():
+            self._arm(due)
+
+    def discard(self, tick: KeepaliveTick) -> None:
+        # The heap entry goes stale and is skipped when it comes up
+        self._due.pop(tick, None)
+
+    def _arm(self, when: float) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+        self._timer = self._loop.call_at(when, self._fire)
+
+    def _fire(self) -> None:
+        self._timer = None
+        self.wakeups += 1
+        now = self._loop.time()
+        heap = self._heap
+
+        due_ticks = []
+        while heap and heap[0][0] <= now + self.resolution:
+            due, _, tick = heapq.heappop(heap)
+            if self._due.get(tick) == due:
+                del self._due[tick]
+                due_ticks.append(tick)
+
+        for tick in due_ticks:
+            try:
+                next_due = tick(now)
+            except Exception as e:
+                logger.error(f"Keepalive failed: {e!r}")
+                continue
+            if next_due is not None and tick not in self._due:
+                self._due[tick] = next_due
+                heapq.heappush(heap, (next_due, next(self._order), tick))
+
+        # Stale entries of discarded links are not worth a wakeup
+        while heap and self._due.get(heap[0][2]) != heap[0][0]:
+            heapq.heappop(heap)
+        if heap and (self._timer is None or heap[0][0] < self._timer.when()):
+            self._arm(heap[0][0])
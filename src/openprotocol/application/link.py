@@ -0,0 +1,141 @@
+import logging
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+
+from openprotocol.core.message import OpenProtocolRawMessage
+
+logger = logging.getLogger(__name__)
+
+LINK_ACK_MID = 9997
+LINK_NACK_MID = 9998
+
+
+@dataclass
+class _InFlight:
+    frame: bytes
+    polls: int = 0
+    retransmits: int = 0
+
+
+class LinkLayer:
+    """
+    Sans-IO link level acknowledgement: sequence numbers, MID 9997/9998,
+    retransmission and duplicate suppression.
+
+    Outgoing frames get sequence numbers 1..99 (wrapping) in their header.
+    Up to `window` of them may wait for their link ACK at the same time, the
+    spec's stop-and-wait is a window of 1; the rest waits in a backlog. A
+    frame still unacknowledged after its second poll() or NACKed by the peer
+    is written again, `max_retransmits` times at most.
+
+    Received frames with a sequence number are ACKed. A sequence number among
+    the last SEQ_MAX // 2 received, the largest window of the peer, is a
+    retransmission of a frame whose ACK was lost, in order or not: ACKed
+    again and dropped. Link ACK/NACK frames never reach the MID registry.
+    """
+
+    SEQ_MAX = 99
+
+    def __init__(
+        self, window: int = 1, max_retransmits: int = 3, poll_interval: float = 0.5
+    ):
+        """
+        :param poll_interval: seconds between poll() calls of the driver, a
+                frame is retransmitted after one to two intervals
+        """
+        # Half the sequence space keeps retransmissions apart from new frames
+        if not 1 <= window <= self.SEQ_MAX // 2:
+            raise ValueError(f"window must be between 1 and {self.SEQ_MAX // 2}")
+        self.window = window
+        self.max_retransmits = max_retransmits
+        self.poll_interval = poll_interval
+        self.retransmits = 0
+        self.duplicates = 0
+        self._next_seq = 1
+        self._in_flight: OrderedDict[int, _InFlight] = OrderedDict()
+        self._backlog: deque[bytes] = deque()
+        # Sequence numbers received recently, oldest first
+        self._received: OrderedDict[int, None] = OrderedDict()
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._in_flight)
+
+    def send(self, frame: bytes) -> list[bytes]:
+        """Queue an outgoing frame, returns the frames to write now."""
+        self._backlog.append(frame)
+        return self._release()
+
+    def receive(self, frame: bytes) -> tuple[bool, list[bytes]]:
+        """
+        Process a received frame. Returns whether it is to be delivered and
+        the frames to write: link ACKs and frames released or retransmitted.
+        """
+        mid = int(frame[4:8])
+        seq = _parse_seq(frame)
+        if mid == LINK_ACK_MID:
+            if seq is not None:
+                self._in_flight.pop(seq, None)
+            return False, self._release()
+        if mid == LINK_NACK_MID:
+            logger.warning(f"Link NACK of sequence number {seq}: {frame[24:28]!r}")
+            return False, self._retransmit(seq)
+        if seq is None:
+            # Peer does not use link level acknowledgement
+            return True, []
+
+        ack = OpenProtocolRawMessage(LINK_ACK_MID, 1, f"{mid:04}", seq_no=seq).encode()
+        if seq in self._received:
+            self.duplicates += 1
+            return False, [ack]
+        self._received[seq] = None
+        if len(self._received) > self.SEQ_MAX // 2:
+            self._received.popitem(last=False)
+        return True, [ack]
+
+    def poll(self) -> list[bytes]:
+        """
+        Frames to retransmit, to be called every `poll_interval` seconds.
+        Raises ConnectionError once a frame ran out of retransmissions.
+        """
+        frames: list[bytes] = []
+        for seq, entry in list(self._in_flight.items()):
+            entry.polls += 1
+            if entry.polls >= 2:
+                frames += self._retransmit(seq)
+        return frames
+
+    def clear(self) -> None:
+        self._in_flight.clear()
+        self._backlog.clear()
+        self._received.clear()
+        self._next_seq = 1
+
+    def _release(self) -> list[bytes]:
+        frames = []
+        while self._backlog and len(self._in_flight) < self.window:
+            seq = self._next_seq
+            self._next_seq = seq % self.SEQ_MAX + 1
+            raw = self._backlog.popleft()
+            frame = raw[:16] + b"%02d" % seq + raw[18:]
+            self._in_flight[seq] = _InFlight(frame)
+            frames.append(frame)
+        return frames
+
+    def _retransmit(self, seq: int | None) -> list[bytes]:
+        entry = self._in_flight.get(seq) if seq is not None else None
+        if entry is None:
+            return []
+        if entry.retransmits >= self.max_retransmits:
+            raise ConnectionError(
+                f"Frame {seq} not acknowledged after {entry.retransmits} retransmissions"
+            )
+        entry.retransmits += 1
+        entry.polls = 0
+        self.retransmits += 1
+        return [entry.frame]
+
+
+def _parse_seq(frame: bytes) -> int | None:
+    seq = frame[16:18]
+    return None if seq.strip() == b"" else int(seq)
@@ -0,0 +1,234 @@
+import logging
+from typing import Any, ClassVar, Collection
+
+from openprotocol.application import batch
+from openprotocol.application.base_messages import (
+    OpenProtocolEvent,
+    OpenProtocolEventACK,
+    OpenProtocolEventSubscribe,
+    OpenProtocolEventUnsubscribe,
+)
+from openprotocol.application.parser import (
+    FieldSpec,
+    GroupTable,
+    ParsePlan,
+    RepeatedGroup,
+)
+from openprotocol.core.message import OpenProtocolRawMessage
+from openprotocol.core.mid_base import Decoder, OpenProtocolMessage
+
+logger = logging.getLogger(__name__)
+
+
+def _marker(number: str, start: int) -> FieldSpec:
+    return FieldSpec(
+        None, start, start + 2, parser=str, validator=lambda x: x == number
+    )
+
+
+def _hundredths(s: str) -> float:
+    return float(s) / 100.0
+
+
+class MultiSpindleResultSubscribe(OpenProtocolEventSubscribe):
+    __slots__ = ()
+
+    MID = 100
+    REVISION = 1
+    CONSTANT_FRAME = True
+    MID_EVENT = 101
+
+    def __init__(self) -> None:
+        super().__init__(self.REVISION)
+
+    def encode(self) -> OpenProtocolRawMessage:
+        return self.create_message(self.REVISION)
+
+    @classmethod
+    def from_message(cls, msg: OpenProtocolRawMessage) -> "OpenProtocolMessage":
+        return cls()
+
+
+class MultiSpindleResult(OpenProtocolEvent):
+    """
+    Result of a synchronized tightening of several spindles.
+
+    The common fields are attributes, the per-spindle results one GroupTable
+    in `spindles` with the columns spindle, channel_id, overall_status,
+    torque_status, torque, angle_status and angle. With numpy installed the
+    numeric columns are decoded into arrays in one vectorized pass.
+    """
+
+    __slots__ = (
+        "spindle_count",
+        "vin_number",
+        "job_id",
+        "pset_number",
+        "batch_size",
+        "batch_counter",
+        "batch_status",
+        "torque_min_limit",
+        "torque_max_limit",
+        "torque_final_target",
+        "angle_min",
+        "angle_max",
+        "final_angle_target",
+        "last_pset_change",
+        "timestamp",
+        "sync_tightening_id",
+        "sync_overall_status",
+        "spindles",
+    )
+
+    MID = 101
+
+    def __init__(self, revision: int):
+        super().__init__(revision)
+        self.spindle_count = 0
+        self.vin_number = ""
+        self.job_id = 0
+        self.pset_number = 0
+        self.batch_size = 0
+        self.batch_counter = 0
+        self.batch_status = 0
+        self.torque_min_limit: float = 0.0
+        self.torque_max_limit: float = 0.0
+        self.torque_final_target: float = 0.0
+        self.angle_min = 0
+        self.angle_max = 0
+        self.final_angle_target = 0
+        self.last_pset_change = ""
+        self.timestamp = ""
+        self.sync_tightening_id = 0
+        self.sync_overall_status = 0
+        self.spindles = GroupTable({}, 0)
+
+    _PLAN_REV1: ClassVar[ParsePlan] = ParsePlan(
+        [
+            _marker("01", 20),
+            FieldSpec("spindle_count", 22, 24, parser=int),
+            _marker("02", 24),
+            FieldSpec("vin_number", 26, 51, parser=str.strip),
+            _marker("03", 51),
+            FieldSpec("job_id", 53, 55, parser=int),
+            _marker("04", 55),
+            FieldSpec("pset_number", 57, 60, parser=int),
+            _marker("05", 60),
+            FieldSpec("batch_size", 62, 66, parser=int),
+            _marker("06", 66),
+            FieldSpec("batch_counter", 68, 72, parser=int),
+            _marker("07", 72),
+            FieldSpec("batch_status", 74, 75, parser=int),
+            _marker("08", 75),
+            FieldSpec("torque_min_limit", 77, 83, parser=_hundredths),
+            _marker("09", 83),
+            FieldSpec("torque_max_limit", 85, 91, parser=_hundredths),
+            _marker("10", 91),
+            FieldSpec("torque_final_target", 93, 99, parser=_hundredths),
+            _marker("11", 99),
+            FieldSpec("angle_min", 101, 106, parser=int),
+            _marker("12", 106),
+            FieldSpec("angle_max", 108, 113, parser=int),
+            _marker("13", 113),
+            FieldSpec("final_angle_target", 115, 120, parser=int),
+            _marker("14", 120),
+            FieldSpec("last_pset_change", 122, 141, parser=str.strip),
+            _marker("15", 141),
+            FieldSpec("timestamp", 143, 162, parser=str.strip),
+            _marker("16", 162),
+            FieldSpec("sync_tightening_id", 164, 169, parser=int),
+            _marker("17", 169),
+            FieldSpec("sync_overall_status", 171, 172, parser=int),
+            _marker("18", 172),
+        ]
+    )
+
+    # One 18 character entry per spindle after the common fields
+    _SPINDLES_REV1: ClassVar[RepeatedGroup] = RepeatedGroup(
+        "spindles",
+        174,
+        18,
+        "spindle_count",
+        [
+            FieldSpec("spindle", 0, 2, parser=int),
+            FieldSpec("channel_id", 2, 4, parser=int),
+            FieldSpec("overall_status", 4, 5, parser=int),
+            FieldSpec("torque_status", 5, 6, parser=int),
+            FieldSpec("torque", 6, 12, parser=_hundredths),
+            FieldSpec("angle_status", 12, 13, parser=int),
+            FieldSpec("angle", 13, 18, parser=int),
+        ],
+        numeric={
+            "spindle": 1,
+            "channel_id": 1,
+            "overall_status": 1,
+            "torque_status": 1,
+            "torque": 100.0,
+            "angle_status": 1,
+            "angle": 1,
+        },
+    )
+
+    @classmethod
+    def from_message(cls, msg: OpenProtocolRawMessage) -> "MultiSpindleResult":
+        if msg.revision != 1:
+            raise NotImplementedError(f"Not supported revision {msg.revision}")
+        return cls._decode_rev1(msg)
+
+    @classmethod
+    def decoders(cls) -> list[tuple[range, Decoder]]:
+        return [(range(1, 2), cls._decode_rev1)]
+
+    @classmethod
+    def _decode_rev1(cls, msg: OpenProtocolRawMessage) -> "MultiSpindleResult":
+        msg_obj = cls(msg.revision)
+        cls._PLAN_REV1.apply(msg, msg_obj)
+        group = cls._SPINDLES_REV1
+        count = getattr(msg_obj, group.count_field)
+        if batch.np is not None:
+            table = batch.decode_group(msg.raw, group, count)
+        else:
+            table = group.parse(msg.raw_str, count)
+        setattr(msg_obj, group.name, table)
+        return msg_obj
+
+    def spindle(self, spindle_id: int) -> dict[str, Any]:
+        """Result of one spindle, KeyError if it is not part of the result."""
+        for index, number in enumerate(self.spindles.columns.get("spindle", ())):
+            if number == spindle_id:
+                return self.spindles.row(index)
+        raise KeyError(f"No result of spindle {spindle_id}")
+
+    def spindle_ids(self) -> Collection[int] | None:
+        return {int(number) for number in self.spindles.columns.get("spindle", ())}
+
+    def encode(self) -> OpenProtocolRawMessage:
+        raise NotImplementedError("Not implemented")
+
+
+class MultiSpindleResultACK(OpenProtocolEventACK):
+    __slots__ = ()
+
+    MID = 102
+    MID_EVENT = 101
+    REVISION = 1
+    CONSTANT_FRAME = True
+
+    def encode(self) -> OpenProtocolRawMessage:
+        return self.create_message(self.REVISION)
+
+
+class MultiSpindleResultUnsubscribe(OpenProtocolEventUnsubscribe):
+    __slots__ = ()
+
+    MID = 103
+    REVISION = 1
+    CONSTANT_FRAME = True
+    MID_EVENT = 101
+
+    def encode(self) -> OpenProtocolRawMessage:
+        return self.create_message(self.REVISION)
+
+    @classmethod
+    def from_message(cls, msg: OpenProtocolRawMessage) -> "OpenProtocolMessage":
+        return cls()
@@ -1,8 +1,12 @@
+from collections.abc import Hashable
+
 from openprotocol.application.base_messages import OpenProtocolCommandMsg
 from openprotocol.core.message import OpenProtocolRawMessage
 
 
 class SelectParameterSet(OpenProtocolCommandMsg):
+    __slots__ = ("_id_set",)
+
     MID = 18
     REVISION = 1
 
@@ -10,5 +14,8 @@ class SelectParameterSet(OpenProtocolCommandMsg):
         super().__init__(self.REVISION)
         self._id_set = id_set
 
+    def frame_key(self) -> Hashable:
+        return (self._id_set,)
+
     def encode(self) -> OpenProtocolRawMessage:
         return self.create_message(self.REVISION, str(self._id_set).zfill(3))
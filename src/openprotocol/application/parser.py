@@ -1,5 +1,7 @@
+from bisect import bisect_left
 from dataclasses import dataclass
-from typing import Callable, Any, List
+from operator import itemgetter
+from typing import Callable, Any, Iterable, List, Mapping, Sequence
 
 from openprotocol.core.message import OpenProtocolRawMessage
 
@@ -23,6 +25,24 @@ class FieldSpec:
         self.validator = validator
 
 
+def parse_field(field_spec: FieldSpec, substr: str) -> Any:
+    """Parse and validate one already stripped field value."""
+    try:
+        if not substr and field_spec.default is not None:
+            value = field_spec.default
+        else:
+            value = field_spec.parser(substr)
+    except Exception as e:
+        raise ValueError(f"Failed to parse field {field_spec.name}: {e}") from e
+
+    if field_spec.validator and value is not None:
+        if not field_spec.validator(value):
+            raise ValueError(
+                f"Validation failed for field '{field_spec.name}', got {value}"
+            )
+    return value
+
+
 def parse_message(
     msg: OpenProtocolRawMessage, obj: object, fields: List[FieldSpec]
 ) -> None:
@@ -36,19 +56,175 @@ def parse_message(
         if msg_len <= field_spec.end:
             break
 
-        try:
-            substr = raw[field_spec.start : min(field_spec.end, msg_len)].strip()
-            if not substr and field_spec.default is not None:
-                value = field_spec.default
-            else:
-                value = field_spec.parser(substr)
-        except Exception as e:
-            raise ValueError(f"Failed to parse field {field_spec.name}: {e}") from e
-
-        if field_spec.validator and value is not None:
-            if not field_spec.validator(value):
-                raise ValueError(
-                    f"Validation failed for field '{field_spec.name}', got {value}"
-                )
+        substr = raw[field_spec.start : min(field_spec.end, msg_len)].strip()
+        value = parse_field(field_spec, substr)
         if field_spec.name:
             setattr(obj, field_spec.name, value)
+
+
+class ParsePlan:
+    """
+    Immutable parse plan compiled once from a FieldSpec list.
+
+    Fields are sorted once, every usable prefix of fields (fields ending before
+    the frame end) gets its own itemgetter slicing all of them in one call, and
+    parsed values are assigned to the object in one batch. The result is the
+    same as parse_message with the same fields.
+    """
+
+    __slots__ = ("fields", "positions", "checks", "_steps", "_limits", "_extractors")
+
+    def __init__(self, fields: Iterable[FieldSpec]):
+        self.fields: tuple[FieldSpec, ...] = tuple(
+            sorted(fields, key=lambda f: f.start)
+        )
+        self.positions: dict[str, int] = {
+            f.name: i for i, f in enumerate(self.fields) if f.name
+        }
+        # Unnamed fields are only validated (e.g. field number markers)
+        self.checks: tuple[int, ...] = tuple(
+            i for i, f in enumerate(self.fields) if not f.name
+        )
+        self._steps = tuple(
+            (f.name, f.parser, f.default, f.validator) for f in self.fields
+        )
+
+        # limits[i] = furthest end of fields[0..i], the i-th field is usable
+        # only if the whole prefix up to it fits into the frame
+        limits = []
+        limit = -1
+        for field_spec in self.fields:
+            limit = max(limit, field_spec.end)
+            limits.append(limit)
+        self._limits = tuple(limits)
+
+        extractors: list[Callable[[str], tuple[str, ...]]] = [lambda raw: ()]
+        for count in range(1, len(self.fields) + 1):
+            getter = itemgetter(*(slice(f.start, f.end) for f in self.fields[:count]))
+            if count == 1:
+                extractors.append(lambda raw, getter=getter: (getter(raw),))
+            else:
+                extractors.append(getter)
+        self._extractors = tuple(extractors)
+
+    def __len__(self) -> int:
+        return len(self.fields)
+
+    def usable_fields(self, msg_len: int) -> int:
+        """Number of leading fields available in a frame of `msg_len` chars."""
+        return bisect_left(self._limits, msg_len)
+
+    def parse(self, raw: str) -> dict[str, Any]:
+        """Parse fields of a raw frame into a name → value mapping."""
+        values: dict[str, Any] = {}
+        substrings = self._extractors[self.usable_fields(len(raw))](raw)
+        for (name, parser, default, validator), substr in zip(self._steps, substrings):
+            try:
+                substr = substr.strip()
+                if not substr and default is not None:
+                    value = default
+                else:
+                    value = parser(substr)
+            except Exception as e:
+                raise ValueError(f"Failed to parse field {name}: {e}") from e
+
+            if validator and value is not None:
+                if not validator(value):
+                    raise ValueError(
+                        f"Validation failed for field '{name}', got {value}"
+                    )
+            if name:
+                values[name] = value
+        return values
+
+    def apply(self, msg: OpenProtocolRawMessage, obj: object) -> None:
+        """Parse fields from raw message into object attributes."""
+        # Parsed values are assigned only after all fields were parsed and
+        # validated, slotted messages have no __dict__ to update at once
+        for name, value in self.parse(msg.raw_str).items():
+            setattr(obj, name, value)
+
+
+class GroupTable:
+    """
+    Entries of a repeated group by column: one sequence of values per named
+    field (NumPy arrays for numeric fields when decoded by decode_group), no
+    object per entry.
+    """
+
+    __slots__ = ("columns", "_count")
+
+    def __init__(self, columns: dict[str, Sequence[Any]], count: int):
+        self.columns = columns
+        self._count = count
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, name: str) -> Sequence[Any]:
+        return self.columns[name]
+
+    def row(self, index: int) -> dict[str, Any]:
+        """Values of one entry, built on request."""
+        if not -self._count <= index < self._count:
+            raise IndexError(f"Entry {index} out of range for {self._count} entries")
+        return {name: column[index] for name, column in self.columns.items()}
+
+
+class RepeatedGroup:
+    """
+    Block of equally wide entries following the fixed fields, e.g. one per
+    spindle, with the number of entries in the field `count_field`.
+
+    Field offsets are relative to the start of an entry. parse() decodes the
+    block column by column into a GroupTable; `numeric` names the digit-only
+    fields and their divisor for the vectorized decode_group().
+    """
+
+    __slots__ = ("name", "start", "width", "count_field", "fields", "numeric")
+
+    def __init__(
+        self,
+        name: str,
+        start: int,
+        width: int,
+        count_field: str,
+        fields: Iterable[FieldSpec],
+        numeric: Mapping[str, float] | None = None,
+    ):
+        self.name = name
+        self.start = start
+        self.width = width
+        self.count_field = count_field
+        self.fields: tuple[FieldSpec, ...] = tuple(
+            sorted(fields, key=lambda f: f.start)
+        )
+        if any(f.end > width for f in self.fields):
+            raise ValueError(f"Field of group {name} ends beyond the entry")
+        self.numeric: Mapping[str, float] = numeric or {}
+
+    def end(self, count: int) -> int:
+        """Offset after `count` entries."""
+        return self.start + count * self.width
+
+    def check(self, frame_len: int, count: int) -> None:
+        if count < 0 or frame_len < self.end(count):
+            raise ValueError(
+                f"Group {self.name} of {count} entries ends at {self.end(count)}, "
+                f"frame length {frame_len}"
+            )
+
+    def parse(self, raw: str, count: int) -> GroupTable:
+        """Decode `count` entries of a raw frame."""
+        self.check(len(raw), count)
+        end = self.end(count)
+        columns: dict[str, Sequence[Any]] = {}
+        for spec in self.fields:
+            width = spec.end - spec.start
+            values = tuple(
+                parse_field(spec, raw[pos : pos + width].strip())
+                for pos in range(self.start + spec.start, end, self.width)
+            )
+            if spec.name:
+                columns[spec.name] = values
+        return GroupTable(columns, count)
@@ -0,0 +1,41 @@
+import random
+from dataclasses import dataclass
+from typing import Iterator
+
+
+@dataclass(frozen=True)
+class ReconnectPolicy:
+    """
+    Backoff of OpenProtocolClient reconnect attempts.
+
+    The delay before an attempt starts at `initial_delay` and grows by
+    `multiplier` up to `max_delay`, which bounds the time between the
+    controller coming back and the client noticing it. A random part of up to
+    `jitter` of each delay is taken off, so the clients of a line do not
+    reconnect in lockstep. `max_attempts` None retries forever.
+    """
+
+    initial_delay: float = 0.5
+    max_delay: float = 30.0
+    multiplier: float = 2.0
+    jitter: float = 0.5
+    max_attempts: int | None = None
+
+    def __post_init__(self) -> None:
+        if self.initial_delay < 0 or self.max_delay < self.initial_delay:
+            raise ValueError(
+                f"Invalid delays: initial {self.initial_delay}, max {self.max_delay}"
+            )
+        if self.multiplier < 1:
+            raise ValueError(f"multiplier must be at least 1: {self.multiplier}")
+        if not 0 <= self.jitter <= 1:
+            raise ValueError(f"jitter must be between 0 and 1: {self.jitter}")
+
+    def delays(self) -> Iterator[float]:
+        """Delay before each attempt."""
+        delay = self.initial_delay
+        attempt = 0
+        while self.max_attempts is None or attempt < self.max_attempts:
+            yield delay * (1 - self.jitter * random.random())
+            delay = min(delay * self.multiplier, self.max_delay)
+            attempt += 1
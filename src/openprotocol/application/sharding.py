@@ -0,0 +1,403 @@
+import asyncio
+import logging
+import multiprocessing
+import os
+import pickle
+import struct
+from dataclasses import dataclass
+from multiprocessing.connection import Connection
+from multiprocessing.process import BaseProcess
+from typing import Any, Callable, Iterable, Type
+
+from openprotocol.application.base_messages import OpenProtocolEventSubscribe
+from openprotocol.application.connection import AckMode
+from openprotocol.application.event_queue import EventQueue
+from openprotocol.application.fleet import (
+    ControllerFleet,
+    ControllerHealth,
+    Endpoint,
+    TaggedEvent,
+)
+from openprotocol.application.reconnect import ReconnectPolicy
+
+logger = logging.getLogger(__name__)
+
+# Length prefix of the pickled messages on a worker's pipe
+_HEADER = struct.Struct("!Q")
+_READ_SIZE = 1 << 20
+
+
+def assign_shards(
+    endpoints: Iterable[Endpoint | tuple[str, int]], workers: int
+) -> list[list[Endpoint]]:
+    """Endpoints of each worker, round robin in the given order."""
+    if workers < 1:
+        raise ValueError(f"workers must be at least 1: {workers}")
+    shards: list[list[Endpoint]] = [[] for _ in range(workers)]
+    for index, endpoint in enumerate(endpoints):
+        if not isinstance(endpoint, Endpoint):
+            endpoint = Endpoint(*endpoint)
+        shards[index % workers].append(endpoint)
+    return shards
+
+
+@dataclass(frozen=True)
+class ShardOptions:
+    """Settings of the ControllerFleet of each worker, sent to the process."""
+
+    subscriptions: tuple[Type[OpenProtocolEventSubscribe], ...] = ()
+    max_parallel: int = 32
+    stagger: float = 0.005
+    reconnect: ReconnectPolicy | None = None
+    keepalive_interval: float = 10.0
+    # Events forwarded to the parent in one pickled batch at most, and the
+    # longest time an event waits for its batch
+    batch_size: int = 1000
+    batch_interval: float = 0.05
+    metrics_interval: float = 1.0
+    # Module level function run first in each worker, e.g. to register
+    # custom message classes
+    setup: Callable[[], None] | None = None
+
+
+class _PipeWriter:
+    """
+    Worker end of the pipe. Messages are written from the event loop as far
+    as the pipe takes them, the rest waits in a buffer until it is writable.
+    """
+
+    def __init__(self, fd: int):
+        self._fd = fd
+        os.set_blocking(fd, False)
+        self._buffer = bytearray()
+        self._writing = False
+        self._drained: asyncio.Future | None = None
+        self._error: OSError | None = None
+
+    def send(self, item: Any) -> None:
+        """Queue one message to the parent."""
+        data = pickle.dumps(item, pickle.HIGHEST_PROTOCOL)
+        self._buffer += _HEADER.pack(len(data))
+        self._buffer += data
+        if not self._writing:
+            self._write()
+
+    async def drain(self) -> None:
+        """Wait until all messages are written, raises if the parent is gone."""
+        if self._buffer:
+            self._drained = asyncio.get_running_loop().create_future()
+            await self._drained
+        if self._error is not None:
+            raise self._error
+
+    def _write(self) -> None:
+        try:
+            del self._buffer[: os.write(self._fd, self._buffer)]
+        except BlockingIOError:
+            pass
+        except OSError as e:
+            self._error = e
+            self._buffer.clear()
+
+        loop = asyncio.get_running_loop()
+        if self._buffer:
+            if not self._writing:
+                loop.add_writer(self._fd, self._write)
+                self._writing = True
+            return
+        if self._writing:
+            loop.remove_writer(self._fd)
+            self._writing = False
+        if self._drained is not None and not self._drained.done():
+            self._drained.set_result(None)
+
+
+def _run_shard(
+    shard: int,
+    endpoints: list[Endpoint],
+    options: ShardOptions,
+    conn: Connection,
+    stop: Any,
+) -> None:
+    """Entry point of a worker process."""
+    if options.setup is not None:
+        options.setup()
+    try:
+        asyncio.run(_shard_loop(shard, endpoints, options, conn, stop))
+    finally:
+        conn.close()
+
+
+async def _shard_loop(
+    shard: int,
+    endpoints: list[Endpoint],
+    options: ShardOptions,
+    conn: Connection,
+    stop: Any,
+) -> None:
+    fleet = ControllerFleet(
+        endpoints,
+        max_parallel=options.max_parallel,
+        stagger=options.stagger,
+        reconnect=options.reconnect,
+        keepalive_interval=options.keepalive_interval,
+        # ACKed once forwarded, the controllers send again what a dying
+        # worker had not passed on
+        ack_mode=AckMode.DEFERRED,
+    )
+    writer = _PipeWriter(conn.fileno())
+    connected = await fleet.start()
+    for mid_cls in options.subscriptions:
+        await fleet.subscribe(mid_cls)
+    writer.send(("ready", connected))
+
+    loop = asyncio.get_running_loop()
+    next_metrics = loop.time()
+    while not stop.is_set():
+        try:
+            events = await fleet.get_many(options.batch_size, options.batch_interval)
+        except ConnectionError:
+            # All controllers gone for good, only metrics are left to report
+            events = []
+            await asyncio.sleep(options.batch_interval)
+        if events:
+            # One pickled message per batch
+            writer.send(("events", events))
+            await writer.drain()
+            fleet.confirm(*events)
+        if loop.time() >= next_metrics:
+            writer.send(("health", fleet.health()))
+            next_metrics = loop.time() + options.metrics_interval
+
+    await fleet.stop()
+    try:
+        rest = await fleet.get_many(options.batch_size, 0)
+        while rest:
+            writer.send(("events", rest))
+            rest = await fleet.get_many(options.batch_size, 0)
+    except ConnectionError:
+        pass
+    writer.send(("health", fleet.health()))
+    await writer.drain()
+
+
+class ShardedFleet:
+    """
+    Controllers spread over worker processes, each running a ControllerFleet
+    on its own event loop, so decoding and protocol handling use several
+    cores.
+
+    Workers send their events in pickled batches of up to `batch_size`, and
+    the health of their controllers every `metrics_interval` seconds, over
+    one pipe per worker. Both ends use the pipes from their event loops
+    without blocking. The parent unpickles complete messages in callbacks of
+    their own and offers one merged stream of TaggedEvent, as ControllerFleet
+    does.
+
+    Endpoints are assigned to workers round robin once. A worker which dies
+    is started again after `restart_delay` with the same endpoints. Workers
+    ACK events (AckMode.DEFERRED) only once they are written to the pipe, so
+    the controllers send the events a dying worker had not forwarded again.
+    """
+
+    def __init__(
+        self,
+        endpoints: Iterable[Endpoint | tuple[str, int]],
+        workers: int | None = None,
+        options: ShardOptions | None = None,
+        event_queue: EventQueue | None = None,
+        restart_delay: float = 1.0,
+    ):
+        """
+        :param workers: number of processes, one per CPU by default
+        :param event_queue: merged queue with its bound and overflow policy,
+                unbounded by default
+        """
+        workers = workers or multiprocessing.cpu_count()
+        self.shards: list[list[Endpoint]] = assign_shards(endpoints, workers)
+        self.options = options or ShardOptions()
+        self.restart_delay = restart_delay
+        self.restarts: list[int] = [0] * workers
+        self._queue: EventQueue = event_queue or EventQueue()
+        # Workers are started fresh, without copies of the parent's loop
+        self._context = multiprocessing.get_context("spawn")
+        self._stop = self._context.Event()
+        self._processes: list[BaseProcess | None] = [None] * workers
+        self._conns: list[Connection | None] = [None] * workers
+        self._buffers: list[bytearray] = [bytearray() for _ in range(workers)]
+        self._ready: list[asyncio.Future] = []
+        self._exited: list[asyncio.Future] = []
+        self._health: dict[str, ControllerHealth] = {}
+        self._restart_tasks: set[asyncio.Task] = set()
+        self._stopping = False
+
+    def __len__(self) -> int:
+        return sum(len(shard) for shard in self.shards)
+
+    def shard_of(self, tag: str) -> int:
+        for shard, endpoints in enumerate(self.shards):
+            if any(endpoint.tag == tag for endpoint in endpoints):
+                return shard
+        raise KeyError(tag)
+
+    async def start(self, timeout: float = 60.0) -> int:
+        """
+        Start all workers and wait until their controllers are started,
+        returns the number of controllers connected.
+        """
+        self._stopping = False
+        self._stop.clear()
+        loop = asyncio.get_running_loop()
+        self._ready = [loop.create_future() for _ in self.shards]
+        self._exited = [loop.create_future() for _ in self.shards]
+        for shard in range(len(self.shards)):
+            self._spawn(shard)
+        async with asyncio.timeout(timeout):
+            return sum(await asyncio.gather(*self._ready))
+
+    def _spawn(self, shard: int) -> None:
+        receiver, sender = self._context.Pipe(duplex=False)
+        process = self._context.Process(
+            target=_run_shard,
+            args=(shard, self.shards[shard], self.options, sender, self._stop),
+            name=f"openprotocol-shard-{shard}",
+            daemon=True,
+        )
+        process.start()
+        # Only the worker writes, its exit closes the pipe
+        sender.close()
+        self._processes[shard] = process
+        self._conns[shard] = receiver
+        self._buffers[shard] = bytearray()
+        os.set_blocking(receiver.fileno(), False)
+        asyncio.get_running_loop().add_reader(receiver.fileno(), self._receive, shard)
+
+    def _receive(self, shard: int) -> None:
+        """
+        Take what the pipe holds without waiting for the rest of a message,
+        complete messages are decoded by callbacks of their own.
+        """
+        conn = self._conns[shard]
+        assert conn is not None
+        try:
+            data = os.read(conn.fileno(), _READ_SIZE)
+        except BlockingIOError:
+            return
+        except OSError:
+            data = b""
+        if not data:
+            self._worker_exited(shard)
+            return
+
+        buffer = self._buffers[shard]
+        buffer += data
+        loop = asyncio.get_running_loop()
+        start = 0
+        while len(buffer) - start >= _HEADER.size:
+            (size,) = _HEADER.unpack_from(buffer, start)
+            end = start + _HEADER.size + size
+            if len(buffer) < end:
+                break
+            loop.call_soon(self._handle, shard, bytes(buffer[end - size : end]))
+            start = end
+        del buffer[:start]
+
+    def _handle(self, shard: int, data: bytes) -> None:
+        kind, payload = pickle.loads(data)
+        if kind == "events":
+            for event in payload:
+                self._queue.put_nowait(event)
+        elif kind == "health":
+            self._health.update(payload)
+        elif kind == "ready":
+            if not self._ready[shard].done():
+                self._ready[shard].set_result(payload)
+
+    def _worker_exited(self, shard: int) -> None:
+        loop = asyncio.get_running_loop()
+        conn = self._conns[shard]
+        assert conn is not None
+        loop.remove_reader(conn.fileno())
+        conn.close()
+        self._conns[shard] = None
+        if self._stopping:
+            if not self._exited[shard].done():
+                self._exited[shard].set_result(None)
+            return
+        logger.error(f"Worker of shard {shard} died, restarting it")
+        task = loop.create_task(self._restart(shard))
+        self._restart_tasks.add(task)
+        task.add_done_callback(self._restart_tasks.discard)
+
+    async def _restart(self, shard: int) -> None:
+        process = self._processes[shard]
+        if process is not None:
+            await asyncio.to_thread(process.join)
+            logger.warning(f"Shard {shard} exit code {process.exitcode}")
+        await asyncio.sleep(self.restart_delay)
+        if self._stopping:
+            self._exited[shard].set_result(None)
+            return
+        self.restarts[shard] += 1
+        if self._ready[shard].done():
+            # A worker lost during startup keeps the future start() waits for
+            self._ready[shard] = asyncio.get_running_loop().create_future()
+        self._spawn(shard)
+
+    async def wait_ready(self, shard: int, timeout: float = 60.0) -> int:
+        """Wait until the (restarted) worker of `shard` started its controllers."""
+        async with asyncio.timeout(timeout):
+            return await asyncio.shield(self._ready[shard])
+
+    async def stop(self, timeout: float = 10.0) -> None:
+        """Stop the workers, which disconnect their controllers first."""
+        self._stopping = True
+        self._stop.set()
+        try:
+            async with asyncio.timeout(timeout):
+                await asyncio.gather(*self._exited)
+        except TimeoutError:
+            logger.error("Workers did not stop in time, terminating them")
+        for process in self._processes:
+            if process is not None and process.is_alive():
+                process.terminate()
+        for process in self._processes:
+            if process is not None:
+                await asyncio.to_thread(process.join)
+        for shard, conn in enumerate(self._conns):
+            if conn is not None:
+                asyncio.get_running_loop().remove_reader(conn.fileno())
+                conn.close()
+                self._conns[shard] = None
+        self._queue.close()
+
+    def workers_alive(self) -> list[bool]:
+        return [p is not None and p.is_alive() for p in self._processes]
+
+    async def get(self) -> TaggedEvent:
+        """Next event of any controller."""
+        item = await self._queue.get()
+        if item is None:
+            self._queue.close()
+            raise ConnectionError("Sharded fleet stopped")
+        return item
+
+    async def get_many(
+        self, max_items: int = 1000, max_wait: float = 0.1
+    ) -> list[TaggedEvent]:
+        """Batch of events of all workers, see EventQueue.get_many()."""
+        items = await self._queue.get_many(max_items, max_wait)
+        if not items and self._queue.closed:
+            raise ConnectionError("Sharded fleet stopped")
+        return items
+
+    def health(self) -> dict[str, ControllerHealth]:
+        """Health of every controller as last reported by its worker."""
+        return dict(self._health)
+
+    async def __aenter__(self) -> "ShardedFleet":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.stop()
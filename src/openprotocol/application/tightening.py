@@ -1,6 +1,8 @@
 import logging
 import string
 from enum import Enum, verify, UNIQUE
+from functools import partial
+from typing import Any, Callable, ClassVar, Iterable
 
 from openprotocol.application.base_messages import (
     OpenProtocolEventSubscribe,
@@ -8,16 +10,31 @@ from openprotocol.application.base_messages import (
     OpenProtocolEventACK,
     OpenProtocolEventUnsubscribe,
 )
-from openprotocol.application.parser import FieldSpec, parse_message
+from openprotocol.application.batch import ColumnBatch, decode_batch
+from openprotocol.application.parser import FieldSpec, ParsePlan, parse_field
 from openprotocol.core.message import OpenProtocolRawMessage
-from openprotocol.core.mid_base import OpenProtocolMessage
+from openprotocol.core.mid_base import Decoder, OpenProtocolMessage
 
 logger = logging.getLogger(__name__)
 
 
+# ASCII characters outside string.printable, dropped from text fields
+_NON_PRINTABLE = {c: None for c in range(128) if chr(c) not in string.printable}
+
+
+def _enum_parser(enum_cls: type[Enum]) -> Callable[[str], Any]:
+    def parse(s: str) -> Any:
+        return enum_cls(int(s))
+
+    return parse
+
+
 class LastTighteningResultDataSubscribe(OpenProtocolEventSubscribe):
+    __slots__ = ()
+
     MID = 60
     REVISION = 2
+    CONSTANT_FRAME = True
     MID_EVENT = 61
 
     def __init__(self) -> None:
@@ -32,6 +49,26 @@ class LastTighteningResultDataSubscribe(OpenProtocolEventSubscribe):
 
 
 class LastTighteningResultData(OpenProtocolEvent):
+    __slots__ = (
+        "final_torque",
+        "tightening_status_field",
+        "tightening_status",
+        "cell_id",
+        "channel_id",
+        "job_id",
+        "pset_number",
+        "pset_name",
+        "torque_controller_name",
+        "result_status",
+        "timestamp",
+        "angle",
+        "torque_status",
+        "angle_status",
+        "torque",
+        "tool_serial_number",
+        "torque_value_unit",
+    )
+
     MID = 61
 
     @verify(UNIQUE)
@@ -76,29 +113,16 @@ class LastTighteningResultData(OpenProtocolEvent):
             LastTighteningResultData.TorqueValueUnit.NM
         )
 
-    @classmethod
-    def from_message(cls, msg: OpenProtocolRawMessage) -> "LastTighteningResultData":
-        msg_obj = cls(msg.revision)
-        if msg.revision == 1:
-            msg_obj._rev1(msg)
-        elif 2 <= msg.revision <= 998:
-            msg_obj._rev2(msg)
-        else:
-            raise NotImplementedError(f"Not supported revision {msg.revision}")
-
-        return msg_obj
-
-    def _rev_common(self, msg: OpenProtocolRawMessage):
-        fields_common = [
-            FieldSpec("cell_id", 20, 22, parser=int),
-            FieldSpec("channel_id", 26, 28, parser=int),
-            FieldSpec("torque_controller_name", 32, 57, parser=lambda s: s.strip()),
-        ]
-
-        parse_message(msg, self, fields_common)
+    _FIELDS_COMMON: ClassVar[list[FieldSpec]] = [
+        FieldSpec("cell_id", 20, 22, parser=int),
+        FieldSpec("channel_id", 26, 28, parser=int),
+        FieldSpec("torque_controller_name", 32, 57, parser=str.strip),
+    ]
 
-    def _rev1(self, msg: OpenProtocolRawMessage):
-        fields_v1 = [
+    # Parse plans are compiled once per revision and shared by all messages
+    _PLAN_REV1: ClassVar[ParsePlan] = ParsePlan(
+        _FIELDS_COMMON
+        + [
             FieldSpec("pset_number", 90, 93, parser=int),
             FieldSpec(None, 105, 107, parser=str, validator=lambda x: x == "09"),
             FieldSpec("tightening_status", 107, 108, parser=int),
@@ -106,14 +130,13 @@ class LastTighteningResultData(OpenProtocolEvent):
             FieldSpec("torque_status", 110, 111, parser=int),
             FieldSpec("angle_status", 113, 114, parser=int),
             FieldSpec("torque", 140, 146, parser=lambda s: float(s) / 100.0),
-            FieldSpec("timestamp", 176, 195, parser=lambda s: s.strip()),
+            FieldSpec("timestamp", 176, 195, parser=str.strip),
         ]
+    )
 
-        self._rev_common(msg)
-        parse_message(msg, self, fields_v1)
-
-    def _rev2(self, msg: OpenProtocolRawMessage):
-        fields_v2 = [
+    _PLAN_REV2: ClassVar[ParsePlan] = ParsePlan(
+        _FIELDS_COMMON
+        + [
             FieldSpec("pset_number", 92, 95, parser=int),
             FieldSpec(None, 118, 120, parser=str, validator=lambda x: x == "11"),
             FieldSpec("tightening_status", 120, 121, parser=int),
@@ -126,37 +149,171 @@ class LastTighteningResultData(OpenProtocolEvent):
                 "tool_serial_number",
                 329,
                 343,
-                parser=lambda s: "".join(c for c in s if c in string.printable).strip(),
+                parser=lambda s: s.translate(_NON_PRINTABLE).strip(),
             ),
-            FieldSpec("timestamp", 345, 364, parser=lambda s: s.strip()),
+            FieldSpec("timestamp", 345, 364, parser=str.strip),
             FieldSpec(None, 385, 387, parser=str, validator=lambda x: x == "47"),
-            FieldSpec("pset_name", 387, 412, parser=lambda s: s.strip()),
+            FieldSpec("pset_name", 387, 412, parser=str.strip),
             FieldSpec(
-                "torque_value_unit",
-                414,
-                415,
-                parser=lambda s: LastTighteningResultData.TorqueValueUnit(int(s)),
+                "torque_value_unit", 414, 415, parser=_enum_parser(TorqueValueUnit)
             ),
         ]
+    )
+
+    # Parse plan of each revision range, one decoder per entry is registered
+    _PLANS: ClassVar[tuple[tuple[range, ParsePlan], ...]] = (
+        (range(1, 2), _PLAN_REV1),
+        (range(2, 999), _PLAN_REV2),
+    )
+
+    # Digit-only fields decoded in vectorized form by decode_batch, mapped to
+    # the divisor of the integer value
+    _BATCH_NUMERIC: ClassVar[dict[str, float]] = {
+        "cell_id": 1,
+        "channel_id": 1,
+        "pset_number": 1,
+        "tightening_status": 1,
+        "torque_status": 1,
+        "angle_status": 1,
+        "torque": 100.0,
+        "angle": 1,
+    }
+
+    @classmethod
+    def from_message(cls, msg: OpenProtocolRawMessage) -> "LastTighteningResultData":
+        return cls._decode_with(cls.plan(msg.revision), msg)
+
+    @classmethod
+    def decoders(cls) -> list[tuple[range, Decoder]]:
+        return [
+            (revisions, partial(cls._decode_with, plan))
+            for revisions, plan in cls._PLANS
+        ]
 
-        self._rev_common(msg)
-        parse_message(msg, self, fields_v2)
+    @classmethod
+    def _decode_with(
+        cls, plan: ParsePlan, msg: OpenProtocolRawMessage
+    ) -> "LastTighteningResultData":
+        msg_obj = cls(msg.revision)
+        plan.apply(msg, msg_obj)
+        return msg_obj
+
+    @classmethod
+    def decode_batch(
+        cls, frames: Iterable[bytes | bytearray | memoryview]
+    ) -> ColumnBatch:
+        """
+        Decode raw frames of one revision into columnar NumPy arrays.
+
+        Requires numpy. Numeric fields (torque, angle, statuses, ...) are arrays,
+        text fields and the torque unit are dictionary-encoded.
+        """
+        return decode_batch(frames, cls.MID, cls.plan, cls._BATCH_NUMERIC)
+
+    @classmethod
+    def plan(cls, revision: int) -> ParsePlan:
+        """Compiled parse plan used for the given revision."""
+        for revisions, plan in cls._PLANS:
+            if revision in revisions:
+                return plan
+        raise NotImplementedError(f"Not supported revision {revision}")
 
     def encode(self) -> OpenProtocolRawMessage:
         raise NotImplementedError("Not implemented")
 
 
+class LazyLastTighteningResultData(LastTighteningResultData):
+    """
+    Drop-in replacement of LastTighteningResultData which keeps the raw frame
+    and parses, validates and caches each field on its first access.
+
+    Marker fields are still checked when the message is created. To receive it
+    from the client, register it in place of the eager class:
+        register_messages(LazyLastTighteningResultData)
+    """
+
+    __slots__ = ("_frame", "_plan", "_usable")
+
+    _defaults: ClassVar[LastTighteningResultData | None] = None
+
+    def __init__(
+        self,
+        revision: int,
+        msg: OpenProtocolRawMessage,
+        plan: ParsePlan | None = None,
+    ):
+        # Field defaults are not assigned, missing attributes go to __getattr__
+        OpenProtocolMessage.__init__(self, revision)
+        self._frame: bytes = msg.raw
+        self._plan: ParsePlan = plan or self.plan(revision)
+        self._usable: int = self._plan.usable_fields(len(self._frame))
+
+        for index in self._plan.checks:
+            if index < self._usable:
+                spec = self._plan.fields[index]
+                parse_field(spec, self._field_str(spec))
+
+    @classmethod
+    def from_message(
+        cls, msg: OpenProtocolRawMessage
+    ) -> "LazyLastTighteningResultData":
+        return cls(msg.revision, msg)
+
+    @classmethod
+    def _decode_with(
+        cls, plan: ParsePlan, msg: OpenProtocolRawMessage
+    ) -> "LazyLastTighteningResultData":
+        return cls(msg.revision, msg, plan)
+
+    def __reduce__(self) -> tuple:
+        # Pickled as its frame, the parse plan holds unpicklable parsers
+        return _lazy_from_frame, (type(self), self._frame)
+
+    def _field_str(self, spec: FieldSpec) -> str:
+        return self._frame[spec.start : spec.end].decode("ascii").strip()
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+
+        index = self._plan.positions.get(name)
+        if index is not None and index < self._usable:
+            spec = self._plan.fields[index]
+            value = parse_field(spec, self._field_str(spec))
+        else:
+            # Field not present in this frame (or revision)
+            if LazyLastTighteningResultData._defaults is None:
+                LazyLastTighteningResultData._defaults = LastTighteningResultData(1)
+            value = getattr(LazyLastTighteningResultData._defaults, name)
+
+        setattr(self, name, value)
+        return value
+
+
+def _lazy_from_frame(
+    cls: type[LazyLastTighteningResultData], frame: bytes
+) -> LazyLastTighteningResultData:
+    return cls.from_message(OpenProtocolRawMessage.decode(frame))
+
+
 class LastTighteningResultDataACK(OpenProtocolEventACK):
+    __slots__ = ()
+
     MID = 62
+    MID_EVENT = 61
     REVISION = 1
+    CONSTANT_FRAME = True
 
     def encode(self) -> OpenProtocolRawMessage:
         return self.create_message(self.REVISION)
 
 
 class LastTighteningResultDataUnsubscribe(OpenProtocolEventUnsubscribe):
+    __slots__ = ()
+
     MID = 63
     REVISION = 1
+    CONSTANT_FRAME = True
 
     def encode(self) -> OpenProtocolRawMessage:
         return self.create_message(self.REVISION)
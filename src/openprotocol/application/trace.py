@@ -0,0 +1,297 @@
+import logging
+from enum import Enum, verify, UNIQUE
+from typing import Any, ClassVar, NamedTuple
+
+from openprotocol.application.base_messages import (
+    OpenProtocolEvent,
+    OpenProtocolEventACK,
+    OpenProtocolEventSubscribe,
+    OpenProtocolEventUnsubscribe,
+)
+from openprotocol.application.batch import require_numpy
+from openprotocol.core.message import OpenProtocolRawMessage
+from openprotocol.core.mid_base import OpenProtocolMessage
+
+logger = logging.getLogger(__name__)
+
+# Parameter ID of the factor converting raw trace samples to the trace unit
+COEFFICIENT_PID = 2213
+
+
+class DataField(NamedTuple):
+    """Variable data field of the trace MIDs (PID, unit, step and value)."""
+
+    pid: int
+    data_type: int
+    unit: int
+    step: int
+    value: Any
+
+
+class Resolution(NamedTuple):
+    """Time between two samples for the sample indices first..last."""
+
+    first_index: int
+    last_index: int
+    data_type: int
+    unit: int
+    value: float
+
+
+def _parse_value(data_type: int, value: bytes) -> Any:
+    text = value.decode("ascii").strip()
+    if data_type in (1, 2):  # UI, I
+        return int(text)
+    if data_type == 3:  # F
+        return float(text)
+    return text
+
+
+class _Cursor:
+    """Reads consecutive ASCII fields of a frame which ends in binary data."""
+
+    __slots__ = ("frame", "pos")
+
+    def __init__(self, frame: bytes, pos: int) -> None:
+        self.frame = frame
+        self.pos = pos
+
+    def take(self, width: int) -> bytes:
+        end = self.pos + width
+        if end > len(self.frame):
+            raise ValueError(f"Frame ends at {len(self.frame)}, field ends at {end}")
+        value = self.frame[self.pos : end]
+        self.pos = end
+        return value
+
+    def int(self, width: int) -> int:
+        return int(self.take(width))
+
+    def data_fields(self) -> dict[int, DataField]:
+        fields = {}
+        for _ in range(self.int(3)):
+            pid = self.int(5)
+            length = self.int(3)
+            data_type = self.int(2)
+            unit = self.int(3)
+            step = self.int(4)
+            fields[pid] = DataField(
+                pid, data_type, unit, step, _parse_value(data_type, self.take(length))
+            )
+        return fields
+
+    def resolutions(self) -> list[Resolution]:
+        resolutions = []
+        for _ in range(self.int(3)):
+            first_index = self.int(5)
+            last_index = self.int(5)
+            length = self.int(3)
+            data_type = self.int(2)
+            unit = self.int(3)
+            value = float(self.take(length))
+            resolutions.append(
+                Resolution(first_index, last_index, data_type, unit, value)
+            )
+        return resolutions
+
+
+class TraceCurveDataSubscribe(OpenProtocolEventSubscribe):
+    """
+    Subscription of MID 900 through the generic data subscription MID 8.
+    Decoding the traces requires numpy.
+    """
+
+    __slots__ = ()
+
+    MID = 8
+    REVISION = 1
+    CONSTANT_FRAME = True
+    MID_EVENT = 900
+    # Revision of MID 900 asked for
+    EVENT_REVISION = 1
+
+    def __init__(self) -> None:
+        require_numpy()
+        super().__init__(self.REVISION)
+
+    def encode(self) -> OpenProtocolRawMessage:
+        # Subscribed MID, its revision and no extra data
+        return self.create_message(
+            self.REVISION, f"{self.MID_EVENT:04}{self.EVENT_REVISION:03}00"
+        )
+
+    @classmethod
+    def from_message(cls, msg: OpenProtocolRawMessage) -> "OpenProtocolMessage":
+        return cls()
+
+
+class TracePlotParametersSubscribe(TraceCurveDataSubscribe):
+    __slots__ = ()
+
+    MID_EVENT = 901
+
+
+class TraceCurveData(OpenProtocolEvent):
+    """
+    Torque, angle, ... trace of one tightening.
+
+    The samples are binary after the ASCII fields; they are mapped into a
+    float64 NumPy array in one vectorized step and scaled by the coefficient
+    (PID 02213) of the parameter fields.
+    """
+
+    __slots__ = (
+        "result_id",
+        "timestamp",
+        "fields",
+        "trace_type",
+        "transducer_type",
+        "unit",
+        "parameters",
+        "resolutions",
+        "samples",
+    )
+
+    MID = 900
+
+    @verify(UNIQUE)
+    class TraceType(Enum):
+        ANGLE = 1
+        TORQUE = 2
+        CURRENT = 3
+        GRADIENT = 4
+        STROKE = 5
+        FORCE = 6
+
+    # Samples are signed 16 bit integers in network byte order
+    SAMPLE_DTYPE: ClassVar[str] = ">i2"
+
+    def __init__(self, revision: int):
+        super().__init__(revision)
+        self.result_id = 0
+        self.timestamp = ""
+        self.fields: dict[int, DataField] = {}
+        self.trace_type = TraceCurveData.TraceType.TORQUE
+        self.transducer_type = 0
+        self.unit = 0
+        self.parameters: dict[int, DataField] = {}
+        self.resolutions: list[Resolution] = []
+        self.samples: Any = None
+
+    @classmethod
+    def from_message(cls, msg: OpenProtocolRawMessage) -> "TraceCurveData":
+        np = require_numpy()
+        frame = msg.raw
+        msg_obj = cls(msg.revision)
+
+        cursor = _Cursor(frame, OpenProtocolRawMessage.HEADER_SIZE)
+        msg_obj.result_id = cursor.int(10)
+        msg_obj.timestamp = cursor.take(19).decode("ascii")
+        msg_obj.fields = cursor.data_fields()
+        msg_obj.trace_type = cls.TraceType(cursor.int(2))
+        msg_obj.transducer_type = cursor.int(2)
+        msg_obj.unit = cursor.int(3)
+        msg_obj.parameters = cursor.data_fields()
+        msg_obj.resolutions = cursor.resolutions()
+        count = cursor.int(5)
+        if cursor.take(1) != b"\x00":
+            raise ValueError("Missing NUL in front of the trace samples")
+
+        # Reassembled multi-part frames outgrow their length field, the
+        # samples end at the footer
+        available = (len(frame) - cursor.pos - 1) // 2
+        if available < count:
+            raise ValueError(f"Trace of {count} samples holds only {available}")
+        samples = np.frombuffer(
+            frame, dtype=cls.SAMPLE_DTYPE, count=count, offset=cursor.pos
+        ).astype(np.float64)
+        coefficient = msg_obj.parameters.get(COEFFICIENT_PID)
+        if coefficient is not None:
+            samples *= coefficient.value
+        msg_obj.samples = samples
+        return msg_obj
+
+    def sample_times(self) -> Any:
+        """Time of each sample from the resolution fields, the first at 0."""
+        np = require_numpy()
+        steps = np.zeros(len(self.samples), dtype=np.float64)
+        for resolution in self.resolutions:
+            # Indices are 1 based, each step is the time to the next sample
+            steps[resolution.first_index - 1 : resolution.last_index] = resolution.value
+        return np.concatenate(([0.0], np.cumsum(steps[:-1])))[: len(self.samples)]
+
+    def encode(self) -> OpenProtocolRawMessage:
+        raise NotImplementedError("Not implemented")
+
+
+class TracePlotParameters(OpenProtocolEvent):
+    """Plot parameters of a trace (limits, targets, ...) by parameter ID."""
+
+    __slots__ = ("result_id", "timestamp", "fields")
+
+    MID = 901
+
+    def __init__(self, revision: int):
+        super().__init__(revision)
+        self.result_id = 0
+        self.timestamp = ""
+        self.fields: dict[int, DataField] = {}
+
+    @classmethod
+    def from_message(cls, msg: OpenProtocolRawMessage) -> "TracePlotParameters":
+        msg_obj = cls(msg.revision)
+        cursor = _Cursor(msg.raw, OpenProtocolRawMessage.HEADER_SIZE)
+        msg_obj.result_id = cursor.int(10)
+        msg_obj.timestamp = cursor.take(19).decode("ascii")
+        msg_obj.fields = cursor.data_fields()
+        return msg_obj
+
+    def encode(self) -> OpenProtocolRawMessage:
+        raise NotImplementedError("Not implemented")
+
+
+class TraceCurveDataACK(OpenProtocolEventACK):
+    """Events of the generic subscription are acknowledged by MID 5."""
+
+    __slots__ = ()
+
+    MID = 5
+    MID_EVENT = 900
+    REVISION = 1
+    CONSTANT_FRAME = True
+
+    def encode(self) -> OpenProtocolRawMessage:
+        return self.create_message(self.REVISION, f"{self.MID_EVENT:04}")
+
+
+class TracePlotParametersACK(TraceCurveDataACK):
+    __slots__ = ()
+
+    MID_EVENT = 901
+
+
+class TraceCurveDataUnsubscribe(OpenProtocolEventUnsubscribe):
+    """Unsubscription of MID 900 through the generic data unsubscription MID 9."""
+
+    __slots__ = ()
+
+    MID = 9
+    REVISION = 1
+    CONSTANT_FRAME = True
+    MID_EVENT = 900
+    EVENT_REVISION = 1
+
+    def encode(self) -> OpenProtocolRawMessage:
+        return self.create_message(
+            self.REVISION, f"{self.MID_EVENT:04}{self.EVENT_REVISION:03}00"
+        )
+
+    @classmethod
+    def from_message(cls, msg: OpenProtocolRawMessage) -> "OpenProtocolMessage":
+        return cls()
+
+
+class TracePlotParametersUnsubscribe(TraceCurveDataUnsubscribe):
+    __slots__ = ()
+
+    MID_EVENT = 901
@@ -0,0 +1,273 @@
+import time
+from dataclasses import dataclass
+from typing import Callable
+
+from openprotocol.core.message import OpenProtocolRawMessage
+from openprotocol.core.mid_base import MidCodec, OpenProtocolMessage
+
+MAX_PARTS = 9
+
+
+class FrameSplitter:
+    """
+    Splits a byte stream into complete Open Protocol frames.
+
+    Incoming data is written into one reusable receive buffer, either directly
+    (get_buffer/buffer_updated, as asyncio.BufferedProtocol does) or copied
+    by feed(). Complete frames are cut from its start and the rest of a
+    partial frame is moved to the front once per update.
+    """
+
+    MIN_FREE = 4096
+
+    def __init__(self, size: int = 65536):
+        self._buffer = bytearray(size)
+        self._end = 0
+
+    @property
+    def pending(self) -> int:
+        """Number of buffered bytes of a not yet complete frame."""
+        return self._end
+
+    def get_buffer(self, sizehint: int = -1) -> memoryview:
+        """Free part of the receive buffer, at least `sizehint` bytes long."""
+        needed = max(sizehint, self.MIN_FREE)
+        if len(self._buffer) - self._end < needed:
+            # A new buffer instead of resizing, the old one may still be exported
+            grown = bytearray(max(len(self._buffer) * 2, self._end + needed))
+            grown[: self._end] = self._buffer[: self._end]
+            self._buffer = grown
+        return memoryview(self._buffer)[self._end :]
+
+    def buffer_updated(self, nbytes: int) -> list[bytes]:
+        """Account `nbytes` written to get_buffer() and return complete frames."""
+        self._end += nbytes
+        return self._split()
+
+    def feed(self, data: bytes | bytearray | memoryview) -> list[bytes]:
+        """Copy `data` into the receive buffer and return complete frames."""
+        nbytes = len(data)
+        self.get_buffer(nbytes)[:nbytes] = data
+        return self.buffer_updated(nbytes)
+
+    def clear(self) -> None:
+        self._end = 0
+
+    def _split(self) -> list[bytes]:
+        buf = self._buffer
+        end = self._end
+        frames = []
+        pos = 0
+        while end - pos >= MidCodec.LENGTH_FIELD_SIZE:
+            length_field = buf[pos : pos + MidCodec.LENGTH_FIELD_SIZE]
+            if not length_field.isdigit():
+                raise ValueError(f"Invalid frame length field {bytes(length_field)!r}")
+            length = int(length_field)
+            if length < OpenProtocolRawMessage.HEADER_SIZE:
+                raise ValueError(f"Invalid frame length {length}")
+
+            stop = pos + length + MidCodec.FOOTER_FIELD_SIZE
+            if stop > end:
+                break
+            frames.append(bytes(buf[pos:stop]))
+            pos = stop
+
+        if pos:
+            rest = end - pos
+            buf[:rest] = buf[pos:end]
+            self._end = rest
+        return frames
+
+
+class FrameWriter:
+    """
+    Collects outgoing frames in a reusable bytearray.
+
+    Frames are encoded straight into the buffer and the whole buffer is taken
+    for one write. After the write the buffer is handed back with recycle()
+    and reused, unless the transport still holds a view of it (asyncio keeps
+    unsent data by reference); then a new buffer is used.
+    """
+
+    def __init__(self) -> None:
+        self._buffer = bytearray()
+        self._spare: bytearray | None = None
+
+    def __len__(self) -> int:
+        return len(self._buffer)
+
+    def add(self, mid_obj: OpenProtocolMessage) -> None:
+        start = len(self._buffer)
+        end = MidCodec.encode_into(mid_obj, self._buffer, start)
+        if end - start > OpenProtocolRawMessage.MAX_LENGTH + MidCodec.FOOTER_FIELD_SIZE:
+            # Rare: too long for one frame, sent in parts
+            del self._buffer[start:]
+            for part in split_message(mid_obj.encode()):
+                self._buffer += part
+
+    def add_frame(self, frame: bytes | bytearray | memoryview) -> None:
+        self._buffer += frame
+
+    def take(self) -> bytearray:
+        """Return the collected frames and continue with an empty buffer."""
+        buf = self._buffer
+        self._buffer = self._spare if self._spare is not None else bytearray()
+        self._spare = None
+        return buf
+
+    def recycle(self, buf: bytearray) -> None:
+        """Hand back a buffer returned by take() once it was written."""
+        try:
+            buf.clear()
+        except BufferError:
+            # Still exported, e.g. queued by the transport
+            return
+        self._spare = buf
+
+    def clear(self) -> None:
+        self._buffer.clear()
+
+
+def encode_parts(mid_obj: OpenProtocolMessage) -> list[bytes]:
+    """Frames of `mid_obj`, several if it does not fit into one."""
+    frame = MidCodec.encode(mid_obj)
+    if len(frame) <= OpenProtocolRawMessage.MAX_LENGTH + MidCodec.FOOTER_FIELD_SIZE:
+        return [frame]
+    return split_message(mid_obj.encode())
+
+
+def split_message(msg: OpenProtocolRawMessage) -> list[bytes]:
+    """
+    Frames of a multi-part message: the payload is cut into parts of at most
+    the largest frame, each with the header of `msg` and its part numbers.
+    A message which fits into one frame is returned as is. The payload is cut
+    as bytes, binary data (trace samples) is kept.
+    """
+    header_size = OpenProtocolRawMessage.HEADER_SIZE
+    payload = msg.payload_bytes
+    chunk = OpenProtocolRawMessage.MAX_LENGTH - OpenProtocolRawMessage.HEADER_SIZE
+    count = max(1, -(-len(payload) // chunk))
+    if count == 1:
+        return [msg.encode()]
+    if count > MAX_PARTS:
+        raise ValueError(f"MID {msg.mid} needs {count} parts, at most {MAX_PARTS}")
+    parts = []
+    for number, pos in enumerate(range(0, len(payload), chunk), 1):
+        # Header of the part from an empty message with the part numbers
+        header = OpenProtocolRawMessage(
+            msg.mid,
+            msg.revision,
+            "",
+            no_ack_flag=msg.no_ack_flag,
+            station_id=msg.station_id,
+            spindle_id=msg.spindle_id,
+            seq_no=msg.seq_no,
+            no_of_mess_parts=count,
+            message_part_number=number,
+        ).encode()[4:header_size]
+        data = payload[pos : pos + chunk]
+        parts.append(b"%04d%b%b\x00" % (header_size + len(data), header, data))
+    return parts
+
+
+@dataclass(slots=True)
+class _PartialMessage:
+    header: bytes
+    parts: int
+    payloads: list[bytes]
+    size: int
+    started: float
+
+
+class PartReassembler:
+    """
+    Joins the parts of multi-part messages into one logical frame.
+
+    Parts (header fields "number of message parts" and "message part
+    number", up to 9) are buffered per MID, station and spindle and their
+    payloads joined once the last part arrives. A message is dropped when its
+    payload grows beyond `max_size` bytes or its parts take longer than
+    `timeout` seconds, checked with every frame fed and by expire(). The
+    length field of a joined frame longer than a frame can be is capped at
+    9999, its payload ends at the footer.
+    """
+
+    def __init__(
+        self,
+        max_size: int = MAX_PARTS * OpenProtocolRawMessage.MAX_LENGTH,
+        timeout: float = 10.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_size = max_size
+        self.timeout = timeout
+        self.expired = 0
+        self._clock = clock
+        self._pending: dict[bytes, _PartialMessage] = {}
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def feed(self, frame: bytes) -> bytes | None:
+        """
+        Returns single frames unchanged, the joined frame for the last part
+        of a message and None for its other parts. Raises ValueError for
+        parts out of order or beyond the size limit, their message is dropped.
+        """
+        if self._pending:
+            self.expire()
+        parts_field = frame[18:19]
+        if parts_field in (b" ", b"0", b"1"):
+            return frame
+        parts = int(parts_field)
+        number = int(frame[19:20])
+        now = self._clock()
+
+        # MID, station and spindle
+        key = frame[4:8] + frame[12:16]
+        payload = frame[OpenProtocolRawMessage.HEADER_SIZE : int(frame[0:4])]
+        msg = self._pending.get(key)
+        if number == 1:
+            msg = self._pending[key] = _PartialMessage(
+                frame[4:18], parts, [payload], len(payload), now
+            )
+        elif msg is None or msg.parts != parts or len(msg.payloads) + 1 != number:
+            self._pending.pop(key, None)
+            raise ValueError(
+                f"MID {int(frame[4:8])}: part {number}/{parts} out of order"
+            )
+        else:
+            msg.payloads.append(payload)
+            msg.size += len(payload)
+
+        if msg.size > self.max_size:
+            del self._pending[key]
+            raise ValueError(
+                f"MID {int(frame[4:8])}: parts exceed {self.max_size} bytes"
+            )
+        if number < parts:
+            return None
+        del self._pending[key]
+        length = OpenProtocolRawMessage.HEADER_SIZE + msg.size
+        return b"".join(
+            (
+                b"%04d" % min(length, OpenProtocolRawMessage.MAX_LENGTH),
+                msg.header,
+                b"  ",
+                *msg.payloads,
+                OpenProtocolRawMessage.FOOTER_FIELD.encode("ascii"),
+            )
+        )
+
+    def clear(self) -> None:
+        self._pending.clear()
+
+    def expire(self) -> int:
+        """Drop messages whose parts take too long, returns how many."""
+        now = self._clock()
+        expired = 0
+        for key, msg in list(self._pending.items()):
+            if now - msg.started > self.timeout:
+                del self._pending[key]
+                expired += 1
+        self.expired += expired
+        return expired
@@ -1,3 +1,22 @@
+from functools import lru_cache
+from typing import NamedTuple
+
+
+class FrameHeader(NamedTuple):
+    """Routing fields of a frame, read without decoding the message."""
+
+    mid: int
+    revision: int
+    station_id: int
+    spindle_id: int
+
+
+@lru_cache(maxsize=1024)
+def _default_header(mid: int, revision: int) -> bytes:
+    """Header template of a MID/revision with all optional fields blank."""
+    return f"{mid:04}{revision:03}         ".encode("ascii")
+
+
 class OpenProtocolRawMessage:
     """
     Internal representation of a decoded Open Protocol frame.
@@ -5,8 +24,23 @@ class OpenProtocolRawMessage:
     https://s3.amazonaws.com/co.tulip.cdn/OpenProtocolSpecification_R280.pdf
     """
 
+    __slots__ = (
+        "_mid",
+        "_revision",
+        "_no_ack_flag",
+        "_station_id",
+        "_spindle_id",
+        "_seq_no",
+        "_no_of_mess_parts",
+        "_message_part_number",
+        "_header_parsed",
+        "_payload",
+        "_frame",
+    )
+
     # Open Protocol spec: header fields (after 4-char length)
     HEADER_SIZE = 20  # minimal, may be longer if optional fields enabled
+    MAX_LENGTH = 9999  # largest frame the 4 digit length field can describe
     FOOTER_FIELD = "\x00"
 
     def __init__(
@@ -22,53 +56,124 @@ class OpenProtocolRawMessage:
         message_part_number: int | None = None,
         raw_string: str | None = None,
     ):
-        self._mid = mid
-        self._revision = revision
+        self._mid: int | None = mid
+        self._revision: int | None = revision
         self._no_ack_flag = no_ack_flag
-
-        self._payload = payload
         self._station_id = station_id
         self._spindle_id = spindle_id
         self._seq_no = seq_no
         self._no_of_mess_parts = no_of_mess_parts
         self._message_part_number = message_part_number
-        self._raw_string = raw_string
+        self._header_parsed = True
+
+        # Payload is kept only until the frame is built, afterwards the frame
+        # is the single storage of the message
+        self._payload: str | None = payload
+        self._frame: bytes | None = None
+        if raw_string is not None:
+            self._frame = raw_string.encode("ascii")
+            self._payload = None
+
+    @classmethod
+    def decode(cls, raw: bytes | bytearray | memoryview) -> "OpenProtocolRawMessage":
+        """
+        Decode raw bytes (with length prefix) into header + payload.
+
+        The frame is kept as bytes, header fields are parsed from it on first
+        access and payload fields are sliced only when requested. Buffers other
+        than bytes are copied once, as transports reuse their receive buffers.
+        """
+        msg = cls.__new__(cls)
+        msg._frame = raw if isinstance(raw, bytes) else bytes(raw)
+        msg._payload = None
+        msg._mid = None
+        msg._revision = None
+        msg._header_parsed = False
+        return msg
 
     @classmethod
-    def decode(cls, raw: bytes) -> "OpenProtocolRawMessage":
-        """Decode raw bytes (with length prefix) into header + payload."""
-        raw_str = raw.decode("ascii")
-        frame_len = int(raw_str[0:4])
-
-        # Header part after length field
-        header = raw_str[4 : cls.HEADER_SIZE]
-        payload = raw_str[cls.HEADER_SIZE : frame_len]
-
-        mid = int(header[0:4])  # MID
-        revision = int(header[4:7])  # Revision
-        no_ack_flag = False if header[7:8].strip() == "" else bool(header[7:8])
-        station_id = 1 if header[8:10].strip() == "" else int(header[8:10])
-        spindle_id = 1 if header[10:12].strip() == "" else int(header[10:12])
-        seq_no = None if header[12:14].strip() == "" else int(header[12:14])
-        no_of_mess_parts = None if header[14:15].strip() == "" else int(header[14:15])
-        message_part_number = (
-            None if header[15:16].strip() == "" else int(header[15:16])
+    def peek_header(cls, frame: bytes | bytearray | memoryview) -> FrameHeader:
+        """
+        Read MID, revision, station and spindle of a raw frame from their fixed
+        offsets, without building a message. Used to route or drop frames
+        before their payload is parsed.
+        """
+        if len(frame) < cls.HEADER_SIZE:
+            raise ValueError(f"Frame shorter than header: {len(frame)}")
+        # Views of a receive buffer have no strip() and int() rejects them
+        fields = bytes(frame[4:16])
+        station = fields[8:10]
+        spindle = fields[10:12]
+        return FrameHeader(
+            int(fields[0:4]),
+            int(fields[4:7]),
+            1 if station.strip() == b"" else int(station),
+            1 if spindle.strip() == b"" else int(spindle),
         )
 
-        return cls(
-            mid,
-            revision,
-            payload,
-            no_ack_flag,
-            station_id,
-            spindle_id,
-            seq_no,
-            no_of_mess_parts,
-            message_part_number,
-            raw_str,
+    def _parse_header(self) -> None:
+        """Parse the optional header fields, MID and revision are parsed apart."""
+        frame = self._buffer()
+        self._no_ack_flag = frame[11:12] == b"1"
+        self._station_id = 1 if frame[12:14].strip() == b"" else int(frame[12:14])
+        self._spindle_id = 1 if frame[14:16].strip() == b"" else int(frame[14:16])
+        self._seq_no = None if frame[16:18].strip() == b"" else int(frame[16:18])
+        self._no_of_mess_parts = (
+            None if frame[18:19].strip() == b"" else int(frame[18:19])
         )
+        self._message_part_number = (
+            None if frame[19:20].strip() == b"" else int(frame[19:20])
+        )
+        self._header_parsed = True
+
+    def _buffer(self) -> bytes:
+        if self._frame is None:
+            self.encode()
+        assert self._frame is not None
+        return self._frame
 
     def encode(self) -> bytes:
+        if self._frame is None:
+            self._frame = self._format()
+            self._payload = None
+        return self._frame
+
+    def encode_into(self, buf: bytearray | memoryview, offset: int = 0) -> int:
+        """
+        Write the frame into `buf` at `offset` and return the offset after it.
+
+        The formatted frame is only a temporary source of the copy, it is not
+        kept by the message. A bytearray grows as needed, a memoryview must be
+        large enough.
+        """
+        if offset > len(buf):
+            raise ValueError(f"Offset {offset} beyond buffer end {len(buf)}")
+        frame = self._frame if self._frame is not None else self._format()
+        end = offset + len(frame)
+        buf[offset:end] = frame
+        return end
+
+    def _format(self) -> bytes:
+        header = self._header()
+        payload = self._payload.encode("ascii") if self._payload else b""
+        return b"%04d%b%b\x00" % (
+            4 + len(header) + len(payload),  # length field counts itself
+            header,
+            payload,
+        )
+
+    def _header(self) -> bytes:
+        """Header fields after the length field."""
+        if (
+            not self._no_ack_flag
+            and self._station_id == 1
+            and self._spindle_id == 1
+            and self._seq_no is None
+            and self._no_of_mess_parts is None
+            and self._message_part_number is None
+        ):
+            return _default_header(self._mid, self._revision)
+
         # No Ack Flag
         no_ack_str = "1" if self._no_ack_flag else " "
         # Station ID (2 chars, default = "  ")
@@ -96,36 +201,30 @@ class OpenProtocolRawMessage:
             f"{parts_str}"
             f"{part_no_str}"
         )
-
-        body = header + self._payload
-        frame = f"{len(body) + 4:04}" + body + "\x00"
-        self._raw_string = frame
-        return frame.encode("ascii")
+        return header.encode("ascii")
 
     def __repr__(self):
-        return f"<OpenProtocolMessage MID={self._mid} REV={self._revision} Payload='{self._payload}'>"
+        return f"<OpenProtocolMessage MID={self.mid} REV={self.revision} Payload='{self.payload}'>"
 
     def __getitem__(self, key: slice | int) -> str:
         """Allow slicing or indexing like msg[1:2] or msg[5]."""
-        if self._raw_string is None:
-            return ""
-
-        length = len(self._raw_string)
+        frame = self._buffer()
+        length = len(frame)
 
         if isinstance(key, slice):
             start = key.start or 0
-            stop = key.stop if key.stop is not None else len(self._raw_string)
+            stop = key.stop if key.stop is not None else length
             if start < 0 or stop > length:
                 raise IndexError(
                     f"Slice {start}:{stop} out of range for message length {length}."
                 )
-            return self._raw_string[key]
+            return frame[key].decode("ascii")
         elif isinstance(key, int):
             if key < 0 or key >= length:
                 raise IndexError(
                     f"Index {key} out of range for message length {length}."
                 )
-            return self._raw_string[key]
+            return frame[key : key + 1].decode("ascii")
         else:
             raise TypeError("Invalid argument type. Must be int or slice.")
 
@@ -134,46 +233,101 @@ class OpenProtocolRawMessage:
         if not isinstance(value, str):
             raise TypeError("Assigned value must be a string")
 
-        if self._raw_string is None:
-            return
-
-        # auto-expand with spaces if needed
-        def ensure_length(target_len: int):
-            assert self._raw_string is not None
-            if len(self._raw_string) < target_len:
-                self._raw_string += " " * (target_len - len(self._raw_string))
+        frame = bytearray(self._buffer())
+        data = value.encode("ascii")
 
         if isinstance(key, int):
-            ensure_length(key + 1)
-            self._raw_string = (
-                self._raw_string[:key] + value + self._raw_string[key + len(value) :]
-            )
+            start, stop = key, key + len(data)
         elif isinstance(key, slice):
             start = key.start or 0
-            stop = key.stop if key.stop is not None else len(self._raw_string)
-            # If slice goes beyond length → expand before writing
-            ensure_length(stop)
-            self._raw_string = (
-                self._raw_string[:start] + value + self._raw_string[stop:]
-            )
+            stop = key.stop if key.stop is not None else len(frame)
         else:
             raise TypeError("Invalid key type: must be int or slice")
 
+        # If write goes beyond length → expand with spaces before writing
+        if len(frame) < stop:
+            frame.extend(b" " * (stop - len(frame)))
+        frame[start:stop] = data
+        self._frame = bytes(frame)
+        self._mid = None
+        self._revision = None
+        self._header_parsed = False
+
     def __len__(self) -> int:
-        return len(self._raw_string) if self._raw_string else 0
+        return len(self._buffer())
 
     @property
-    def mid(self):
+    def mid(self) -> int:
+        if self._mid is None:
+            self._mid = int(self._buffer()[4:8])
         return self._mid
 
     @property
-    def revision(self):
+    def revision(self) -> int:
+        if self._revision is None:
+            self._revision = int(self._buffer()[8:11])
         return self._revision
 
     @property
-    def payload(self):
-        return self._payload
+    def no_ack_flag(self) -> bool:
+        if not self._header_parsed:
+            self._parse_header()
+        return self._no_ack_flag
+
+    @property
+    def station_id(self) -> int:
+        if not self._header_parsed:
+            self._parse_header()
+        return self._station_id
+
+    @property
+    def spindle_id(self) -> int:
+        if not self._header_parsed:
+            self._parse_header()
+        return self._spindle_id
+
+    @property
+    def seq_no(self) -> int | None:
+        if not self._header_parsed:
+            self._parse_header()
+        return self._seq_no
+
+    @property
+    def no_of_mess_parts(self) -> int | None:
+        if not self._header_parsed:
+            self._parse_header()
+        return self._no_of_mess_parts
+
+    @property
+    def message_part_number(self) -> int | None:
+        if not self._header_parsed:
+            self._parse_header()
+        return self._message_part_number
+
+    @property
+    def payload(self) -> str:
+        if self._payload is not None:
+            return self._payload
+        return self.payload_bytes.decode("ascii")
+
+    @property
+    def payload_bytes(self) -> bytes:
+        """Payload without decoding, binary data included."""
+        if self._payload is not None:
+            return self._payload.encode("ascii")
+        frame = self._buffer()
+        end = int(frame[0:4])
+        if end == self.MAX_LENGTH and len(frame) > end + len(self.FOOTER_FIELD):
+            # Reassembled multi-part frame with a capped length field, its
+            # payload ends at the footer
+            end = len(frame) - len(self.FOOTER_FIELD)
+        return frame[self.HEADER_SIZE : end]
+
+    @property
+    def raw(self) -> bytes:
+        """Complete frame including length prefix and NUL footer."""
+        return self._buffer()
 
     @property
-    def raw_str(self):
-        return self._raw_string
+    def raw_str(self) -> str:
+        return self._buffer().decode("ascii")
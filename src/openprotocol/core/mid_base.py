@@ -1,8 +1,10 @@
 from abc import abstractmethod, ABC
+from collections import OrderedDict
+from collections.abc import Hashable
 from enum import Enum, verify, UNIQUE, auto
-from typing import Type, ClassVar
+from typing import Callable, ClassVar, Iterable, Type
 
-from openprotocol.core.message import OpenProtocolRawMessage
+from openprotocol.core.message import FrameHeader, OpenProtocolRawMessage
 
 
 @verify(UNIQUE)
@@ -16,13 +18,41 @@ class MessageType(Enum):
     OP_COMMAND = auto()
 
 
+class _Revision:
+    """
+    REVISION attribute of messages: the class default when read from the class,
+    the revision of the message when read from an instance. Keeps REVISION
+    writable on instances of slotted classes.
+    """
+
+    __slots__ = ("default",)
+
+    def __init__(self, default: int | None) -> None:
+        self.default = default
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self.default
+        try:
+            return obj._revision
+        except AttributeError:
+            return self.default
+
+    def __set__(self, obj, value: int | None) -> None:
+        obj._revision = value
+
+
 class OpenProtocolMessage(ABC):
     """Abstract base class for all Open Protocol MID implementations."""
 
+    __slots__ = ("_revision",)
+
     MID: int | None = None
-    REVISION: int | None = None
+    REVISION: int | None = _Revision(None)  # type: ignore[assignment]
     expected_response_mids: ClassVar[set[int]] = set()
     MESSAGE_TYPE: MessageType | None = None
+    # The frame depends only on MID and revision, MidCodec keeps it encoded
+    CONSTANT_FRAME: ClassVar[bool] = False
 
     def __init__(self, revision: int) -> None:
         self.REVISION = revision
@@ -36,6 +66,10 @@ class OpenProtocolMessage(ABC):
         if cls.MESSAGE_TYPE is None:
             raise NotImplementedError(f"{cls.__name__}: MESSAGE_TYPE must be defined")
 
+        revision = cls.__dict__.get("REVISION")
+        if "REVISION" in cls.__dict__ and not isinstance(revision, _Revision):
+            cls.REVISION = _Revision(revision)  # type: ignore[assignment]
+
         parent_set = set()
         for base in cls.__bases__:
             if hasattr(base, "expected_response_mids"):
@@ -44,6 +78,15 @@ class OpenProtocolMessage(ABC):
         extra_set = getattr(cls, "expected_response_mids", set())
         cls.expected_response_mids = parent_set | extra_set
 
+    @classmethod
+    def decoders(cls) -> Iterable[tuple[range, "Decoder"]]:
+        """
+        Decoder of each supported revision range, entered into the MidCodec
+        dispatch table on registration. By default from_message handles all
+        revisions.
+        """
+        return [(range(MidCodec.REVISION_SPACE), cls.from_message)]
+
     @classmethod
     def register(cls: Type["OpenProtocolMessage"]) -> None:
         if cls.MID is None:
@@ -55,15 +98,25 @@ class OpenProtocolMessage(ABC):
     ) -> OpenProtocolRawMessage:
         if self.MID is None:
             raise NotImplementedError("MID is not defined")
-        msg = OpenProtocolRawMessage(self.MID, revision, payload)
-        msg.encode()
-        return msg
+        return OpenProtocolRawMessage(self.MID, revision, payload)
+
+    def frame_key(self) -> Hashable | None:
+        """
+        Values the encoded frame depends on besides MID and revision, the key
+        of the MidCodec encode cache. None disables caching, () marks a
+        constant frame.
+        """
+        return () if self.CONSTANT_FRAME else None
 
     @abstractmethod
     def encode(self) -> OpenProtocolRawMessage:
         """Encode the MID into an OpenProtocolMessage."""
         pass
 
+    def encode_into(self, buf: bytearray | memoryview, offset: int = 0) -> int:
+        """Write the frame of the MID into `buf`, returns the offset after it."""
+        return self.encode().encode_into(buf, offset)
+
     @classmethod
     @abstractmethod
     def from_message(cls, msg: OpenProtocolRawMessage) -> "OpenProtocolMessage":
@@ -71,34 +124,158 @@ class OpenProtocolMessage(ABC):
         pass
 
 
+Decoder = Callable[[OpenProtocolRawMessage], OpenProtocolMessage]
+
+
 class MidCodec:
+    """
+    Registry of MID classes. Decoding dispatches through a table indexed by
+    MID (4 digits) and then by revision (3 digits) which points directly at
+    the decoder of that revision, so no hashing or revision branches are
+    needed per frame.
+    """
+
     LENGTH_FIELD_SIZE = 4  # first 4 chars = frame length
     FOOTER_FIELD_SIZE = 1
+    MID_SPACE = 10000
+    REVISION_SPACE = 1000
+
+    ENCODE_CACHE_SIZE = 256
 
     _registry: dict[int, Type[OpenProtocolMessage]] = {}
+    _dispatch: list[list[Decoder | None] | None] = [None] * MID_SPACE
+
+    # Encoded frames: constant ones for good, parameterized ones in an LRU
+    _constant_frames: dict[tuple, bytes] = {}
+    _recent_frames: OrderedDict[tuple, bytes] = OrderedDict()
+
+    # ACK of each event MID, from the MID_EVENT of registered EVENT_ACK classes
+    _acks: dict[int, OpenProtocolMessage] = {}
 
     @classmethod
     def register(cls, mid: int, parser_cls: Type[OpenProtocolMessage]):
+        if not 0 <= mid < cls.MID_SPACE:
+            raise ValueError(f"{parser_cls.__name__}: MID out of range {mid}")
+        revisions: list[Decoder | None] = [None] * cls.REVISION_SPACE
+        for revision_range, decoder in parser_cls.decoders():
+            for revision in revision_range:
+                revisions[revision] = decoder
+        if parser_cls.MESSAGE_TYPE == MessageType.EVENT_ACK:
+            event_mid = getattr(parser_cls, "MID_EVENT", None)
+            if event_mid is not None:
+                # ACKs carry no data, one shared instance serves every event
+                cls._acks[event_mid] = parser_cls()  # type: ignore[call-arg]
+            if mid in cls._registry:
+                # Generic ACKs (MID 5) must not take over decoding of their MID
+                return
         cls._registry[mid] = parser_cls
+        cls._dispatch[mid] = revisions
+
+    @classmethod
+    def supported(cls) -> dict[int, list[range]]:
+        """
+        Supported MID/revision matrix: revision ranges of every registered MID,
+        one range per decoder.
+        """
+        matrix: dict[int, list[range]] = {}
+        for mid in sorted(cls._registry):
+            revisions = cls._dispatch[mid]
+            assert revisions is not None
+            ranges: list[range] = []
+            start = 0
+            for revision in range(1, cls.REVISION_SPACE + 1):
+                if (
+                    revision == cls.REVISION_SPACE
+                    or revisions[revision] is not revisions[start]
+                ):
+                    if revisions[start] is not None:
+                        ranges.append(range(start, revision))
+                    start = revision
+            matrix[mid] = ranges
+        return matrix
+
+    @classmethod
+    def supports(cls, mid: int, revision: int) -> bool:
+        return cls._decoder(mid, revision) is not None
+
+    @classmethod
+    def _decoder(cls, mid: int, revision: int) -> Decoder | None:
+        if not (0 <= mid < cls.MID_SPACE and 0 <= revision < cls.REVISION_SPACE):
+            return None
+        revisions = cls._dispatch[mid]
+        return revisions[revision] if revisions is not None else None
+
+    @classmethod
+    def message_class(cls, mid: int) -> Type[OpenProtocolMessage] | None:
+        """Registered class of `mid`, None for unsupported MIDs."""
+        return cls._registry.get(mid)
+
+    @classmethod
+    def peek(cls, raw: bytes) -> FrameHeader:
+        """Header fields of a raw frame, without decoding it."""
+        return OpenProtocolRawMessage.peek_header(raw)
 
     @classmethod
     def decode(cls, raw: bytes) -> OpenProtocolMessage:
         msg = OpenProtocolRawMessage.decode(raw)
+        decoder = cls._decoder(msg.mid, msg.revision)
         try:
-            if msg.mid in cls._registry:
-                return cls._registry[msg.mid].from_message(msg)
+            if decoder is not None:
+                return decoder(msg)
         except NotImplementedError:
             pass
-        raise ValueError(f"Not supported mid {msg.mid}")
+        raise ValueError(f"Not supported mid {msg.mid} revision {msg.revision}")
 
     @classmethod
     def encode(cls, mid_obj: OpenProtocolMessage) -> bytes:
-        msg = mid_obj.encode()
-        return msg.encode()
+        frame_key = mid_obj.frame_key()
+        if frame_key is None:
+            return mid_obj.encode().encode()
+
+        key = (type(mid_obj), mid_obj.REVISION, frame_key)
+        if frame_key == ():
+            frame = cls._constant_frames.get(key)
+            if frame is None:
+                frame = cls._constant_frames[key] = mid_obj.encode().encode()
+            return frame
+
+        recent = cls._recent_frames
+        frame = recent.get(key)
+        if frame is not None:
+            recent.move_to_end(key)
+            return frame
+        frame = recent[key] = mid_obj.encode().encode()
+        if len(recent) > cls.ENCODE_CACHE_SIZE:
+            recent.popitem(last=False)
+        return frame
+
+    @classmethod
+    def encode_into(
+        cls, mid_obj: OpenProtocolMessage, buf: bytearray | memoryview, offset: int
+    ) -> int:
+        """
+        Write the frame of `mid_obj` into `buf` at `offset` and return the
+        offset after it. Cached frames are copied as they are, others are
+        formatted into a temporary frame which is copied and not kept.
+        """
+        if mid_obj.frame_key() is None:
+            return mid_obj.encode_into(buf, offset)
+        if offset > len(buf):
+            raise ValueError(f"Offset {offset} beyond buffer end {len(buf)}")
+        frame = cls.encode(mid_obj)
+        end = offset + len(frame)
+        buf[offset:end] = frame
+        return end
+
+    @classmethod
+    def clear_encode_cache(cls) -> None:
+        cls._constant_frames.clear()
+        cls._recent_frames.clear()
 
     @classmethod
-    def get_ack(cls, msg: OpenProtocolMessage) -> OpenProtocolMessage | None:
-        return None
+    def get_ack(cls, mid: int) -> OpenProtocolMessage | None:
+        """ACK to send for a received event `mid`, None if it has none."""
+        return cls._acks.get(mid)
 
 
 def register_messages(*message_classes: type[OpenProtocolMessage]) -> None:
@@ -1,3 +1,5 @@
 from .async_tcp import AsyncTcpClient
+from .base import BaseTransport
+from .buffered_tcp import BufferedTcpClient
 
-__all__ = ["AsyncTcpClient"]
+__all__ = ["AsyncTcpClient", "BaseTransport", "BufferedTcpClient"]
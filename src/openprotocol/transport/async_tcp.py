@@ -1,16 +1,26 @@
 import asyncio
+from collections.abc import Sequence
+
 from openprotocol.core.mid_base import MidCodec
 from openprotocol.transport.base import BaseTransport
 
 
 class AsyncTcpClient(BaseTransport):
-    """TCP client for Open Protocol transport layer (raw frames)."""
+    """
+    TCP client for Open Protocol transport layer (raw frames).
+
+    Writes are not drained one by one, send() and send_many() wait only while
+    the socket buffer is above `write_high_water` bytes. Reads have no timeout
+    unless one is passed, stalled frames show in partial_frame_since.
+    """
 
-    def __init__(self, host: str, port: int):
+    def __init__(self, host: str, port: int, write_high_water: int = 64 * 1024):
         self.host = host
         self.port = port
+        self.write_high_water = write_high_water
         self.reader: asyncio.StreamReader | None = None
         self.writer: asyncio.StreamWriter | None = None
+        self._partial_since: float | None = None
 
     async def connect(self, timeout: float = 5.0):
         """Establish TCP connection with timeout."""
@@ -27,26 +37,33 @@ class AsyncTcpClient(BaseTransport):
 
         if self.reader is None or self.writer is None:
             raise ConnectionError(f"Connection failed to {self.host}:{self.port}")
+        self.writer.transport.set_write_buffer_limits(high=self.write_high_water)
 
     def _ensure_connected(self):
         if not self.reader or not self.writer:
             raise ConnectionError("The client is not connected")
 
-    async def _read_frame(self, timeout: float) -> bytes:
+    @property
+    def partial_frame_since(self) -> float | None:
+        return self._partial_since
+
+    async def _read_frame(self) -> bytes:
         """Read one full Open Protocol frame."""
         assert self.reader is not None
         assert self.writer is not None
 
-        length_bytes = await asyncio.wait_for(
-            self.reader.readexactly(MidCodec.LENGTH_FIELD_SIZE), timeout
+        # A frame counts as started with its first byte, a peer may also stall
+        # within the length field
+        first = await self.reader.readexactly(1)
+        self._partial_since = asyncio.get_running_loop().time()
+        length_bytes = first + await self.reader.readexactly(
+            MidCodec.LENGTH_FIELD_SIZE - 1
         )
         frame_length = int(length_bytes.decode("ascii"))
-        remaining = await asyncio.wait_for(
-            self.reader.readexactly(
-                frame_length + MidCodec.FOOTER_FIELD_SIZE - MidCodec.LENGTH_FIELD_SIZE
-            ),
-            timeout,
+        remaining = await self.reader.readexactly(
+            frame_length + MidCodec.FOOTER_FIELD_SIZE - MidCodec.LENGTH_FIELD_SIZE
         )
+        self._partial_since = None
         return length_bytes + remaining
 
     async def send_receive(self, data: bytes, timeout: float = 5.0) -> bytes:
@@ -54,17 +71,32 @@ class AsyncTcpClient(BaseTransport):
         await self.send(data)
         return await self.receive(timeout)
 
-    async def send(self, data: bytes):
-        assert self.writer is not None
+    async def send(self, data: bytes | bytearray | memoryview):
         """Send a frame without waiting for a response."""
         self._ensure_connected()
+        assert self.writer is not None
         self.writer.write(data)
-        await self.writer.drain()
+        await self._drain()
+
+    async def send_many(self, frames: Sequence[bytes]):
+        """Send several frames in one write."""
+        self._ensure_connected()
+        assert self.writer is not None
+        self.writer.writelines(frames)
+        await self._drain()
+
+    async def _drain(self):
+        assert self.writer is not None
+        if self.writer.transport.get_write_buffer_size() > self.write_high_water:
+            await self.writer.drain()
 
-    async def receive(self, timeout: float = 5.0) -> bytes:
-        """Receive a full frame."""
+    async def receive(self, timeout: float | None = None) -> bytes:
+        """Receive a full frame, waits at most `timeout` seconds if given."""
         self._ensure_connected()
-        return await self._read_frame(timeout)
+        if timeout is None:
+            return await self._read_frame()
+        async with asyncio.timeout(timeout):
+            return await self._read_frame()
 
     async def close(self):
         if self.writer:
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 
 
 class BaseTransport(ABC):
@@ -11,13 +12,26 @@ class BaseTransport(ABC):
         pass
 
     @abstractmethod
-    async def send(self, data: bytes):
+    async def send(self, data: bytes | bytearray | memoryview):
         pass
 
+    async def send_many(self, frames: Sequence[bytes]):
+        """Send several frames in one write."""
+        await self.send(b"".join(frames))
+
     @abstractmethod
-    async def receive(self) -> bytes:
+    async def receive(self, timeout: float | None = None) -> bytes:
         pass
 
+    @property
+    def partial_frame_since(self) -> float | None:
+        """
+        Loop time since which a started frame waits for the rest of its bytes,
+        None between frames. Lets a deadline check find stalled frames while
+        reads run without a timeout.
+        """
+        return None
+
     @abstractmethod
     async def close(self):
         pass
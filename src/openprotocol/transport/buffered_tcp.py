@@ -0,0 +1,210 @@
+import asyncio
+from collections import deque
+from collections.abc import Sequence
+
+from openprotocol.core.framing import FrameSplitter
+from openprotocol.transport.base import BaseTransport
+
+
+class BufferedTcpClient(BaseTransport, asyncio.BufferedProtocol):
+    """
+    TCP client for Open Protocol transport layer built on asyncio.BufferedProtocol.
+
+    The event loop reads straight into a reusable receive buffer, complete frames
+    are split there and queued. receive() returns a queued frame without
+    suspending and arms a timer only when it has to wait for data and a
+    timeout is given. send() and send_many() write without draining unless
+    the socket buffer is above `write_high_water` bytes. Reading pauses while
+    `max_queued_frames` frames wait for receive() and resumes at half of it.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        write_high_water: int = 64 * 1024,
+        max_queued_frames: int = 1024,
+    ):
+        self.host = host
+        self.port = port
+        self.write_high_water = write_high_water
+        self.max_queued_frames = max_queued_frames
+        self._transport: asyncio.Transport | None = None
+        self._splitter = FrameSplitter()
+        self._frames: deque[bytes] = deque()
+        self._waiter: asyncio.Future | None = None
+        self._drain_waiter: asyncio.Future | None = None
+        self._paused = False
+        self._reading_paused = False
+        self._closed: asyncio.Future | None = None
+        self._exc: Exception | None = None
+        self._partial_since: float | None = None
+
+    async def connect(self, timeout: float = 5.0):
+        """Establish TCP connection with timeout."""
+        loop = asyncio.get_running_loop()
+        self._closed = loop.create_future()
+        self._exc = None
+        self._frames.clear()
+        self._splitter.clear()
+        self._reset_flow_control()
+        try:
+            await asyncio.wait_for(
+                loop.create_connection(lambda: self, self.host, self.port),
+                timeout=timeout,
+            )
+        except asyncio.TimeoutError:
+            self._closed = None
+            raise ConnectionError(
+                f"Cannot connect to {self.host}:{self.port} (timeout)"
+            )
+        except Exception as e:
+            self._closed = None
+            raise ConnectionError(f"Cannot connect to {self.host}:{self.port}: {e}")
+
+    def _ensure_connected(self):
+        if self._transport is None or self._transport.is_closing():
+            raise self._exc or ConnectionError("The client is not connected")
+
+    # asyncio.BufferedProtocol callbacks
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        assert isinstance(transport, asyncio.Transport)
+        self._transport = transport
+        transport.set_write_buffer_limits(high=self.write_high_water)
+
+    def get_buffer(self, sizehint: int) -> memoryview:
+        return self._splitter.get_buffer(sizehint)
+
+    def buffer_updated(self, nbytes: int) -> None:
+        try:
+            frames = self._splitter.buffer_updated(nbytes)
+        except ValueError as e:
+            # Framing is lost, nothing after this point can be trusted
+            self._exc = ConnectionError(f"Invalid data received: {e}")
+            assert self._transport is not None
+            self._transport.abort()
+            return
+
+        if not self._splitter.pending:
+            self._partial_since = None
+        elif frames or self._partial_since is None:
+            # Rest of a new frame
+            self._partial_since = asyncio.get_running_loop().time()
+
+        if frames:
+            self._frames.extend(frames)
+            self._wakeup(self._waiter)
+            if len(self._frames) >= self.max_queued_frames and self._transport:
+                # The reader lags, leave the rest in the socket buffer
+                self._reading_paused = True
+                self._transport.pause_reading()
+
+    def eof_received(self) -> bool | None:
+        return False
+
+    def connection_lost(self, exc: Exception | None) -> None:
+        if self._exc is None:
+            self._exc = ConnectionError(f"Connection closed by remote: {exc}")
+        self._transport = None
+        self._wakeup(self._waiter)
+        # A link lost while writing is paused must not block the next one
+        if self._drain_waiter is not None and not self._drain_waiter.done():
+            self._drain_waiter.set_exception(self._exc)
+        self._reset_flow_control()
+        if self._closed and not self._closed.done():
+            self._closed.set_result(None)
+
+    def pause_writing(self) -> None:
+        self._paused = True
+
+    def resume_writing(self) -> None:
+        self._paused = False
+        self._wakeup(self._drain_waiter)
+
+    def _reset_flow_control(self) -> None:
+        self._paused = False
+        self._reading_paused = False
+        self._drain_waiter = None
+
+    @staticmethod
+    def _wakeup(waiter: asyncio.Future | None) -> None:
+        if waiter is not None and not waiter.done():
+            waiter.set_result(None)
+
+    # BaseTransport
+
+    async def send_receive(self, data: bytes, timeout: float = 5.0) -> bytes:
+        """Send a frame and wait for a full response."""
+        await self.send(data)
+        return await self.receive(timeout)
+
+    async def send(self, data: bytes | bytearray | memoryview):
+        """Send a frame without waiting for a response."""
+        self._ensure_connected()
+        assert self._transport is not None
+        self._transport.write(data)
+        await self._drain()
+
+    async def send_many(self, frames: Sequence[bytes]):
+        """Send several frames in one write."""
+        self._ensure_connected()
+        assert self._transport is not None
+        self._transport.writelines(frames)
+        await self._drain()
+
+    async def _drain(self):
+        if self._paused:
+            self._drain_waiter = waiter = asyncio.get_running_loop().create_future()
+            try:
+                await waiter
+            finally:
+                if self._drain_waiter is waiter:
+                    self._drain_waiter = None
+            self._ensure_connected()
+
+    @property
+    def partial_frame_since(self) -> float | None:
+        return self._partial_since
+
+    def _pop_frame(self) -> bytes:
+        frame = self._frames.popleft()
+        if self._reading_paused and len(self._frames) <= self.max_queued_frames // 2:
+            self._reading_paused = False
+            if self._transport is not None:
+                self._transport.resume_reading()
+        return frame
+
+    async def receive(self, timeout: float | None = None) -> bytes:
+        """Receive a full frame."""
+        if self._frames:
+            return self._pop_frame()
+        self._ensure_connected()
+
+        loop = asyncio.get_running_loop()
+        self._waiter = waiter = loop.create_future()
+        timer = None
+        if timeout is not None:
+            timer = loop.call_later(timeout, self._timeout_waiter, waiter)
+        try:
+            await waiter
+        finally:
+            self._waiter = None
+            if timer is not None:
+                timer.cancel()
+
+        if self._frames:
+            return self._pop_frame()
+        self._ensure_connected()
+        raise ConnectionError("No frame received")
+
+    @staticmethod
+    def _timeout_waiter(waiter: asyncio.Future) -> None:
+        if not waiter.done():
+            waiter.set_exception(asyncio.TimeoutError())
+
+    async def close(self):
+        if self._transport is not None:
+            self._transport.close()
+        if self._closed is not None:
+            await self._closed
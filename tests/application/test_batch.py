@@ -0,0 +1,66 @@
+import pytest
+
+from openprotocol.application.tightening import LastTighteningResultData
+from openprotocol.core.message import OpenProtocolRawMessage
+from tests.application.test_tightening import RAW_REV5
+
+np = pytest.importorskip("numpy")
+
+
+def make_frame(pset: int, torque: str, pset_name: str) -> bytes:
+    frame = bytearray(RAW_REV5)
+    frame[92:95] = str(pset).zfill(3).encode()
+    frame[183:189] = torque.encode()
+    frame[387:412] = pset_name.ljust(25).encode()
+    return bytes(frame)
+
+
+def test_decode_batch_matches_from_message():
+    frames = [
+        make_frame(1, "001234", "Pset A"),
+        make_frame(2, "000050", "Pset B"),
+        make_frame(1, "  1000", "Pset A"),
+    ]
+    batch = LastTighteningResultData.decode_batch(frames)
+
+    assert len(batch) == 3
+    assert batch.mid == 61
+    assert batch.revision == 5
+    assert batch["pset_number"].tolist() == [1, 2, 1]
+    assert batch["torque"].dtype == np.float64
+    assert batch.categories["pset_name"] == ["Pset A", "Pset B"]
+    assert batch["pset_name"].tolist() == [0, 1, 0]
+
+    for i, frame in enumerate(frames):
+        data = LastTighteningResultData.from_message(
+            OpenProtocolRawMessage.decode(frame)
+        )
+        assert batch["torque"][i] == data.torque
+        assert batch["angle"][i] == data.angle
+        assert batch["tightening_status"][i] == data.tightening_status
+        assert batch.values("pset_name")[i] == data.pset_name
+        assert batch.values("tool_serial_number")[i] == data.tool_serial_number
+        assert batch.values("torque_value_unit")[i] == data.torque_value_unit
+
+
+def test_decode_batch_rejects_mixed_frames():
+    short = RAW_REV5[:-10] + b"\x00"
+    with pytest.raises(ValueError):
+        LastTighteningResultData.decode_batch([RAW_REV5, short])
+
+    other_revision = bytearray(RAW_REV5)
+    other_revision[8:11] = b"004"
+    with pytest.raises(ValueError):
+        LastTighteningResultData.decode_batch([RAW_REV5, bytes(other_revision)])
+
+
+def test_decode_batch_validates_markers():
+    frame = bytearray(RAW_REV5)
+    frame[118:120] = b"99"
+    with pytest.raises(ValueError):
+        LastTighteningResultData.decode_batch([RAW_REV5, bytes(frame)])
+
+
+def test_decode_batch_invalid_number():
+    with pytest.raises(ValueError):
+        LastTighteningResultData.decode_batch([make_frame(1, "00x234", "Pset A")])
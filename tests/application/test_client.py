@@ -9,8 +9,18 @@ from openprotocol.application.base_messages import (
     CommunicationNegativeAck,
     OpenProtocolEventUnsubscribe,
 )
-from openprotocol.application.communication import CommunicationStartAcknowledge
+from openprotocol.application.communication import (
+    CommunicationStartAcknowledge,
+    KeepAliveMessage,
+)
 from openprotocol.application.client import OpenProtocolClient
+from openprotocol.application.event_queue import EventQueue, OverflowPolicy
+from openprotocol.application.keepalive import KeepaliveScheduler
+from openprotocol.application.connection import AckMode
+from openprotocol.application.tightening import (
+    LastTighteningResultData,
+    LastTighteningResultDataACK,
+)
 from openprotocol.core.message import OpenProtocolRawMessage
 from openprotocol.core.mid_base import (
     OpenProtocolMessage,
@@ -18,10 +28,11 @@ from openprotocol.core.mid_base import (
     MessageType,
     register_messages,
 )
+from tests.application.test_tightening import RAW_REV5
 
 
 class DummyMessageRecv(OpenProtocolMessage):
-    MID = 9999
+    MID = 8999
     REVISION = 1
     MESSAGE_TYPE = MessageType.REQ_REPLY_MESSAGE
 
@@ -38,7 +49,7 @@ class DummyMessageRecv(OpenProtocolMessage):
 
 
 class DummyMessageNoResp(OpenProtocolMessage):
-    MID = 9997
+    MID = 8997
     REVISION = 1
     MESSAGE_TYPE = MessageType.REQ_MESSAGE
     expected_response_mids = set([])
@@ -56,7 +67,7 @@ class DummyMessageNoResp(OpenProtocolMessage):
 
 
 class DummyMessageSend(OpenProtocolMessage):
-    MID = 9998
+    MID = 8998
     REVISION = 1
     MESSAGE_TYPE = MessageType.REQ_MESSAGE
     expected_response_mids = {DummyMessageRecv.MID}
@@ -74,7 +85,7 @@ class DummyMessageSend(OpenProtocolMessage):
 
 
 class DummyMessageSendRes(OpenProtocolMessage):
-    MID = 9998
+    MID = 8998
     REVISION = 1
     MESSAGE_TYPE = MessageType.REQ_MESSAGE
     expected_response_mids = {1234}
@@ -94,6 +105,11 @@ class DummyMessageSendRes(OpenProtocolMessage):
 register_messages(DummyMessageRecv, DummyMessageSendRes)
 
 
+async def deliver(client: OpenProtocolClient, mid_obj: OpenProtocolMessage) -> None:
+    """Pass a decoded message through the client as if it was received."""
+    await client._process(client._connection.receive_message(mid_obj))
+
+
 @pytest.mark.asyncio
 async def test_connect_starts_client(monkeypatch):
     # Arrange
@@ -111,10 +127,7 @@ async def test_connect_starts_client(monkeypatch):
     async def fake_send(_):
         # Simulate that listener loop sets result a bit later
         await asyncio.sleep(0.01)
-        if client._pending_future:
-            client._pending_future.set_result(
-                CommunicationStartAcknowledge(1, 1, 1, "test", "test1")
-            )
+        await deliver(client, CommunicationStartAcknowledge(1, 1, 1, "test", "test1"))
 
     mock_transport.send.side_effect = fake_send
 
@@ -147,8 +160,7 @@ async def test_send_receive_sets_future_result():
     async def fake_send(_):
         # Simulate that listener loop sets result a bit later
         await asyncio.sleep(0.01)
-        if client._pending_future:
-            client._pending_future.set_result(DummyMessageRecv("world"))
+        await deliver(client, DummyMessageRecv("world"))
 
     mock_transport.send.side_effect = fake_send
 
@@ -158,6 +170,253 @@ async def test_send_receive_sets_future_result():
     mock_transport.send.assert_called_once()
 
 
+@pytest.mark.asyncio
+async def test_send_receive_pipelined_requests():
+    mock_transport = AsyncMock()
+    client = OpenProtocolClient(mock_transport, max_in_flight=2)
+    client._running = True
+    client._startup_done = True
+
+    written = []
+
+    async def fake_send(data):
+        # The buffer is reused after the write
+        written.append(bytes(data))
+
+    mock_transport.send.side_effect = fake_send
+
+    first = asyncio.create_task(client.send_receive(DummyMessageSend("first")))
+    second = asyncio.create_task(client.send_receive(DummyMessageSend("second")))
+    await asyncio.sleep(0.01)
+
+    # Both requests are on the wire, in one write, before any reply arrives
+    assert written == [
+        MidCodec.encode(DummyMessageSend("first"))
+        + MidCodec.encode(DummyMessageSend("second"))
+    ]
+    assert client._connection.pending_requests == 2
+
+    await deliver(client, DummyMessageRecv("one"))
+    await deliver(client, DummyMessageRecv("two"))
+
+    assert (await first).payload == "one"
+    assert (await second).payload == "two"
+
+
+@pytest.mark.asyncio
+async def test_send_receive_in_flight_window():
+    mock_transport = AsyncMock()
+    client = OpenProtocolClient(mock_transport)
+    client._running = True
+    client._startup_done = True
+
+    first = asyncio.create_task(client.send_receive(DummyMessageSend("first")))
+    second = asyncio.create_task(client.send_receive(DummyMessageSend("second")))
+    await asyncio.sleep(0.01)
+
+    # Default window keeps a single request in flight
+    assert mock_transport.send.await_count == 1
+
+    await deliver(client, DummyMessageRecv("one"))
+    assert (await first).payload == "one"
+    await asyncio.sleep(0.01)
+    assert mock_transport.send.await_count == 2
+
+    await deliver(client, DummyMessageRecv("two"))
+    assert (await second).payload == "two"
+
+
+@pytest.mark.asyncio
+async def test_send_failure_fails_request():
+    mock_transport = AsyncMock()
+    mock_transport.send.side_effect = ConnectionError("broken pipe")
+    client = OpenProtocolClient(mock_transport)
+    client._running = True
+    client._startup_done = True
+
+    assert await client.send_receive(DummyMessageSend(), timeout=1.0) is None
+    assert client._connection.pending_requests == 0
+
+
+@pytest.mark.asyncio
+async def test_bounded_event_queue_drops():
+    client = OpenProtocolClient(
+        AsyncMock(), event_queue=EventQueue(2, OverflowPolicy.DROP_OLDEST)
+    )
+    client._subscribed_mids.add(LastTighteningResultData.MID)
+
+    events = [
+        LastTighteningResultData.from_message(OpenProtocolRawMessage.decode(RAW_REV5))
+        for _ in range(3)
+    ]
+    for event in events:
+        await deliver(client, event)
+
+    assert client.dropped_events == 1
+    assert client.spilled_events == 0
+    assert await client.get_subscription() is events[1]
+    assert await client.get_subscription() is events[2]
+
+
+def spindle_frame(spindle_id: int) -> bytes:
+    return RAW_REV5[:14] + b"%02d" % spindle_id + RAW_REV5[16:]
+
+
+@pytest.mark.asyncio
+async def test_deferred_acks_written_together():
+    mock_transport = AsyncMock()
+    sent = []
+    mock_transport.send.side_effect = lambda data: sent.append(bytes(data))
+    client = OpenProtocolClient(mock_transport, ack_mode=AckMode.DEFERRED)
+    client._subscribed_mids.add(LastTighteningResultData.MID)
+
+    for _ in range(3):
+        await client._process(client._connection.receive_frame(RAW_REV5))
+    events = await client.get_many(10, 0.01)
+    assert len(events) == 3
+    await asyncio.sleep(0)
+    assert sent == []
+
+    assert client.confirm(*events) == 3
+    await asyncio.sleep(0)
+    assert sent == [LastTighteningResultDataACK().encode().raw * 3]
+
+
+@pytest.mark.asyncio
+async def test_event_streams_route_by_spindle():
+    client = OpenProtocolClient(AsyncMock())
+    client._subscribed_mids.add(LastTighteningResultData.MID)
+    spindle_1 = client.events(LastTighteningResultData, spindle_id=1)
+    all_spindles = client.events(LastTighteningResultData)
+
+    for spindle_id in (1, 2):
+        await client._process(
+            client._connection.receive_frame(spindle_frame(spindle_id))
+        )
+
+    assert len(await spindle_1.get_many(10, 0.01)) == 1
+    assert len(await all_spindles.get_many(10, 0.01)) == 2
+    assert await client.get_many(10, 0.01) == []
+
+    # Without a stream events go back to the subscription queue
+    spindle_1.close()
+    all_spindles.close()
+    await client._process(client._connection.receive_frame(spindle_frame(1)))
+    assert len(await client.get_many(10, 0.01)) == 1
+
+
+@pytest.mark.asyncio
+async def test_event_stream_iteration_ends_on_close():
+    client = OpenProtocolClient(AsyncMock())
+    client._subscribed_mids.add(LastTighteningResultData.MID)
+    received = []
+
+    async def consume():
+        async with client.events(LastTighteningResultData) as stream:
+            async for event in stream:
+                received.append(event)
+
+    consumer = asyncio.create_task(consume())
+    await asyncio.sleep(0)
+    await deliver(
+        client,
+        LastTighteningResultData.from_message(OpenProtocolRawMessage.decode(RAW_REV5)),
+    )
+    client._close_queues()
+    await asyncio.wait_for(consumer, timeout=1.0)
+
+    assert len(received) == 1
+    assert client._streams == {}
+    with pytest.raises(ConnectionError):
+        await client.get_many(10, 0.01)
+
+
+@pytest.mark.asyncio
+async def test_stalled_frame_drops_link():
+    mock_transport = AsyncMock()
+    client = OpenProtocolClient(mock_transport, keepalive_interval=1.0)
+    client._running = True
+    now = asyncio.get_running_loop().time()
+    client._last_sent = client._last_received = now
+
+    mock_transport.partial_frame_since = now - 0.5
+    assert client._keepalive_tick(now) == now + 0.5
+    assert client._keepalive_tick(now + 0.5) is None
+    assert client.dead_links == 1
+
+
+def keepalive_client(**kwargs) -> OpenProtocolClient:
+    mock_transport = AsyncMock()
+    mock_transport.partial_frame_since = None
+    client = OpenProtocolClient(mock_transport, **kwargs)
+    client._running = True
+    return client
+
+
+@pytest.mark.asyncio
+async def test_keepalive_due_within_resolution_sent_early():
+    client = keepalive_client(keepalive_interval=1.0)
+    client._keepalive = KeepaliveScheduler.get()
+    client._keepalive.resolution = 0.3
+    now = asyncio.get_running_loop().time()
+    client._last_sent = client._last_received = now - 0.8
+
+    # Due in 0.2 s, sent by this wakeup rather than one of its own
+    assert client._keepalive_tick(now) == now + 1.0
+    await asyncio.sleep(0)
+    assert client._connection.pending_requests == 1
+
+    client._keepalive.resolution = 0.1
+    other = keepalive_client(keepalive_interval=1.0)
+    other._keepalive = client._keepalive
+    other._last_sent = other._last_received = now - 0.8
+    assert other._keepalive_tick(now) == pytest.approx(now + 0.2)
+    assert other._keepalive_task is None
+    client._stop_keepalive()
+
+
+@pytest.mark.asyncio
+async def test_early_tick_keeps_waiting_link():
+    client = keepalive_client(keepalive_interval=0.1, keepalive_timeout=2.0)
+    now = asyncio.get_running_loop().time()
+    client._last_sent = client._last_received = now - 0.1
+    assert client._keepalive_tick(now) == now + 0.1
+    await asyncio.sleep(0)
+
+    # Unanswered, but not for keepalive_timeout yet
+    sent = client._keepalive_sent
+    assert sent is not None
+    assert client._keepalive_tick(now + 0.1) == sent + 2.0
+    assert client.dead_links == 0
+
+    await client._process(client._connection.receive_message(KeepAliveMessage()))
+    await asyncio.sleep(0)
+    assert client.keepalive_rtt is not None
+    assert client._keepalive_task is not None and client._keepalive_task.done()
+
+    client._keepalive_task = asyncio.create_task(asyncio.sleep(1))
+    assert client._keepalive_tick(sent + 2.0) is None
+    assert client.dead_links == 1
+
+
+@pytest.mark.asyncio
+async def test_keepalive_waits_for_request_slot():
+    client = keepalive_client(keepalive_interval=0.1)
+    now = asyncio.get_running_loop().time()
+    client._last_sent = client._last_received = now - 0.1
+
+    async with client._in_flight:
+        client._keepalive_tick(now)
+        await asyncio.sleep(0)
+        assert client._connection.pending_requests == 0
+        # A slow request holding the slot does not time the keepalive out
+        assert client._keepalive_tick(now + 1.0) == now + 1.1
+        assert client.dead_links == 0
+    await asyncio.sleep(0)
+    assert client._connection.pending_requests == 1
+    client._stop_keepalive()
+
+
 @pytest.mark.asyncio
 async def test_send_receive_no_response():
     mock_transport = AsyncMock()
@@ -182,15 +441,15 @@ async def test_listener_loop_dispatches_reply():
 
     client = OpenProtocolClient(mock_transport)
     client._running = True
-    client._pending_future = asyncio.get_running_loop().create_future()
-    client._pending_expected = {DummyMessageRecv.MID}
+    pending_future = asyncio.get_running_loop().create_future()
+    client._connection.send_request(DummyMessageSend(), pending_future)
 
     task = asyncio.create_task(client._listener_loop())
     await asyncio.sleep(0.1)
 
     # The listener should set the result
-    assert client._pending_future.done()
-    assert isinstance(client._pending_future.result(), DummyMessageRecv)
+    assert pending_future.done()
+    assert isinstance(pending_future.result(), DummyMessageRecv)
 
     task.cancel()
 
@@ -201,22 +460,23 @@ async def test_send_receive_not_expected_mid():
     mock_transport.receive = AsyncMock(
         side_effect=[
             MidCodec.encode(DummyMessageSendRes("OK")),
+            b"00260004001         899801\x00",  # NACK of MID 8998
             asyncio.CancelledError(),  # to break the loop
         ]
     )
 
     client = OpenProtocolClient(mock_transport)
     client._running = True
-    client._pending_future = asyncio.get_running_loop().create_future()
-    client._pending_expected = set(DummyMessageSendRes.expected_response_mids)
+    pending_future = asyncio.get_running_loop().create_future()
+    client._connection.send_request(DummyMessageSendRes(), pending_future)
 
     task = asyncio.create_task(client._listener_loop())
     await asyncio.sleep(0.1)
 
-    # The listener should set the result
-    assert client._pending_future.done()
+    # The stray frame is only reported, the NACK naming the request fails it
+    assert pending_future.done()
     with pytest.raises(ValueError):
-        await client._pending_future.result()
+        await pending_future.result()
 
     task.cancel()
     await asyncio.sleep(0.1)
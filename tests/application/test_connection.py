@@ -0,0 +1,227 @@
+from openprotocol.application.communication import (
+    CommunicationStartAcknowledge,
+    CommunicationStartMessage,
+    KeepAliveMessage,
+)
+from openprotocol.application.connection import (
+    AckMode,
+    ConnectionState,
+    EventReceived,
+    InvalidFrame,
+    OpenProtocolConnection,
+    ReplyReceived,
+    UnexpectedMessage,
+)
+from openprotocol.application.link import LinkLayer
+from openprotocol.application.parameter_set import SelectParameterSet
+from openprotocol.application.tightening import (
+    LastTighteningResultData,
+    LastTighteningResultDataACK,
+    LastTighteningResultDataSubscribe,
+)
+from openprotocol.core.message import OpenProtocolRawMessage
+from tests.application.test_tightening import RAW_REV5
+from tests.integration.controller import (
+    CommunicationPositiveAckController,
+    CommunicationStartAcknowledgeController,
+)
+
+
+def start_ack() -> bytes:
+    return (
+        CommunicationStartAcknowledgeController(1, 1, 1, "Testing", "001").encode().raw
+    )
+
+
+def test_startup_handshake():
+    conn = OpenProtocolConnection()
+    conn.start("start")
+
+    assert conn.state == ConnectionState.STARTING
+    sent = OpenProtocolRawMessage.decode(conn.data_to_send())
+    assert sent.mid == CommunicationStartMessage.MID
+    assert conn.data_to_send() == b""
+
+    (event,) = conn.receive_data(start_ack())
+    assert isinstance(event, ReplyReceived)
+    assert isinstance(event.message, CommunicationStartAcknowledge)
+    assert event.handle == "start"
+    assert conn.state == ConnectionState.ESTABLISHED
+
+
+def test_take_data():
+    conn = OpenProtocolConnection()
+    conn.start("start")
+    conn.send(SelectParameterSet(5))
+
+    assert conn.has_data_to_send
+    data = conn.take_data()
+    first_end = int(data[:4]) + 1
+    assert OpenProtocolRawMessage.decode(data[:first_end]).mid == 1
+    assert OpenProtocolRawMessage.decode(data[first_end:]).mid == 18
+    assert not conn.has_data_to_send
+
+    # Written buffers alternate, unless the transport still references one
+    conn.recycle_data(data)
+    conn.send(SelectParameterSet(6))
+    other = conn.take_data()
+    conn.recycle_data(other)
+    conn.send(SelectParameterSet(7))
+    assert conn.take_data() is data
+
+    view = memoryview(data)
+    conn.recycle_data(data)
+    conn.send(SelectParameterSet(8))
+    assert conn.take_data() is other
+    conn.send(SelectParameterSet(9))
+    assert conn.take_data() is not data
+    view.release()
+
+
+def test_receive_data_split_frames():
+    conn = OpenProtocolConnection()
+    conn.send_request(SelectParameterSet(1), "pset")
+    data = CommunicationPositiveAckController(1, SelectParameterSet.MID).encode().raw
+
+    assert conn.receive_data(data[:7]) == []
+    (event,) = conn.receive_data(data[7:])
+    assert event.handle == "pset"
+    assert conn.pending_requests == 0
+
+
+def test_subscribed_event():
+    conn = OpenProtocolConnection()
+    assert conn.receive_data(RAW_REV5) == []
+
+    conn.subscribed_mids.add(LastTighteningResultData.MID)
+    (event,) = conn.receive_data(RAW_REV5 + RAW_REV5[:10])
+    assert isinstance(event, EventReceived)
+    assert isinstance(event.message, LastTighteningResultData)
+    assert conn.data_to_send() == LastTighteningResultDataACK().encode().raw
+
+
+def test_deferred_event_ack():
+    conn = OpenProtocolConnection(AckMode.DEFERRED)
+    conn.subscribed_mids.add(LastTighteningResultData.MID)
+    first, second = conn.receive_data(RAW_REV5 * 2)
+    assert isinstance(first, EventReceived) and isinstance(second, EventReceived)
+    assert not conn.has_data_to_send
+
+    ack = LastTighteningResultDataACK().encode().raw
+    assert conn.confirm_event(second.message)
+    assert conn.confirm_event(first.message)
+    assert not conn.confirm_event(first.message)
+    assert conn.data_to_send() == ack * 2
+
+    # The controller sends unconfirmed events again after a reconnect
+    (lost,) = conn.receive_data(RAW_REV5)
+    conn.connection_lost()
+    assert isinstance(lost, EventReceived)
+    assert not conn.confirm_event(lost.message)
+
+
+def test_deferred_ack_of_earlier_connection():
+    old = OpenProtocolConnection(AckMode.DEFERRED)
+    old.subscribed_mids.add(LastTighteningResultData.MID)
+    (lost,) = old.receive_data(RAW_REV5)
+    assert isinstance(lost, EventReceived)
+
+    conn = OpenProtocolConnection(AckMode.DEFERRED)
+    conn.subscribed_mids.add(LastTighteningResultData.MID)
+    (pending,) = conn.receive_data(RAW_REV5)
+    assert isinstance(pending, EventReceived)
+
+    # An event of the earlier connection does not ACK the current one
+    assert not conn.confirm_event(lost.message)
+    assert not conn.has_data_to_send
+    assert conn.confirm_event(pending.message)
+    assert conn.data_to_send() == LastTighteningResultDataACK().encode().raw
+
+
+def test_link_level_acknowledgement():
+    conn = OpenProtocolConnection(link=LinkLayer())
+    conn.start("start")
+    conn.send(SelectParameterSet(1))
+    # Stop-and-wait: the second frame waits for the link ACK of the first
+    assert conn.data_to_send()[16:18] == b"01"
+
+    ack = OpenProtocolRawMessage(9997, 1, "0001", seq_no=1).encode()
+    assert conn.receive_frame(ack) == []
+    assert conn.data_to_send()[16:18] == b"02"
+
+    reply = bytearray(start_ack())
+    reply[16:18] = b"05"
+    (event,) = conn.receive_frame(bytes(reply))
+    assert isinstance(event, ReplyReceived)
+    assert conn.data_to_send() == (
+        OpenProtocolRawMessage(9997, 1, "0002", seq_no=5).encode()
+    )
+
+
+def test_events_filtered_before_decode():
+    conn = OpenProtocolConnection()
+    conn.subscribed_mids.add(LastTighteningResultData.MID)
+    conn.header_filters[LastTighteningResultData.MID] = lambda h: h.spindle_id == 3
+
+    spindle_3 = RAW_REV5[:14] + b"03" + RAW_REV5[16:]
+    (event,) = conn.receive_frame(spindle_3)
+    assert isinstance(event, EventReceived)
+
+    # A broken payload shows that frames of other spindles are never decoded
+    broken = RAW_REV5[:20] + b"XX" + RAW_REV5[22:]
+    assert conn.receive_frame(broken) == []
+    (event,) = conn.receive_frame(broken[:14] + b"03" + broken[16:])
+    assert isinstance(event, InvalidFrame)
+
+    conn.subscribed_mids.clear()
+    assert conn.receive_frame(spindle_3[:20] + b"XX" + spindle_3[22:]) == []
+
+
+def test_unexpected_and_invalid_frames():
+    conn = OpenProtocolConnection()
+    conn.send_request(SelectParameterSet(1), "pset")
+
+    # A stray frame is reported without failing an unrelated request
+    (event,) = conn.receive_data(start_ack())
+    assert isinstance(event, UnexpectedMessage)
+    assert event.handle is None
+    assert conn.pending_requests == 1
+
+    (event,) = conn.receive_frame(
+        OpenProtocolRawMessage(mid=8888, revision=1, payload="").encode()
+    )
+    assert isinstance(event, InvalidFrame)
+
+
+def test_stray_nack_does_not_answer_keepalive():
+    assert KeepAliveMessage.expected_response_mids == {KeepAliveMessage.MID}
+
+    conn = OpenProtocolConnection()
+    conn.send_request(KeepAliveMessage(), "keepalive")
+    conn.send_request(LastTighteningResultDataSubscribe(), "subscribe")
+
+    # Late NACK of a parameter set selection given up before
+    (event,) = conn.receive_frame(b"00260004001         001801\x00")
+    assert isinstance(event, UnexpectedMessage)
+    assert event.handle is None
+    assert conn.pending_requests == 2
+
+    (event,) = conn.receive_frame(KeepAliveMessage().encode().raw)
+    assert isinstance(event, ReplyReceived)
+    assert event.handle == "keepalive"
+
+    (event,) = conn.receive_frame(
+        CommunicationPositiveAckController(1, 60).encode().raw
+    )
+    assert event.handle == "subscribe"
+
+
+def test_connection_lost_returns_pending():
+    conn = OpenProtocolConnection()
+    conn.send_request(SelectParameterSet(1), "first")
+    conn.send_request(SelectParameterSet(2), "second")
+    conn.cancel_request("first")
+
+    assert conn.connection_lost() == ["second"]
+    assert conn.state == ConnectionState.CLOSED
+    assert conn.data_to_send() == b""
@@ -0,0 +1,55 @@
+from openprotocol.application.base_messages import (
+    CommunicationNegativeAck,
+    CommunicationPositiveAck,
+)
+from openprotocol.application.correlation import PendingRequests
+from openprotocol.application.parameter_set import SelectParameterSet
+from openprotocol.application.tightening import LastTighteningResultDataSubscribe
+
+
+def test_match_ack_by_acknowledged_mid():
+    pending = PendingRequests()
+    pending.add(SelectParameterSet(1), "pset")
+    pending.add(LastTighteningResultDataSubscribe(), "subscribe")
+
+    ack = CommunicationPositiveAck(1, LastTighteningResultDataSubscribe.MID)
+    assert pending.match(ack) == "subscribe"
+    assert pending.match(CommunicationNegativeAck(1, SelectParameterSet.MID, 1)) == (
+        "pset"
+    )
+    assert len(pending) == 0
+
+
+def test_match_fifo_per_reply_mid():
+    pending = PendingRequests()
+    pending.add(SelectParameterSet(1), "first")
+    pending.add(SelectParameterSet(2), "second")
+
+    ack = CommunicationPositiveAck(1, SelectParameterSet.MID)
+    assert pending.match(ack) == "first"
+    assert pending.match(ack) == "second"
+    assert pending.match(ack) is None
+
+
+def test_late_ack_matches_no_other_request():
+    pending = PendingRequests()
+    pending.add(SelectParameterSet(1), "pset")
+
+    assert pending.match(CommunicationPositiveAck(1, 1234)) is None
+    assert pending.pop_named(CommunicationNegativeAck(1, 1234, 1)) is None
+    assert pending.pop_named(
+        CommunicationNegativeAck(1, SelectParameterSet.MID, 1)
+    ) == ("pset")
+    assert len(pending) == 0
+
+
+def test_discard_and_drain():
+    pending = PendingRequests()
+    pending.add(SelectParameterSet(1), "first")
+    pending.add(SelectParameterSet(2), "second")
+    pending.add(SelectParameterSet(3), "third")
+
+    pending.discard("second")
+    assert pending.pop_oldest() == "first"
+    assert pending.drain() == ["third"]
+    assert pending.pop_oldest() is None
@@ -0,0 +1,137 @@
+import asyncio
+
+import pytest
+
+from openprotocol.application.event_queue import EventQueue, OverflowPolicy
+from openprotocol.application.tightening import (
+    LastTighteningResultData,
+    LazyLastTighteningResultData,
+)
+from openprotocol.core.message import OpenProtocolRawMessage
+from tests.application.test_tightening import RAW_REV5
+
+
+def drain(queue: EventQueue) -> list:
+    items = []
+    while not queue.empty():
+        items.append(queue.get_nowait())
+    return items
+
+
+@pytest.mark.asyncio
+async def test_drop_newest():
+    queue = EventQueue(2, OverflowPolicy.DROP_NEWEST)
+    for i in range(4):
+        await queue.put(i)
+    assert drain(queue) == [0, 1]
+    assert queue.dropped == 2
+
+
+@pytest.mark.asyncio
+async def test_drop_oldest():
+    queue = EventQueue(2, OverflowPolicy.DROP_OLDEST)
+    for i in range(4):
+        await queue.put(i)
+    assert drain(queue) == [2, 3]
+    assert queue.dropped == 2
+
+
+@pytest.mark.asyncio
+async def test_block_until_space():
+    queue = EventQueue(1)
+    await queue.put(0)
+    with pytest.raises(asyncio.QueueFull):
+        queue.put_nowait(1)
+
+    put = asyncio.create_task(queue.put(1))
+    await asyncio.sleep(0.01)
+    assert not put.done()
+
+    assert await queue.get() == 0
+    await asyncio.wait_for(put, timeout=1.0)
+    assert await queue.get() == 1
+    assert queue.dropped == 0
+
+
+@pytest.mark.asyncio
+async def test_spill_keeps_order(tmp_path):
+    queue = EventQueue(2, OverflowPolicy.SPILL, spill_dir=str(tmp_path))
+    for i in range(5):
+        await queue.put(i)
+    assert queue.spilled == 3
+    assert queue.qsize() == 5
+
+    # Space in memory does not overtake events on disk
+    assert queue.get_nowait() == 0
+    await queue.put(5)
+    queue.close()
+    assert drain(queue) == [1, 2, 3, 4, 5, None]
+    assert queue.spilled == 4
+
+
+@pytest.mark.asyncio
+async def test_spill_results(tmp_path):
+    queue = EventQueue(1, OverflowPolicy.SPILL, spill_dir=str(tmp_path))
+    msg = OpenProtocolRawMessage.decode(RAW_REV5)
+    eager = LastTighteningResultData.from_message(msg)
+    lazy = LazyLastTighteningResultData.from_message(msg)
+
+    for event in (eager, eager, lazy):
+        await queue.put(event)
+
+    _, spilled_eager, spilled_lazy = drain(queue)
+    assert isinstance(spilled_lazy, LazyLastTighteningResultData)
+    for name in ("torque", "pset_name", "torque_value_unit"):
+        assert getattr(spilled_eager, name) == getattr(eager, name)
+        assert getattr(spilled_lazy, name) == getattr(eager, name)
+
+
+@pytest.mark.asyncio
+async def test_close_wakes_getter():
+    queue = EventQueue(1)
+    get = asyncio.create_task(queue.get())
+    await asyncio.sleep(0)
+    await queue.put(0)
+    queue.close()
+    assert await get == 0
+    assert await queue.get() is None
+
+
+def test_invalid_bounds():
+    with pytest.raises(ValueError):
+        EventQueue(-1)
+    with pytest.raises(ValueError):
+        EventQueue(0, OverflowPolicy.SPILL)
+
+
+@pytest.mark.asyncio
+async def test_get_many_batches():
+    queue = EventQueue()
+    for i in range(5):
+        await queue.put(i)
+    assert await queue.get_many(3, 1.0) == [0, 1, 2]
+    assert await queue.get_many(3, 0.05) == [3, 4]
+    assert await queue.get_many(3, 0.01) == []
+
+
+@pytest.mark.asyncio
+async def test_get_many_waits_for_late_events():
+    queue = EventQueue()
+
+    async def late_put():
+        await asyncio.sleep(0.02)
+        await queue.put(0)
+
+    asyncio.create_task(late_put())
+    assert await queue.get_many(2, 0.2) == [0]
+
+
+@pytest.mark.asyncio
+async def test_get_many_stops_at_end_marker():
+    queue = EventQueue()
+    await queue.put(0)
+    queue.close()
+    assert await queue.get_many(5, 0.01) == [0]
+    assert queue.closed
+    assert await queue.get_many(5, 0.01) == []
+    assert await queue.get() is None
@@ -0,0 +1,117 @@
+import asyncio
+
+import pytest
+
+from openprotocol.application.event_queue import EventQueue
+from openprotocol.application.fleet import ControllerFleet, Endpoint, TaggedEvent
+from openprotocol.application.reconnect import ReconnectPolicy
+
+
+class StubClient:
+    """Client of the fleet without a connection, failing its first connects."""
+
+    active = 0
+    peak = 0
+
+    def __init__(self, queue: EventQueue, failures: int = 0):
+        self.queue = queue
+        self.failures = failures
+        self.connected = False
+        self.reconnects = 0
+        self.dead_links = 0
+        self.keepalive_rtt = None
+        self.subscribed: list[type] = []
+        self.confirmed: list = []
+
+    async def connect(self):
+        StubClient.active += 1
+        StubClient.peak = max(StubClient.peak, StubClient.active)
+        await asyncio.sleep(0.01)
+        StubClient.active -= 1
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionRefusedError("refused")
+        self.connected = True
+
+    async def subscribe(self, mid_cls, header_filter=None):
+        self.subscribed.append(mid_cls)
+
+    def confirm(self, *events):
+        self.confirmed += events
+        return len(events)
+
+    async def disconnect(self):
+        self.connected = False
+        self.queue.close()
+        return True
+
+
+def stub_fleet(count: int, failures: int = 0, **kwargs) -> ControllerFleet:
+    StubClient.active = StubClient.peak = 0
+    return ControllerFleet(
+        [("10.0.0.1", 4545 + i) for i in range(count)],
+        client_factory=lambda endpoint, queue: StubClient(queue, failures),  # type: ignore[arg-type,return-value]
+        **kwargs,
+    )
+
+
+@pytest.mark.asyncio
+async def test_startup_bounded_and_staggered():
+    fleet = stub_fleet(10, max_parallel=3, stagger=0.002)
+    start = asyncio.get_running_loop().time()
+    assert await fleet.start() == 10
+    assert StubClient.peak <= 3
+    assert asyncio.get_running_loop().time() - start >= 9 * 0.002
+    assert fleet.connected == 10
+    await fleet.stop()
+
+
+@pytest.mark.asyncio
+async def test_failed_startup_retried():
+    fleet = stub_fleet(
+        2, failures=1, reconnect=ReconnectPolicy(initial_delay=0.01, jitter=0)
+    )
+    assert await fleet.start() == 0
+    assert fleet.health()["10.0.0.1:4545"].error is not None
+    await asyncio.sleep(0.05)
+    health = fleet.health()["10.0.0.1:4545"]
+    assert health.connected
+    assert health.error is None
+    await fleet.stop()
+
+
+@pytest.mark.asyncio
+async def test_merged_stream_ends_with_last_controller():
+    fleet = stub_fleet(2)
+    await fleet.start()
+    first, second = fleet.clients.values()
+    await first.queue.put("event")  # type: ignore[attr-defined]
+
+    first.queue.close()  # type: ignore[attr-defined]
+    assert await fleet.get() == TaggedEvent("10.0.0.1:4545", "event")
+    assert await fleet.get_many(10, 0.01) == []
+
+    second.queue.close()  # type: ignore[attr-defined]
+    assert [event async for event in fleet] == []
+    await fleet.stop()
+
+
+@pytest.mark.asyncio
+async def test_confirm_through_controller_clients():
+    fleet = stub_fleet(2)
+    await fleet.start()
+    first, second = fleet.clients.values()
+    await first.queue.put("a")  # type: ignore[attr-defined]
+    await second.queue.put("b")  # type: ignore[attr-defined]
+    await first.queue.put("c")  # type: ignore[attr-defined]
+
+    events = await fleet.get_many(10, 0.01)
+    assert fleet.confirm(*events) == 3
+    assert first.confirmed == ["a", "c"]  # type: ignore[attr-defined]
+    assert second.confirmed == ["b"]  # type: ignore[attr-defined]
+    await fleet.stop()
+
+
+def test_duplicate_endpoint():
+    with pytest.raises(ValueError):
+        ControllerFleet([Endpoint("a", 1), ("a", 1)])
@@ -0,0 +1,53 @@
+import asyncio
+
+import pytest
+
+from openprotocol.application.keepalive import KeepaliveScheduler
+
+
+@pytest.mark.asyncio
+async def test_links_share_wakeups():
+    loop = asyncio.get_running_loop()
+    scheduler = KeepaliveScheduler(loop, resolution=0.05)
+    calls: list[int] = []
+
+    def link(i: int):
+        def tick(now: float) -> float | None:
+            calls.append(i)
+            return None
+
+        return tick
+
+    start = loop.time()
+    for i in range(100):
+        scheduler.add(link(i), start + 0.05 + i * 0.0001)
+    await asyncio.sleep(0.15)
+
+    assert sorted(calls) == list(range(100))
+    assert scheduler.wakeups == 1
+    assert len(scheduler) == 0
+
+
+@pytest.mark.asyncio
+async def test_reschedule_and_discard():
+    loop = asyncio.get_running_loop()
+    scheduler = KeepaliveScheduler(loop, resolution=0.0)
+    ticks: list[float] = []
+
+    def tick(now: float) -> float | None:
+        ticks.append(now)
+        return now + 0.02
+
+    scheduler.add(tick, loop.time() + 0.02)
+    await asyncio.sleep(0.09)
+    scheduler.discard(tick)
+    count = len(ticks)
+    await asyncio.sleep(0.05)
+
+    assert count >= 2
+    assert len(ticks) == count
+
+
+@pytest.mark.asyncio
+async def test_one_scheduler_per_loop():
+    assert KeepaliveScheduler.get() is KeepaliveScheduler.get()
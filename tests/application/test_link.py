@@ -0,0 +1,82 @@
+import pytest
+
+from openprotocol.application.link import LINK_ACK_MID, LINK_NACK_MID, LinkLayer
+from openprotocol.core.message import OpenProtocolRawMessage
+
+
+def frame(mid: int, seq: int | None = None, payload: str = "") -> bytes:
+    return OpenProtocolRawMessage(mid, 1, payload, seq_no=seq).encode()
+
+
+def seq_of(data: bytes) -> int:
+    return int(data[16:18])
+
+
+def test_window_and_acks():
+    link = LinkLayer(window=2)
+    sent = link.send(frame(18, payload="001")) + link.send(frame(18, payload="002"))
+    assert [seq_of(f) for f in sent] == [1, 2]
+    # Beyond the window frames wait for an ACK
+    assert link.send(frame(18, payload="003")) == []
+    assert link.in_flight == 2
+
+    deliver, released = link.receive(frame(LINK_ACK_MID, 2, "0018"))
+    assert not deliver
+    assert [seq_of(f) for f in released] == [3]
+    assert released[0].endswith(b"003\x00")
+
+
+def test_sequence_wraps():
+    link = LinkLayer()
+    for seq in range(1, 101):
+        (sent,) = link.send(frame(18))
+        assert seq_of(sent) == (seq - 1) % 99 + 1
+        link.receive(frame(LINK_ACK_MID, seq_of(sent), "0018"))
+
+
+def test_retransmit_on_timeout_and_nack():
+    link = LinkLayer(max_retransmits=2)
+    (sent,) = link.send(frame(18))
+
+    assert link.poll() == []
+    assert link.poll() == [sent]
+    assert link.receive(frame(LINK_NACK_MID, 1, "00180003")) == (False, [sent])
+    assert link.retransmits == 2
+
+    link.poll()
+    with pytest.raises(ConnectionError):
+        link.poll()
+
+
+def test_received_frames_acked_once():
+    link = LinkLayer()
+    ack = frame(LINK_ACK_MID, 7, "0061")
+    assert link.receive(frame(61, 7)) == (True, [ack])
+    # Retransmission of the peer, whose ACK got lost
+    assert link.receive(frame(61, 7)) == (False, [ack])
+    assert link.duplicates == 1
+    assert link.receive(frame(61, 8))[0]
+
+    # Frames without a sequence number are not link level acknowledged
+    assert link.receive(frame(61)) == (True, [])
+
+
+def test_out_of_order_retransmit_dropped():
+    link = LinkLayer()
+    for seq in (1, 2, 3):
+        assert link.receive(frame(61, seq))[0]
+    # The peer's window of 3 lost the ACK of 1 only
+    assert link.receive(frame(61, 1)) == (False, [frame(LINK_ACK_MID, 1, "0061")])
+    assert link.duplicates == 1
+
+    # Half the sequence space later the number is new again
+    for seq in range(4, 53):
+        assert link.receive(frame(61, seq))[0]
+    assert link.receive(frame(61, 2))[0]
+
+
+def test_window_bounds():
+    with pytest.raises(ValueError):
+        LinkLayer(window=0)
+    with pytest.raises(ValueError):
+        LinkLayer(window=50)
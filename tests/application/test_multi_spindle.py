@@ -0,0 +1,93 @@
+from unittest.mock import AsyncMock
+
+import pytest
+
+from openprotocol.application.client import OpenProtocolClient
+from openprotocol.application.multi_spindle import MultiSpindleResult
+from openprotocol.core.message import OpenProtocolRawMessage
+from openprotocol.core.mid_base import MidCodec
+
+
+def multi_spindle_frame(spindles: list[tuple[int, str, int]]) -> bytes:
+    """MID 101 revision 1 frame, one (spindle, torque, angle) entry per spindle."""
+    payload = (
+        f"01{len(spindles):02}"
+        f"02{'VIN123':<25}"
+        "0301"
+        "04005"
+        "050010"
+        "060003"
+        "071"
+        "08001000"
+        "09002000"
+        "10001500"
+        "1100010"
+        "1200090"
+        "1300045"
+        "142024-01-02:03:04:05"
+        "152024-01-02:03:05:06"
+        "1600042"
+        "171"
+        "18"
+        + "".join(
+            f"{spindle:02}01{1}{1}{torque:>6}{1}{angle:05}"
+            for spindle, torque, angle in spindles
+        )
+    )
+    return OpenProtocolRawMessage(101, 1, payload).encode()
+
+
+SPINDLES = [(1, "001234", 30), (2, "001250", 31), (4, "-00010", 2)]
+
+
+def test_decode_multi_spindle_result():
+    result = MidCodec.decode(multi_spindle_frame(SPINDLES))
+
+    assert isinstance(result, MultiSpindleResult)
+    assert result.spindle_count == 3
+    assert result.vin_number == "VIN123"
+    assert result.pset_number == 5
+    assert result.torque_final_target == 15.0
+    assert result.sync_tightening_id == 42
+    assert len(result.spindles) == 3
+    assert list(result.spindles["spindle"]) == [1, 2, 4]
+    assert list(result.spindles["torque"]) == [12.34, 12.5, -0.1]
+    assert list(result.spindles["angle"]) == [30, 31, 2]
+    assert result.spindle(2)["torque"] == 12.5
+    assert result.spindle_ids() == {1, 2, 4}
+    with pytest.raises(KeyError):
+        result.spindle(3)
+
+
+def test_vectorized_matches_column_parse():
+    np = pytest.importorskip("numpy")
+    frame = multi_spindle_frame(SPINDLES)
+    result = MidCodec.decode(frame)
+    assert isinstance(result.spindles["torque"], np.ndarray)
+
+    group = MultiSpindleResult._SPINDLES_REV1
+    table = group.parse(frame.decode("ascii"), 3)
+    for name, column in table.columns.items():
+        assert list(result.spindles[name]) == list(column)
+
+
+def test_truncated_spindle_block():
+    frame = multi_spindle_frame(SPINDLES)
+    with pytest.raises(ValueError):
+        MidCodec.decode(b"%04d" % (len(frame) - 11) + frame[4:-10])
+
+
+@pytest.mark.asyncio
+async def test_streams_route_by_reported_spindles():
+    client = OpenProtocolClient(AsyncMock())
+    client._subscribed_mids.add(MultiSpindleResult.MID)
+    spindle_2 = client.events(MultiSpindleResult, spindle_id=2)
+    spindle_3 = client.events(MultiSpindleResult, spindle_id=3)
+
+    frame = multi_spindle_frame(SPINDLES)
+    await client._process(client._connection.receive_frame(frame))
+
+    assert len(await spindle_2.get_many(10, 0.01)) == 1
+    assert await spindle_3.get_many(10, 0.01) == []
+    # Taken by a stream, not passed to the subscription queue
+    assert await client.get_many(10, 0.01) == []
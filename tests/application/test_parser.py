@@ -0,0 +1,97 @@
+import pytest
+
+from openprotocol.application.parser import (
+    FieldSpec,
+    ParsePlan,
+    RepeatedGroup,
+    parse_message,
+)
+from openprotocol.core.message import OpenProtocolRawMessage
+
+
+class Target:
+    pass
+
+
+FIELDS = [
+    FieldSpec("second", 25, 28, parser=int),
+    FieldSpec("first", 20, 22, parser=int),
+    FieldSpec(None, 22, 24, parser=str, validator=lambda x: x == "OK"),
+    FieldSpec("name", 28, 36, parser=str.strip, default="none"),
+]
+
+
+def make_message(payload: str) -> OpenProtocolRawMessage:
+    return OpenProtocolRawMessage(mid=61, revision=1, payload=payload)
+
+
+def test_plan_matches_parse_message():
+    msg = make_message("12OK 345 station  ")
+    expected, result = Target(), Target()
+
+    parse_message(msg, expected, FIELDS)
+    ParsePlan(FIELDS).apply(msg, result)
+
+    assert vars(result) == vars(expected)
+    assert vars(result) == {"first": 12, "second": 345, "name": "station"}
+
+
+def test_plan_sorts_fields():
+    plan = ParsePlan(FIELDS)
+    assert [f.start for f in plan.fields] == [20, 22, 25, 28]
+    assert len(plan) == 4
+
+
+def test_plan_usable_prefix():
+    plan = ParsePlan(FIELDS)
+    assert plan.usable_fields(22) == 0
+    assert plan.usable_fields(23) == 1
+    assert plan.usable_fields(36) == 3
+    assert plan.usable_fields(37) == 4
+
+    result = Target()
+    plan.apply(make_message("12OK 345"), result)
+    assert vars(result) == {"first": 12, "second": 345}
+
+
+def test_plan_default_for_empty_field():
+    result = Target()
+    ParsePlan(FIELDS).apply(make_message("12OK 345          "), result)
+    assert result.name == "none"
+
+
+def test_plan_validation_failed():
+    with pytest.raises(ValueError):
+        ParsePlan(FIELDS).apply(make_message("12NO 345 station  "), Target())
+
+
+def test_plan_parse_failed():
+    with pytest.raises(ValueError):
+        ParsePlan(FIELDS).apply(make_message("XXOK 345 station  "), Target())
+
+
+GROUP = RepeatedGroup(
+    "entries",
+    22,
+    5,
+    "count",
+    [FieldSpec("id", 0, 2, parser=int), FieldSpec("value", 2, 5, parser=str.strip)],
+)
+
+
+def test_group_parsed_by_column():
+    raw = make_message("0301abc02 de03fgh").raw_str
+    table = GROUP.parse(raw, 3)
+
+    assert len(table) == 3
+    assert table["id"] == (1, 2, 3)
+    assert table["value"] == ("abc", "de", "fgh")
+    assert table.row(1) == {"id": 2, "value": "de"}
+    with pytest.raises(IndexError):
+        table.row(3)
+
+
+def test_group_beyond_frame():
+    raw = make_message("0301abc02 de").raw_str
+    with pytest.raises(ValueError):
+        GROUP.parse(raw, 3)
@@ -0,0 +1,35 @@
+import itertools
+
+import pytest
+
+from openprotocol.application.reconnect import ReconnectPolicy
+
+
+def test_delays_grow_up_to_max():
+    policy = ReconnectPolicy(initial_delay=1.0, max_delay=5.0, jitter=0.0)
+    assert list(itertools.islice(policy.delays(), 5)) == [1.0, 2.0, 4.0, 5.0, 5.0]
+
+
+def test_delays_jitter():
+    policy = ReconnectPolicy(initial_delay=1.0, max_delay=1.0, jitter=0.5)
+    delays = list(itertools.islice(policy.delays(), 100))
+    assert all(0.5 <= d <= 1.0 for d in delays)
+    assert len(set(delays)) > 1
+
+
+def test_max_attempts():
+    assert len(list(ReconnectPolicy(max_attempts=3).delays())) == 3
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"initial_delay": -1.0},
+        {"initial_delay": 2.0, "max_delay": 1.0},
+        {"multiplier": 0.5},
+        {"jitter": 1.5},
+    ],
+)
+def test_invalid_policy(kwargs):
+    with pytest.raises(ValueError):
+        ReconnectPolicy(**kwargs)
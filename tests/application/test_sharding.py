@@ -0,0 +1,64 @@
+import asyncio
+import os
+import pickle
+
+import pytest
+
+from openprotocol.application.fleet import Endpoint
+from openprotocol.application.sharding import (
+    _HEADER,
+    ShardedFleet,
+    _PipeWriter,
+    assign_shards,
+)
+
+
+def test_assign_shards_round_robin():
+    endpoints = [("10.0.0.1", 4545 + i) for i in range(5)]
+    shards = assign_shards(endpoints, 2)
+    assert [[e.port for e in shard] for shard in shards] == [
+        [4545, 4547, 4549],
+        [4546, 4548],
+    ]
+    # The same input always gives the same assignment
+    assert assign_shards(endpoints, 2) == shards
+
+    with pytest.raises(ValueError):
+        assign_shards(endpoints, 0)
+
+
+def test_shard_of():
+    fleet = ShardedFleet([Endpoint("a", 1, "one"), Endpoint("b", 1, "two")], workers=2)
+    assert fleet.shard_of("two") == 1
+    assert len(fleet) == 2
+    with pytest.raises(KeyError):
+        fleet.shard_of("three")
+
+
+@pytest.mark.asyncio
+async def test_pipe_writer_does_not_block_loop():
+    read_fd, write_fd = os.pipe()
+    os.set_blocking(read_fd, False)
+    writer = _PipeWriter(write_fd)
+    item = ("events", [os.urandom(1 << 20)])
+
+    # More than the pipe holds, the rest waits for the reader
+    writer.send(item)
+    drained = asyncio.create_task(writer.drain())
+    await asyncio.sleep(0.01)
+    assert not drained.done()
+
+    data = bytearray()
+    while not drained.done():
+        try:
+            data += os.read(read_fd, 1 << 16)
+        except BlockingIOError:
+            pass
+        await asyncio.sleep(0)
+    await drained
+    os.close(read_fd)
+    os.close(write_fd)
+
+    (size,) = _HEADER.unpack_from(data)
+    assert len(data) == _HEADER.size + size
+    assert pickle.loads(data[_HEADER.size :]) == item
@@ -1,7 +1,10 @@
 import pytest
 
 from openprotocol.application.base_messages import OpenProtocolEvent
-from openprotocol.application.tightening import LastTighteningResultData
+from openprotocol.application.tightening import (
+    LastTighteningResultData,
+    LazyLastTighteningResultData,
+)
 from openprotocol.core.message import OpenProtocolRawMessage
 from openprotocol.core.mid_base import OpenProtocolMessage
 
@@ -95,3 +98,77 @@ def test_tightening_decode2() -> None:
     assert data.timestamp.startswith("2023-10-09")
     assert data.tool_serial_number == "42250888"
     assert data.torque_value_unit == LastTighteningResultData.TorqueValueUnit.NM
+
+
+RAW_REV5 = (
+    b"050600610051        010000020003STa 6000                 04                         "
+    b"0500000600507180800000090000100000110122130141151161171181191200000000000210007502200750023000000240000002500000260999927000002800000290000030000003100000320003300034000350000003600000037000000380000003900000040000000410000000532420000043000004442250888      "
+    b"452023-05-15:21:35:0546                   47QuickPset 5              481490150                         51                         52                         530000\x00"
+)
+
+FIELDS = [
+    "cell_id",
+    "channel_id",
+    "torque_controller_name",
+    "pset_number",
+    "tightening_status",
+    "torque_status",
+    "angle_status",
+    "torque",
+    "angle",
+    "tool_serial_number",
+    "timestamp",
+    "pset_name",
+    "torque_value_unit",
+]
+
+
+def is_parsed(obj: object, name: str) -> bool:
+    """Check the attribute without triggering __getattr__."""
+    try:
+        object.__getattribute__(obj, name)
+    except AttributeError:
+        return False
+    return True
+
+
+@pytest.mark.parametrize(
+    "raw_msg",
+    [OpenProtocolRawMessage.decode(RAW_REV5), TighteningDevice().encode()],
+)
+def test_lazy_tightening_matches_eager(raw_msg):
+    eager = LastTighteningResultData.from_message(raw_msg)
+    lazy = LazyLastTighteningResultData.from_message(raw_msg)
+
+    assert isinstance(lazy, LastTighteningResultData)
+    assert lazy.REVISION == eager.REVISION
+    for name in FIELDS:
+        assert getattr(lazy, name) == getattr(eager, name), name
+
+
+def test_lazy_tightening_parses_on_first_access():
+    lazy = LazyLastTighteningResultData.from_message(
+        OpenProtocolRawMessage.decode(RAW_REV5)
+    )
+    assert not is_parsed(lazy, "torque")
+
+    assert lazy.torque == 0.0
+    assert is_parsed(lazy, "torque")
+    assert not is_parsed(lazy, "pset_name")
+
+    with pytest.raises(AttributeError):
+        lazy.not_a_field
+
+
+def test_lazy_tightening_validates_markers():
+    raw = bytearray(RAW_REV5)
+    raw[118:120] = b"99"
+    with pytest.raises(ValueError):
+        LazyLastTighteningResultData.from_message(
+            OpenProtocolRawMessage.decode(bytes(raw))
+        )
+
+
+def test_lazy_tightening_notsupported_revision():
+    with pytest.raises(NotImplementedError):
+        LazyLastTighteningResultData.from_message(TighteningDevice(999).encode())
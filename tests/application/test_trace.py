@@ -0,0 +1,109 @@
+import pytest
+
+from openprotocol.application.base_messages import CommunicationPositiveAck
+from openprotocol.application.trace import (
+    TraceCurveData,
+    TraceCurveDataACK,
+    TraceCurveDataSubscribe,
+    TracePlotParameters,
+)
+from openprotocol.core.message import OpenProtocolRawMessage
+from openprotocol.core.mid_base import MidCodec
+
+np = pytest.importorskip("numpy")
+
+
+def data_field(pid: int, data_type: int, value: str, unit: int = 0) -> str:
+    return f"{pid:05}{len(value):03}{data_type:02}{unit:03}0000{value}"
+
+
+def trace_frame(
+    samples: list[int],
+    coefficient: str | None = "0.5",
+    resolutions: tuple[tuple[int, int, str], ...] = ((1, 3, "0.25"),),
+    count: int | None = None,
+) -> bytes:
+    """MID 900 revision 1 frame of a torque trace."""
+    fields = [data_field(2, 4, "ABC")]
+    parameters = [data_field(2213, 3, coefficient)] if coefficient else []
+    ascii_part = (
+        "0000012345"  # result data identifier
+        "2024-01-02:03:04:05"
+        f"{len(fields):03}{''.join(fields)}"
+        "02"  # trace type torque
+        "01"  # transducer type
+        "001"  # unit
+        f"{len(parameters):03}{''.join(parameters)}"
+        f"{len(resolutions):03}"
+        + "".join(
+            f"{first:05}{last:05}{len(value):03}03200{value}"
+            for first, last, value in resolutions
+        )
+        + f"{len(samples) if count is None else count:05}"
+    )
+    body = (
+        b"0900001         "
+        + ascii_part.encode("ascii")
+        + b"\x00"
+        + np.array(samples, dtype=">i2").tobytes()
+    )
+    # Traces beyond one frame are split into parts before they are sent
+    return b"%04d" % min(4 + len(body), 9999) + body + b"\x00"
+
+
+def decode(frame: bytes) -> TraceCurveData:
+    return TraceCurveData.from_message(OpenProtocolRawMessage.decode(frame))
+
+
+def test_decode_samples():
+    trace = decode(trace_frame([10, -4, 0x7FFF, 0]))
+
+    assert trace.result_id == 12345
+    assert trace.timestamp == "2024-01-02:03:04:05"
+    assert trace.trace_type == TraceCurveData.TraceType.TORQUE
+    assert trace.fields[2].value == "ABC"
+    assert trace.parameters[2213].value == 0.5
+    assert trace.samples.dtype == np.float64
+    assert trace.samples.tolist() == [5.0, -2.0, 0x7FFF / 2, 0.0]
+
+
+def test_decode_without_coefficient():
+    trace = decode(trace_frame([1, 2], coefficient=None))
+    assert trace.samples.tolist() == [1.0, 2.0]
+
+
+def test_sample_times():
+    trace = decode(trace_frame([0] * 5, resolutions=((1, 2, "0.5"), (3, 5, "1.0"))))
+    assert trace.sample_times().tolist() == [0.0, 0.5, 1.0, 2.0, 3.0]
+
+
+def test_truncated_trace():
+    frame = trace_frame([1, 2, 3], count=4)
+    with pytest.raises(ValueError):
+        decode(frame)
+    # Decoding errors of received frames surface as ValueError
+    with pytest.raises(ValueError):
+        MidCodec.decode(frame[:40])
+
+
+def test_registered():
+    trace = MidCodec.decode(trace_frame([1]))
+    assert isinstance(trace, TraceCurveData)
+
+    plot = MidCodec.decode(
+        OpenProtocolRawMessage(
+            901, 1, "00000123452024-01-02:03:04:05001" + data_field(30, 3, "12.5")
+        ).encode()
+    )
+    assert isinstance(plot, TracePlotParameters)
+    assert plot.fields[30].value == 12.5
+
+
+def test_subscription_frames():
+    assert TraceCurveDataSubscribe().encode().payload == "090000100"
+
+    ack = MidCodec.get_ack(TraceCurveData.MID)
+    assert isinstance(ack, TraceCurveDataACK)
+    assert ack.encode().raw == b"00240005001         0900\x00"
+    # The generic ACK does not replace decoding of MID 5 replies
+    assert MidCodec.message_class(5) is CommunicationPositiveAck
@@ -0,0 +1,129 @@
+import pytest
+
+from openprotocol.core.framing import (
+    FrameSplitter,
+    FrameWriter,
+    PartReassembler,
+    split_message,
+)
+from openprotocol.core.message import OpenProtocolRawMessage
+from openprotocol.core.mid_base import MessageType, OpenProtocolMessage
+
+
+def make_frame(mid: int, payload: str = "") -> bytes:
+    return OpenProtocolRawMessage(mid=mid, revision=1, payload=payload).encode()
+
+
+def test_split_frames_from_stream():
+    first, second = make_frame(61, "ABCDEF"), make_frame(5, "0018")
+    splitter = FrameSplitter()
+
+    assert splitter.feed(first[:3]) == []
+    assert splitter.feed(first[3:] + second[:10]) == [first]
+    assert splitter.pending == 10
+    assert splitter.feed(second[10:]) == [second]
+    assert splitter.pending == 0
+
+
+def test_split_into_receive_buffer():
+    frames = [make_frame(61, str(i) * 30) for i in range(10)]
+    data = b"".join(frames)
+    splitter = FrameSplitter(size=64)
+
+    received = []
+    for i in range(0, len(data), 7):
+        chunk = data[i : i + 7]
+        buffer = splitter.get_buffer(len(chunk))
+        buffer[: len(chunk)] = chunk
+        received += splitter.buffer_updated(len(chunk))
+    assert received == frames
+
+
+def test_split_invalid_length():
+    with pytest.raises(ValueError):
+        FrameSplitter().feed(b"ABCD0061001")
+    with pytest.raises(ValueError):
+        FrameSplitter().feed(b"0005")
+
+
+def test_split_and_reassemble():
+    payload = "".join(chr(ord("A") + i % 26) for i in range(25000))
+    msg = OpenProtocolRawMessage(mid=901, revision=1, payload=payload, spindle_id=2)
+    parts = split_message(msg)
+    assert len(parts) == 3
+    assert all(len(part) <= 10000 for part in parts)
+    assert [part[18:20] for part in parts] == [b"31", b"32", b"33"]
+
+    reassembler = PartReassembler()
+    assert reassembler.feed(make_frame(5, "0018")) == make_frame(5, "0018")
+    assert reassembler.feed(parts[0]) is None
+    # Parts of another spindle are kept apart
+    other = split_message(
+        OpenProtocolRawMessage(mid=901, revision=1, payload=payload, spindle_id=3)
+    )
+    assert reassembler.feed(other[0]) is None
+    assert reassembler.feed(parts[1]) is None
+    joined = reassembler.feed(parts[2])
+    assert joined is not None
+    assert len(reassembler) == 1
+
+    decoded = OpenProtocolRawMessage.decode(joined)
+    assert decoded.payload == payload
+    assert decoded.spindle_id == 2
+    assert decoded.no_of_mess_parts is None
+
+
+def test_reassembly_limits():
+    msg = OpenProtocolRawMessage(mid=901, revision=1, payload="X" * 20000)
+    parts = split_message(msg)
+
+    reassembler = PartReassembler()
+    with pytest.raises(ValueError):
+        reassembler.feed(parts[1])
+
+    reassembler = PartReassembler(max_size=15000)
+    reassembler.feed(parts[0])
+    with pytest.raises(ValueError):
+        reassembler.feed(parts[1])
+    assert len(reassembler) == 0
+
+    now = [0.0]
+    reassembler = PartReassembler(timeout=1.0, clock=lambda: now[0])
+    reassembler.feed(parts[0])
+    now[0] = 2.0
+    with pytest.raises(ValueError):
+        reassembler.feed(parts[1])
+    assert reassembler.expired == 1
+
+    # Single frames and expire() check them too
+    reassembler.feed(parts[0])
+    now[0] = 4.0
+    assert reassembler.feed(make_frame(9999)) == make_frame(9999)
+    assert len(reassembler) == 0
+    reassembler.feed(parts[0])
+    now[0] = 6.0
+    assert reassembler.expire() == 1
+    assert reassembler.expired == 3
+
+    with pytest.raises(ValueError):
+        split_message(OpenProtocolRawMessage(mid=901, revision=1, payload="X" * 90000))
+
+
+def test_writer_splits_long_messages():
+    class LongMessage(OpenProtocolMessage):
+        MID = 901
+        REVISION = 1
+        MESSAGE_TYPE = MessageType.REQ_MESSAGE
+
+        def encode(self) -> OpenProtocolRawMessage:
+            return self.create_message(self.REVISION, "Y" * 12000)
+
+        @classmethod
+        def from_message(cls, msg: OpenProtocolRawMessage) -> OpenProtocolMessage:
+            raise NotImplementedError()
+
+    writer = FrameWriter()
+    writer.add(LongMessage(1))
+    writer.add_frame(make_frame(5, "0018"))
+    frames = FrameSplitter().feed(writer.take())
+    assert [frame[18:20] for frame in frames] == [b"21", b"22", b"  "]
@@ -1,4 +1,6 @@
-from openprotocol.core.message import OpenProtocolRawMessage
+import pytest
+
+from openprotocol.core.message import FrameHeader, OpenProtocolRawMessage
 
 
 def test_basic_encode_decode():
@@ -6,10 +8,10 @@ def test_basic_encode_decode():
     raw = msg.encode()
     decoded = OpenProtocolRawMessage.decode(raw)
 
-    assert decoded._mid == 61
-    assert decoded._revision == 1
-    assert decoded._payload == "ABCDEF"
-    assert decoded._station_id == 1  # default
+    assert decoded.mid == 61
+    assert decoded.revision == 1
+    assert decoded.payload == "ABCDEF"
+    assert decoded.station_id == 1  # default
 
 
 def test_station_id_default_spaces():
@@ -19,14 +21,14 @@ def test_station_id_default_spaces():
     assert b"  " in raw  # two spaces in header
 
     decoded = OpenProtocolRawMessage.decode(raw)
-    assert decoded._station_id == 1
+    assert decoded.station_id == 1
 
 
 def test_station_id_custom():
     msg = OpenProtocolRawMessage(mid=61, revision=1, payload="PAYLOAD", station_id=5)
     raw = msg.encode()
     decoded = OpenProtocolRawMessage.decode(raw)
-    assert decoded._station_id == 5
+    assert decoded.station_id == 5
 
 
 def test_round_trip_with_all_fields():
@@ -36,9 +38,96 @@ def test_round_trip_with_all_fields():
     raw = msg.encode()
     decoded = OpenProtocolRawMessage.decode(raw)
 
-    assert decoded._mid == 9999
-    assert decoded._revision == 2
-    assert decoded._payload == "HELLO"
-    assert decoded._station_id == 12
-    assert decoded._spindle_id == 3
-    assert decoded._seq_no == 7
+    assert decoded.mid == 9999
+    assert decoded.revision == 2
+    assert decoded.payload == "HELLO"
+    assert decoded.station_id == 12
+    assert decoded.spindle_id == 3
+    assert decoded.seq_no == 7
+
+
+def test_decode_keeps_single_frame_buffer():
+    raw = OpenProtocolRawMessage(
+        mid=61, revision=2, payload="ABCDEF", spindle_id=3
+    ).encode()
+    decoded = OpenProtocolRawMessage.decode(memoryview(bytearray(raw)))
+
+    assert decoded.raw == raw
+    assert decoded.raw_str == raw.decode("ascii")
+    assert decoded._payload is None
+    assert decoded.mid == 61
+    assert decoded.revision == 2
+    assert decoded.spindle_id == 3
+    assert decoded.seq_no is None
+    assert decoded.payload == "ABCDEF"
+    assert decoded[20:23] == "ABC"
+    assert decoded[20] == "A"
+    assert len(decoded) == len(raw)
+
+
+def test_encode_drops_payload_copy():
+    msg = OpenProtocolRawMessage(mid=18, revision=1, payload="003")
+    raw = msg.encode()
+
+    assert msg._payload is None
+    assert msg.payload == "003"
+    assert msg.encode() is raw
+
+
+def test_setitem_updates_frame():
+    msg = OpenProtocolRawMessage(mid=18, revision=1, payload="003")
+    msg[20:23] = "004"
+
+    assert msg.payload == "004"
+    assert msg.mid == 18
+
+
+def test_peek_header():
+    frame = OpenProtocolRawMessage(
+        mid=61, revision=2, payload="010001", station_id=2, spindle_id=3
+    ).encode()
+    assert OpenProtocolRawMessage.peek_header(frame) == FrameHeader(61, 2, 2, 3)
+
+    frame = OpenProtocolRawMessage(mid=5, revision=1, payload="0018").encode()
+    assert OpenProtocolRawMessage.peek_header(frame) == FrameHeader(5, 1, 1, 1)
+
+    with pytest.raises(ValueError):
+        OpenProtocolRawMessage.peek_header(frame[:12])
+
+
+def test_payload_ends_at_length_field():
+    # Frames without the NUL footer keep their last payload byte
+    msg = OpenProtocolRawMessage.decode(b"00240005001         0018")
+    assert msg.payload == "0018"
+    msg = OpenProtocolRawMessage.decode(b"00240005001         0018\x00")
+    assert msg.payload == "0018"
+
+
+def test_peek_header_of_buffer_views():
+    frame = OpenProtocolRawMessage(
+        mid=61, revision=2, payload="010001", station_id=2, spindle_id=3
+    ).encode()
+    buffer = bytearray(b"xx" + frame)
+    view = memoryview(buffer)[2:]
+    assert OpenProtocolRawMessage.peek_header(view) == FrameHeader(61, 2, 2, 3)
+    assert OpenProtocolRawMessage.peek_header(bytearray(frame)) == FrameHeader(
+        61, 2, 2, 3
+    )
+
+
+def test_encode_into_buffer():
+    msg = OpenProtocolRawMessage(mid=61, revision=2, payload="010001", spindle_id=3)
+    frame = OpenProtocolRawMessage(
+        mid=61, revision=2, payload="010001", spindle_id=3
+    ).encode()
+
+    buf = bytearray(b"XX")
+    assert msg.encode_into(buf, 2) == 2 + len(frame)
+    assert buf == b"XX" + frame
+
+    # Fixed size buffers must be large enough
+    view = memoryview(bytearray(len(frame) + 2))
+    assert msg.encode_into(view, 1) == len(frame) + 1
+    assert view[1 : len(frame) + 1] == frame
+    with pytest.raises(ValueError):
+        msg.encode_into(view, 4)
@@ -0,0 +1,99 @@
+import pytest
+
+from openprotocol.application.base_messages import CommunicationPositiveAck
+from openprotocol.application.communication import CommunicationStartMessage
+from openprotocol.application.parameter_set import SelectParameterSet
+from openprotocol.application.tightening import (
+    LastTighteningResultData,
+    LastTighteningResultDataACK,
+    LastTighteningResultDataSubscribe,
+)
+from openprotocol.core.message import OpenProtocolRawMessage
+from openprotocol.core.mid_base import MidCodec
+
+
+def test_revision_class_default():
+    assert SelectParameterSet.REVISION == 1
+    assert LastTighteningResultDataSubscribe.REVISION == 2
+    assert LastTighteningResultData.REVISION is None
+
+
+def test_revision_per_instance():
+    result = LastTighteningResultData(5)
+    assert result.REVISION == 5
+    assert LastTighteningResultData.REVISION is None
+
+    result.REVISION = 3
+    assert result.REVISION == 3
+    assert CommunicationStartMessage().REVISION == 3
+
+
+def test_messages_have_no_instance_dict():
+    raw = OpenProtocolRawMessage(mid=18, revision=1, payload="001")
+    for obj in (
+        raw,
+        OpenProtocolRawMessage.decode(raw.encode()),
+        SelectParameterSet(1),
+        LastTighteningResultData(2),
+    ):
+        assert not hasattr(obj, "__dict__"), type(obj).__name__
+
+
+def test_supported_matrix():
+    matrix = MidCodec.supported()
+    assert matrix[LastTighteningResultData.MID] == [range(1, 2), range(2, 999)]
+    assert matrix[CommunicationPositiveAck.MID] == [range(0, 1000)]
+    assert list(matrix) == sorted(matrix)
+
+    assert MidCodec.supports(61, 998)
+    assert not MidCodec.supports(61, 999)
+    assert not MidCodec.supports(8888, 1)
+
+
+def test_decode_unsupported_revision():
+    frame = OpenProtocolRawMessage(mid=61, revision=999, payload="").encode()
+    with pytest.raises(ValueError):
+        MidCodec.decode(frame)
+
+
+def test_event_ack_from_registry():
+    ack = MidCodec.get_ack(LastTighteningResultData.MID)
+    assert isinstance(ack, LastTighteningResultDataACK)
+    assert MidCodec.get_ack(LastTighteningResultDataACK.MID) is None
+
+
+def test_encode_cache_constant_frames():
+    MidCodec.clear_encode_cache()
+    frame = MidCodec.encode(CommunicationStartMessage())
+    assert frame == CommunicationStartMessage().encode().raw
+    assert MidCodec.encode(CommunicationStartMessage()) is frame
+
+    ack = LastTighteningResultDataACK(1)
+    assert MidCodec.encode(ack) is MidCodec.encode(LastTighteningResultDataACK(1))
+    # The revision is part of the key
+    assert MidCodec.encode(LastTighteningResultDataACK(2)) != MidCodec.encode(ack)
+
+
+def test_encode_cache_parameterized_frames(monkeypatch):
+    monkeypatch.setattr(MidCodec, "ENCODE_CACHE_SIZE", 2)
+    MidCodec.clear_encode_cache()
+
+    first = MidCodec.encode(SelectParameterSet(1))
+    assert first == SelectParameterSet(1).encode().raw
+    assert MidCodec.encode(SelectParameterSet(1)) is first
+    assert MidCodec.encode(SelectParameterSet(2)) != first
+
+    # Least recently used frame is evicted
+    MidCodec.encode(SelectParameterSet(3))
+    assert MidCodec.encode(SelectParameterSet(1)) is not first
+    assert MidCodec.encode(SelectParameterSet(1)) == first
+
+
+def test_encode_into():
+    buf = bytearray()
+    end = MidCodec.encode_into(CommunicationStartMessage(), buf, 0)
+    end = MidCodec.encode_into(LastTighteningResultDataSubscribe(), buf, end)
+    assert end == len(buf)
+    assert buf == MidCodec.encode(CommunicationStartMessage()) + MidCodec.encode(
+        LastTighteningResultDataSubscribe()
+    )
@@ -42,12 +42,27 @@ register_messages(CommunicationStartMessage, CommunicationStopMessage)
 class SimulatedController:
     """Async simulated OpenProtocol controller for integration testing."""
 
-    def __init__(self, host: str = "127.0.0.1", port: int = 9000):
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 9000,
+        response_delay: float = 0.0,
+        verbose: bool = True,
+    ):
+        """
+        :param response_delay: processing time of the controller in seconds, replies
+                are scheduled without blocking the reading of further requests
+        :param verbose: print received frames and connection changes
+        """
         self.host = host
         self.port = port
+        self.response_delay = response_delay
+        self.verbose = verbose
         self._server: Optional[asyncio.AbstractServer] = None
         self._expected: list[tuple[int, int, str]] = []  # (MID, REV, raw_response)
         self._connections: list[tuple[asyncio.StreamReader, asyncio.StreamWriter]] = []
+        # MIDs of all frames received, in order
+        self.received: list[int] = []
         self._set_connection_start_support()
 
     def _set_connection_start_support(self):
@@ -65,16 +80,20 @@ class SimulatedController:
             ).encode(),
         )
 
+    def _log(self, text: str):
+        if self.verbose:
+            print(text)
+
     async def start(self):
         """Start listening server."""
         self._server = await asyncio.start_server(
             self._handle_client, self.host, self.port
         )
-        print(f"Simulated controller listening on {self.host}:{self.port}")
+        self._log(f"Simulated controller listening on {self.host}:{self.port}")
 
     async def stop(self):
         """Stop server and close connections."""
-        for _, writer in self._connections:
+        for _, writer in list(self._connections):
             writer.close()
             await writer.wait_closed()
         self._connections.clear()
@@ -82,7 +101,7 @@ class SimulatedController:
         if self._server:
             self._server.close()
             await self._server.wait_closed()
-            print("Simulated controller stopped.")
+            self._log("Simulated controller stopped.")
 
     def expect(
         self,
@@ -99,9 +118,12 @@ class SimulatedController:
 
     async def push_event(self, event_msg: OpenProtocolMessage):
         """Push event to all connected clients."""
+        await self.push_frame(MidCodec.encode(event_msg))
+
+    async def push_frame(self, raw: bytes):
+        """Push a raw frame to all connected clients."""
         if not self._connections:
             return
-        raw = MidCodec.encode(event_msg)
         for _, writer in self._connections:
             writer.write(raw)
             await writer.drain()
@@ -120,28 +142,37 @@ class SimulatedController:
                     frame_length + 1 - 4
                 )  # 1 (NUL) at the end, 4 HEADER size
                 raw = length_bytes + remaining
+                self.received.append(int(raw[4:8]))
                 try:
                     msg = MidCodec.decode(raw)
                 except ValueError as e:
-                    print(f"Controller: {e}")
+                    self._log(f"Controller: {e}")
                     continue
-                print(f"Controller received MID={msg.MID}")
+                self._log(f"Controller received MID={msg.MID}")
 
                 # Find matching expectation
                 for mid, rev, raw_resp in self._expected:
                     if msg.MID == mid and msg.REVISION == rev:
-                        if raw_resp:
+                        if raw_resp and self.response_delay:
+                            asyncio.get_running_loop().call_later(
+                                self.response_delay,
+                                writer.write,
+                                raw_resp.encode("ascii"),
+                            )
+                        elif raw_resp:
                             writer.write(raw_resp.encode("ascii"))
                             await writer.drain()
                         break
                 else:
-                    print(f"Unexpected MID {msg.MID}, ignoring...")
+                    self._log(f"Unexpected MID {msg.MID}, ignoring...")
 
         except asyncio.IncompleteReadError:
-            print("Client disconnected.")
+            self._log("Client disconnected.")
         except Exception as e:
-            print(f"Controller: {e}")
+            self._log(f"Controller: {e}")
         finally:
-            print("Client closed.")
+            self._log("Client closed.")
+            if (reader, writer) in self._connections:
+                self._connections.remove((reader, writer))
             writer.close()
             await writer.wait_closed()
@@ -4,6 +4,7 @@ import pytest
 
 from openprotocol.application.client import OpenProtocolClient
 from openprotocol.application.parameter_set import SelectParameterSet
+from openprotocol.transport import BufferedTcpClient
 from tests.integration.controller import SimulatedController
 
 
@@ -33,3 +34,20 @@ async def test_client_disconnect_controller():
     await asyncio.sleep(0.2)
     await controller.stop()
     assert not await client.send_receive(SelectParameterSet(3))
+
+
+@pytest.mark.asyncio
+async def test_client_startup_sequence_buffered_transport():
+    controller = SimulatedController(port=9999)
+    await controller.start()
+
+    client = OpenProtocolClient.create(
+        "127.0.0.1", 9999, transport_cls=BufferedTcpClient
+    )
+    await client.connect()
+
+    await asyncio.sleep(0.2)
+
+    res = await client.disconnect()
+    assert res
+    await controller.stop()
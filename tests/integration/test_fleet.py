@@ -0,0 +1,92 @@
+import asyncio
+
+import pytest
+
+from openprotocol.application.communication import KeepAliveMessage
+from openprotocol.application.fleet import ControllerFleet, Endpoint
+from openprotocol.application.keepalive import KeepaliveScheduler
+from openprotocol.application.tightening import (
+    LastTighteningResultData,
+    LastTighteningResultDataSubscribe,
+)
+from openprotocol.core.mid_base import register_messages
+from tests.application.test_tightening import TighteningDevice
+from tests.integration.controller import (
+    CommunicationPositiveAckController,
+    SimulatedController,
+)
+
+register_messages(LastTighteningResultDataSubscribe)
+
+
+@pytest.mark.asyncio
+async def test_fleet_merges_tagged_events():
+    controller = SimulatedController(port=9107, verbose=False)
+    controller.expect(
+        LastTighteningResultDataSubscribe.MID,
+        LastTighteningResultDataSubscribe.REVISION,
+        CommunicationPositiveAckController(
+            1, LastTighteningResultDataSubscribe.MID
+        ).encode(),
+    )
+    await controller.start()
+
+    endpoints = [Endpoint("127.0.0.1", 9107, f"tool-{i}") for i in range(5)]
+    # Nothing listens on this port
+    endpoints.append(Endpoint("127.0.0.1", 9108, "offline"))
+    fleet = ControllerFleet(endpoints, max_parallel=2, stagger=0.001)
+
+    assert await fleet.start() == 5
+    assert await fleet.subscribe(LastTighteningResultDataSubscribe) == 5
+    health = fleet.health()
+    assert not health["offline"].connected
+    assert health["offline"].error is not None
+    assert health["tool-0"].connected
+
+    await controller.push_event(TighteningDevice())
+    events = []
+    while len(events) < 5:
+        events += await asyncio.wait_for(fleet.get_many(100, 0.05), timeout=1.0)
+    assert {e.controller for e in events} == {f"tool-{i}" for i in range(5)}
+    assert all(isinstance(e.message, LastTighteningResultData) for e in events)
+    assert fleet.health()["tool-3"].events == 1
+
+    await fleet.stop()
+    with pytest.raises(ConnectionError):
+        await fleet.get_many(100, 0.01)
+    await controller.stop()
+
+
+@pytest.mark.asyncio
+async def test_fleet_keepalives_share_wakeups():
+    controller = SimulatedController(port=9107, verbose=False)
+    controller.expect(
+        KeepAliveMessage.MID, KeepAliveMessage.REVISION, KeepAliveMessage().encode()
+    )
+    await controller.start()
+
+    # Keepalives of all controllers fall due within 0.18 s of each other
+    fleet = ControllerFleet(
+        [Endpoint("127.0.0.1", 9107, f"tool-{i}") for i in range(10)],
+        stagger=0.018,
+        keepalive_interval=0.1,
+        keepalive_resolution=0.3,
+    )
+    loop_resolution = KeepaliveScheduler.get().resolution
+    assert await fleet.start() == 10
+    scheduler = fleet.keepalive_scheduler
+    assert scheduler is not None
+    start = scheduler.wakeups
+
+    await asyncio.sleep(1.0)
+    health = fleet.health()
+    assert all(
+        h.dead_links == 0 and h.keepalive_rtt is not None for h in health.values()
+    )
+    # About one wakeup per interval for the fleet instead of one per controller
+    assert scheduler.wakeups - start < 25
+    assert KeepaliveScheduler.get().resolution == loop_resolution
+    assert KeepaliveScheduler.get().wakeups == 0
+
+    await fleet.stop()
+    await controller.stop()
@@ -0,0 +1,77 @@
+import asyncio
+
+import pytest
+
+from openprotocol.application.client import OpenProtocolClient
+from openprotocol.application.communication import KeepAliveMessage
+from openprotocol.application.keepalive import KeepaliveScheduler
+from openprotocol.application.reconnect import ReconnectPolicy
+from tests.integration.controller import SimulatedController
+
+
+async def start_controller(port: int, answer_keepalive: bool) -> SimulatedController:
+    controller = SimulatedController(port=port, verbose=False)
+    if answer_keepalive:
+        controller.expect(
+            KeepAliveMessage.MID, KeepAliveMessage.REVISION, KeepAliveMessage().encode()
+        )
+    await controller.start()
+    return controller
+
+
+@pytest.mark.asyncio
+async def test_keepalive_round_trip():
+    controller = await start_controller(9105, answer_keepalive=True)
+    client = OpenProtocolClient.create("127.0.0.1", 9105, keepalive_interval=0.05)
+    await client.connect()
+
+    await asyncio.sleep(0.3)
+    assert client.keepalive_rtt is not None
+    assert 0 <= client.keepalive_rtt < 0.05
+    assert client.dead_links == 0
+
+    await client.disconnect()
+    await controller.stop()
+
+
+@pytest.mark.asyncio
+async def test_dead_link_detected():
+    controller = await start_controller(9105, answer_keepalive=False)
+    client = OpenProtocolClient.create(
+        "127.0.0.1",
+        9105,
+        keepalive_interval=0.05,
+        reconnect=ReconnectPolicy(initial_delay=0.05, max_attempts=1),
+    )
+    await client.connect()
+
+    # The link is dropped and reconnected; without replies it dies again
+    await asyncio.sleep(0.4)
+    assert client.dead_links >= 1
+    assert client.reconnects >= 1
+    assert client.keepalive_rtt is None
+
+    await client.disconnect()
+    await controller.stop()
+
+
+@pytest.mark.asyncio
+async def test_coarse_scheduler_keeps_healthy_links():
+    controller = await start_controller(9105, answer_keepalive=True)
+    KeepaliveScheduler.get().resolution = 0.3
+    clients = []
+    for _ in range(10):
+        client = OpenProtocolClient.create("127.0.0.1", 9105, keepalive_interval=0.1)
+        await client.connect()
+        clients.append(client)
+        await asyncio.sleep(0.018)
+
+    await asyncio.sleep(1.0)
+    assert all(client.dead_links == 0 for client in clients)
+    assert all(client.keepalive_rtt is not None for client in clients)
+    # About one wakeup per interval for all links, not one per link
+    assert KeepaliveScheduler.get().wakeups < 25
+
+    for client in clients:
+        await client.disconnect()
+    await controller.stop()
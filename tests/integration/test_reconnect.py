@@ -0,0 +1,106 @@
+import asyncio
+
+import pytest
+
+from openprotocol.application.client import OpenProtocolClient
+from openprotocol.application.reconnect import ReconnectPolicy
+from openprotocol.application.tightening import (
+    LastTighteningResultData,
+    LastTighteningResultDataSubscribe,
+)
+from tests.integration.controller import (
+    CommunicationPositiveAckController,
+    SimulatedController,
+)
+from tests.integration.test_tightening_flow import TighteningDevice
+
+
+async def start_controller(port: int) -> SimulatedController:
+    controller = SimulatedController(port=port, verbose=False)
+    controller.expect(
+        LastTighteningResultDataSubscribe.MID,
+        LastTighteningResultDataSubscribe.REVISION,
+        CommunicationPositiveAckController(
+            1, LastTighteningResultDataSubscribe.MID
+        ).encode(),
+    )
+    await controller.start()
+    return controller
+
+
+async def wait_for_reconnects(client: OpenProtocolClient, count: int) -> None:
+    while client.reconnects < count:
+        await asyncio.sleep(0.01)
+
+
+@pytest.mark.asyncio
+async def test_reconnect_replays_subscriptions():
+    controller = await start_controller(9104)
+    client = OpenProtocolClient.create(
+        "127.0.0.1",
+        9104,
+        reconnect=ReconnectPolicy(initial_delay=0.05, max_delay=0.2),
+    )
+    await client.connect()
+    await client.subscribe(LastTighteningResultDataSubscribe)
+
+    # Controller reboot
+    await controller.stop()
+    await asyncio.sleep(0.3)
+    controller = await start_controller(9104)
+
+    await asyncio.wait_for(wait_for_reconnects(client, 1), timeout=2.0)
+    assert client.last_reconnect_latency is not None
+    assert client.last_reconnect_latency >= 0.3
+
+    # The subscription is active again and the queue was kept open
+    await asyncio.sleep(0.05)
+    await controller.push_event(TighteningDevice())
+    event = await asyncio.wait_for(client.get_subscription(), timeout=1.0)
+    assert isinstance(event, LastTighteningResultData)
+
+    assert await client.disconnect()
+    await controller.stop()
+    with pytest.raises(ConnectionError):
+        await asyncio.wait_for(client.get_subscription(), timeout=1.0)
+
+
+@pytest.mark.asyncio
+async def test_reconnect_gives_up():
+    controller = await start_controller(9104)
+    client = OpenProtocolClient.create(
+        "127.0.0.1",
+        9104,
+        reconnect=ReconnectPolicy(initial_delay=0.01, max_delay=0.02, max_attempts=3),
+    )
+    await client.connect()
+    await controller.stop()
+
+    with pytest.raises(ConnectionError):
+        await asyncio.wait_for(client.get_subscription(), timeout=2.0)
+    assert client.reconnects == 0
+
+
+@pytest.mark.asyncio
+async def test_disconnect_while_reconnecting():
+    controller = await start_controller(9104)
+    client = OpenProtocolClient.create(
+        "127.0.0.1",
+        9104,
+        reconnect=ReconnectPolicy(initial_delay=10.0, max_delay=10.0),
+    )
+    await client.connect()
+    consumer = asyncio.create_task(client.get_subscription())
+    await controller.stop()
+
+    # The supervisor waits for its first attempt
+    for _ in range(100):
+        if client._reconnect_task is not None:
+            break
+        await asyncio.sleep(0.01)
+    assert client._reconnect_task is not None
+
+    assert await client.disconnect()
+    with pytest.raises(ConnectionError):
+        await asyncio.wait_for(consumer, timeout=1.0)
+    assert client._reconnect_task.done()
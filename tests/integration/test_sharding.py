@@ -0,0 +1,82 @@
+import asyncio
+
+import pytest
+
+from openprotocol.application.fleet import Endpoint
+from openprotocol.application.sharding import ShardedFleet, ShardOptions
+from openprotocol.application.tightening import (
+    LastTighteningResultData,
+    LastTighteningResultDataACK,
+    LastTighteningResultDataSubscribe,
+)
+from openprotocol.core.mid_base import register_messages
+from tests.application.test_tightening import TighteningDevice
+from tests.integration.controller import (
+    CommunicationPositiveAckController,
+    SimulatedController,
+)
+
+register_messages(LastTighteningResultDataSubscribe)
+
+
+async def receive(fleet: ShardedFleet, count: int) -> list:
+    events: list = []
+    while len(events) < count:
+        events += await asyncio.wait_for(fleet.get_many(100, 0.05), timeout=10.0)
+    return events
+
+
+@pytest.mark.asyncio
+async def test_sharded_fleet_restarts_crashed_worker():
+    controller = SimulatedController(port=9109, verbose=False)
+    controller.expect(
+        LastTighteningResultDataSubscribe.MID,
+        LastTighteningResultDataSubscribe.REVISION,
+        CommunicationPositiveAckController(
+            1, LastTighteningResultDataSubscribe.MID
+        ).encode(),
+    )
+    await controller.start()
+
+    endpoints = [Endpoint("127.0.0.1", 9109, f"tool-{i}") for i in range(4)]
+    fleet = ShardedFleet(
+        endpoints,
+        workers=2,
+        options=ShardOptions(
+            subscriptions=(LastTighteningResultDataSubscribe,),
+            metrics_interval=0.05,
+        ),
+        restart_delay=0.05,
+    )
+    assert await fleet.start() == 4
+    assert fleet.shard_of("tool-1") == 1
+
+    await controller.push_event(TighteningDevice())
+    events = await receive(fleet, 4)
+    assert {e.controller for e in events} == {f"tool-{i}" for i in range(4)}
+    assert all(isinstance(e.message, LastTighteningResultData) for e in events)
+    # Workers ACK the events once they are forwarded
+    for _ in range(100):
+        if controller.received.count(LastTighteningResultDataACK.MID) == 4:
+            break
+        await asyncio.sleep(0.01)
+    assert controller.received.count(LastTighteningResultDataACK.MID) == 4
+
+    # The restarted worker connects the controllers of its shard again
+    fleet._processes[1].kill()  # type: ignore[union-attr]
+    while fleet.restarts[1] == 0:
+        await asyncio.sleep(0.05)
+    assert await fleet.wait_ready(1) == 2
+    assert [e.tag for e in fleet.shards[1]] == ["tool-1", "tool-3"]
+
+    await controller.push_event(TighteningDevice())
+    events = await receive(fleet, 4)
+    assert {e.controller for e in events} == {f"tool-{i}" for i in range(4)}
+    await asyncio.sleep(0.1)
+    assert fleet.health()["tool-3"].connected
+
+    await fleet.stop()
+    assert fleet.workers_alive() == [False, False]
+    with pytest.raises(ConnectionError):
+        await fleet.get_many(10, 0.01)
+    await controller.stop()
@@ -0,0 +1,55 @@
+import asyncio
+
+import pytest
+
+from openprotocol.application.client import OpenProtocolClient
+from openprotocol.application.trace import (
+    TraceCurveData,
+    TraceCurveDataSubscribe,
+    TraceCurveDataUnsubscribe,
+)
+from openprotocol.core.framing import split_message
+from openprotocol.core.message import OpenProtocolRawMessage
+from openprotocol.core.mid_base import register_messages
+from tests.application.test_trace import trace_frame
+from tests.integration.controller import (
+    CommunicationPositiveAckController,
+    SimulatedController,
+)
+
+np = pytest.importorskip("numpy")
+
+register_messages(TraceCurveDataSubscribe, TraceCurveDataUnsubscribe)
+
+
+@pytest.mark.asyncio
+async def test_trace_flow():
+    controller = SimulatedController(port=9106, verbose=False)
+    for mid_cls in (TraceCurveDataSubscribe, TraceCurveDataUnsubscribe):
+        controller.expect(
+            mid_cls.MID,
+            mid_cls.REVISION,
+            CommunicationPositiveAckController(1, mid_cls.MID).encode(),
+        )
+    await controller.start()
+
+    client = OpenProtocolClient.create("127.0.0.1", 9106)
+    await client.connect()
+    await client.subscribe(TraceCurveDataSubscribe)
+
+    # 6000 samples need two frames
+    samples = np.arange(-3000, 3000, dtype=np.int16)
+    frame = trace_frame(samples.tolist(), coefficient="0.01")
+    parts = split_message(OpenProtocolRawMessage.decode(frame))
+    assert len(parts) == 2
+    for part in parts:
+        await controller.push_frame(part)
+
+    trace = await asyncio.wait_for(client.get_subscription(), timeout=1.0)
+    assert isinstance(trace, TraceCurveData)
+    assert len(trace.samples) == 6000
+    np.testing.assert_allclose(trace.samples, samples * 0.01)
+
+    await client.unsubscribe(TraceCurveDataUnsubscribe)
+    await client.disconnect()
+    await controller.stop()
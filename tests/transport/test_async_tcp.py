@@ -0,0 +1,68 @@
+import asyncio
+
+import pytest
+
+from openprotocol.transport import AsyncTcpClient
+from tests.transport.test_buffered_tcp import make_frame, start_echo_server
+
+
+@pytest.mark.asyncio
+async def test_send_many_frames():
+    server = await start_echo_server(9103)
+    client = AsyncTcpClient("127.0.0.1", 9103, write_high_water=16)
+    await client.connect()
+
+    frames = [make_frame(62), make_frame(9999), make_frame(18, "001")]
+    await client.send_many(frames)
+    await client.send(make_frame(5, "0018"))
+    assert [await client.receive() for _ in frames] == frames
+    assert await client.receive() == make_frame(5, "0018")
+
+    await client.close()
+    server.close()
+    await server.wait_closed()
+
+
+@pytest.mark.asyncio
+async def test_receive_without_timeout():
+    server = await start_echo_server(9103)
+    client = AsyncTcpClient("127.0.0.1", 9103)
+    await client.connect()
+    frame = make_frame(61, "ABCDEF")
+
+    receive = asyncio.create_task(client.receive())
+    await client.send(frame[:10])
+    await asyncio.sleep(0.05)
+    assert not receive.done()
+    assert client.partial_frame_since is not None
+
+    await client.send(frame[10:])
+    assert await receive == frame
+    assert client.partial_frame_since is None
+    with pytest.raises(TimeoutError):
+        await client.receive(timeout=0.05)
+
+    await client.close()
+    server.close()
+    await server.wait_closed()
+
+
+@pytest.mark.asyncio
+async def test_stall_within_length_field():
+    server = await start_echo_server(9103)
+    client = AsyncTcpClient("127.0.0.1", 9103)
+    await client.connect()
+    frame = make_frame(61, "ABCDEF")
+
+    receive = asyncio.create_task(client.receive())
+    await client.send(frame[:2])
+    await asyncio.sleep(0.05)
+    assert client.partial_frame_since is not None
+
+    await client.send(frame[2:])
+    assert await receive == frame
+    assert client.partial_frame_since is None
+
+    await client.close()
+    server.close()
+    await server.wait_closed()
@@ -0,0 +1,176 @@
+import asyncio
+
+import pytest
+
+from openprotocol.transport import BufferedTcpClient
+from tests.core.test_framing import make_frame
+
+
+async def start_echo_server(port: int) -> asyncio.AbstractServer:
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while data := await reader.read(3):
+                # Echo in small pieces to split frames across reads
+                writer.write(data)
+                await writer.drain()
+        finally:
+            writer.close()
+
+    return await asyncio.start_server(handle, "127.0.0.1", port)
+
+
+@pytest.mark.asyncio
+async def test_send_receive_frames():
+    server = await start_echo_server(9101)
+    client = BufferedTcpClient("127.0.0.1", 9101)
+    await client.connect()
+
+    frames = [make_frame(61, "ABCDEF"), make_frame(5, "0018"), make_frame(9999)]
+    for frame in frames:
+        await client.send(frame)
+    assert [await client.receive() for _ in frames] == frames
+
+    await client.close()
+    server.close()
+    await server.wait_closed()
+
+
+@pytest.mark.asyncio
+async def test_receive_timeout():
+    server = await start_echo_server(9101)
+    client = BufferedTcpClient("127.0.0.1", 9101)
+    await client.connect()
+
+    with pytest.raises(asyncio.TimeoutError):
+        await client.receive(timeout=0.05)
+
+    await client.close()
+    server.close()
+    await server.wait_closed()
+
+
+@pytest.mark.asyncio
+async def test_receive_connection_closed():
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        writer.write(make_frame(61, "LAST"))
+        writer.close()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 9101)
+    client = BufferedTcpClient("127.0.0.1", 9101)
+    await client.connect()
+
+    # Frames received before the close are still delivered
+    assert await client.receive() == make_frame(61, "LAST")
+    with pytest.raises(ConnectionError):
+        await client.receive()
+
+    await client.close()
+    server.close()
+    await server.wait_closed()
+
+
+@pytest.mark.asyncio
+async def test_connect_refused():
+    client = BufferedTcpClient("127.0.0.1", 9102)
+    with pytest.raises(ConnectionError):
+        await client.connect()
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_send_many_frames():
+    server = await start_echo_server(9101)
+    client = BufferedTcpClient("127.0.0.1", 9101, write_high_water=16)
+    await client.connect()
+
+    frames = [make_frame(62), make_frame(9999), make_frame(18, "001")]
+    await client.send_many(frames)
+    assert [await client.receive() for _ in frames] == frames
+
+    await client.close()
+    server.close()
+    await server.wait_closed()
+
+
+@pytest.mark.asyncio
+async def test_partial_frame_since():
+    server = await start_echo_server(9101)
+    client = BufferedTcpClient("127.0.0.1", 9101)
+    await client.connect()
+    frame = make_frame(61, "ABCDEF")
+
+    await client.send(frame[:10])
+    await asyncio.sleep(0.05)
+    assert client.partial_frame_since is not None
+
+    await client.send(frame[10:])
+    assert await client.receive() == frame
+    assert client.partial_frame_since is None
+
+    await client.close()
+    server.close()
+    await server.wait_closed()
+
+
+@pytest.mark.asyncio
+async def test_reconnect_after_loss_while_writing_paused():
+    writers: list[asyncio.StreamWriter] = []
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        writers.append(writer)
+        while data := await reader.read(1024):
+            writer.write(data)
+        writer.close()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 9101)
+    client = BufferedTcpClient("127.0.0.1", 9101)
+    await client.connect()
+
+    # As the loop does while the socket buffer is full
+    client.pause_writing()
+    send = asyncio.create_task(client.send(make_frame(9999)))
+    await asyncio.sleep(0.05)
+    assert not send.done()
+
+    writers[0].transport.abort()
+    with pytest.raises(ConnectionError):
+        await asyncio.wait_for(send, 1.0)
+    await client.close()
+
+    await client.connect()
+    frame = make_frame(61, "ABCDEF")
+    await asyncio.wait_for(client.send(frame), 1.0)
+    assert await client.receive(timeout=1.0) == frame
+
+    await client.close()
+    server.close()
+    await server.wait_closed()
+
+
+@pytest.mark.asyncio
+async def test_reading_paused_while_frames_queued():
+    frames = [make_frame(61, f"{i:06}") for i in range(20)]
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        for frame in frames:
+            writer.write(frame)
+            await writer.drain()
+            await asyncio.sleep(0.001)
+        await reader.read()
+        writer.close()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 9101)
+    client = BufferedTcpClient("127.0.0.1", 9101, max_queued_frames=4)
+    await client.connect()
+
+    await asyncio.sleep(0.1)
+    assert client._transport is not None
+    assert not client._transport.is_reading()
+    assert len(client._frames) < len(frames)
+
+    assert [await client.receive(timeout=1.0) for _ in frames] == frames
+    assert client._transport.is_reading()
+
+    await client.close()
+    server.close()
+    await server.wait_closed()